@@ -4,10 +4,12 @@ from agents.base_agent import BaseAgent
 from agents.literalist import LiteralistAgent
 from agents.contextualist import ContextualistAgent
 from agents.statistician import StatisticianAgent
+from agents.jury import JuryAgent
 
 __all__ = [
     "BaseAgent",
     "LiteralistAgent",
     "ContextualistAgent",
     "StatisticianAgent",
+    "JuryAgent",
 ]
@@ -1,18 +1,344 @@
 """Abstract base class for all fact-checking agents."""
 
+import asyncio
+import functools
 import json
 import re
+import string
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
 
-from openai import OpenAI
-from config import OPENAI_API_KEY
+# The package's JSON codec. json_loads parses bytes as well as str, skipping
+# the text decode, and its JSONDecodeError subclasses json.JSONDecodeError;
+# json_dumps returns bytes, ready to write to a file or a response
+from orjson import dumps as json_dumps, loads as json_loads
+
+try:
+    # httpx's optional HTTP/2 support: concurrent requests share one connection
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient
+from config import (
+    OPENAI_API_KEY,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    HTTP_KEEPALIVE_SECONDS,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_REQUESTS_PER_MINUTE,
+    MAX_TOKENS_PER_MINUTE,
+    REQUEST_TIMEOUT,
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_SIZE,
+)
+from agents.batch_api import run_chat_batch
+from agents.request_pool import RequestPool
+from agents.response_cache import ResponseCache
+
+
+# The SDK's default pool sizes, but idle connections outlive the gaps
+# between debate rounds instead of httpx's 5s default
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=1000, max_keepalive_connections=100, keepalive_expiry=HTTP_KEEPALIVE_SECONDS
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client() -> OpenAI:
+    """Process-wide OpenAI client, so all agents share one connection pool."""
+    return OpenAI(
+        api_key=OPENAI_API_KEY,
+        timeout=REQUEST_TIMEOUT,
+        http_client=DefaultHttpxClient(limits=_HTTP_LIMITS, http2=_HTTP2),
+    )
+
+
+# httpx's async connection pool is bound to the loop that opened it,
+# so agents share one AsyncOpenAI client per event loop
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """AsyncOpenAI client shared by all agents on the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            timeout=REQUEST_TIMEOUT,
+            http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS, http2=_HTTP2),
+        )
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+# Event loop kept per thread for run_blocking(); asyncio.run() would give
+# every call a fresh loop, and with it a fresh async client and connections
+_THREAD_LOOPS = threading.local()
+
+
+def run_blocking(coro):
+    """
+    Run a coroutine to completion on the calling thread's long-lived event loop.
+
+    For blocking wrappers around async debates (e.g. FactCheckCrew.run_debate)
+    that are called repeatedly, such as from the API server's worker
+    threads: every call on a thread reuses its loop's AsyncOpenAI client,
+    so keep-alive connections carry over from one debate to the next.
+    Must not be called from a thread that is already running an event loop.
+    """
+    loop = getattr(_THREAD_LOOPS, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _THREAD_LOOPS.loop = loop
+    return loop.run_until_complete(coro)
+
+
+# Shared by all agents so concurrent juries stay under the account's limits
+_REQUEST_POOL = RequestPool(
+    max_concurrency=MAX_CONCURRENT_REQUESTS,
+    requests_per_minute=MAX_REQUESTS_PER_MINUTE,
+    tokens_per_minute=MAX_TOKENS_PER_MINUTE,
+    breaker_threshold=BREAKER_FAILURE_THRESHOLD,
+    breaker_reset=BREAKER_RESET_SECONDS,
+)
+
+async def pooled_completion(params: dict) -> str:
+    """
+    Send one chat completion through the shared async client and request pool.
+
+    For callers outside BaseAgent (e.g. SingleAgentBaseline) that build their
+    own request body but should share the agents' rate limits and retries.
+
+    Args:
+        params: Chat completion request body, including max_tokens
+
+    Returns:
+        The response's message content
+    """
+    # Rough token estimate: ~4 characters per prompt token plus the completion budget
+    estimated_tokens = sum(len(m["content"]) for m in params["messages"]) // 4 + params["max_tokens"]
+
+    async def request() -> str:
+        response = await _get_async_client().chat.completions.create(**params)
+        return response.choices[0].message.content
+
+    return await _REQUEST_POOL.run(request, estimated_tokens)
+
+
+# Shared worker pool for blocking (sync client) calls; the GIL is released
+# during socket I/O, so agents' requests overlap
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="facttrace-agent"
+)
+
+# Shared by all deterministic agents, so repeated (claim, truth) pairs across
+# debate rounds and re-evaluation sweeps skip the network entirely
+_RESPONSE_CACHE = ResponseCache(maxsize=RESPONSE_CACHE_SIZE, directory=RESPONSE_CACHE_DIR)
+
+
+class _JsonObjectScanner:
+    """Incrementally finds the end of the first top-level JSON object in streamed text."""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, text: str) -> int:
+        """Scan the next chunk; return the index just past the object's closing brace, or -1."""
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                # Quotes in prose before the object don't open a JSON string
+                self.in_string = self.started
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+class _SentenceScanner:
+    """Incrementally finds the end of the Nth sentence in streamed text."""
+
+    TERMINATORS = ".!?"
+
+    def __init__(self, max_sentences: int):
+        self.remaining = max_sentences
+        self.in_quote = False
+        self.pending = False  # saw a terminator, waiting for whitespace
+
+    def feed(self, text: str) -> int:
+        """Scan the next chunk; return the index just past the last allowed sentence, or -1."""
+        for i, ch in enumerate(text):
+            if self.pending and ch.isspace():
+                self.remaining -= 1
+                if self.remaining == 0:
+                    return i
+            if ch == '"':
+                self.in_quote = not self.in_quote
+            # Terminators inside quotes don't end the agent's own sentence
+            self.pending = ch in self.TERMINATORS and not self.in_quote
+        return -1
+
+
+def extract_json(text: str) -> Optional[str]:
+    """
+    Return the first balanced top-level JSON object in text, or None.
+
+    Single linear pass that ignores braces inside JSON strings, so trailing
+    prose (even prose containing stray braces) is not swallowed the way a
+    greedy regex would.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    end = _JsonObjectScanner().feed(text)
+    return text[start:end] if end != -1 else None
+
+
+# Fields recoverable from a verdict object cut off mid-stream
+_VERDICT_FIELD_RE = re.compile(r'"verdict"\s*:\s*"(faithful|mutation|uncertain)"', re.IGNORECASE)
+_CONFIDENCE_FIELD_RE = re.compile(r'"confidence"\s*:\s*([0-9]*\.?[0-9]+)')
+# A confidence value that has finished streaming (its delimiter has arrived)
+_CONFIDENCE_DONE_RE = re.compile(r'"confidence"\s*:\s*[0-9]*\.?[0-9]+\s*[,}]')
+
+
+class _VerdictFieldsScanner:
+    """Incrementally finds where a streamed verdict object has given its verdict and confidence."""
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, text: str) -> int:
+        """Scan the next chunk; return the index just past the confidence value, or -1."""
+        offset = len(self.buffer)
+        self.buffer += text
+        confidence = _CONFIDENCE_DONE_RE.search(self.buffer)
+        if confidence is None or _VERDICT_FIELD_RE.search(self.buffer) is None:
+            return -1
+        return max(confidence.end() - offset, 0)
+
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return " ".join(text.lower().split())
+
+
+# Structured-outputs schema for an agent's verdict (agent_name is filled in locally)
+VERDICT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verdict": {"type": "string", "enum": ["faithful", "mutation", "uncertain"]},
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "string"},
+        "evidence": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["verdict", "confidence", "reasoning", "evidence"],
+    "additionalProperties": False,
+}
+
+# One verdict per numbered case, for analyze_batch()
+BATCH_VERDICT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verdicts": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, **VERDICT_SCHEMA["properties"]},
+                "required": ["id", *VERDICT_SCHEMA["required"]],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["verdicts"],
+    "additionalProperties": False,
+}
+
+
+# Static task instructions go in the system prompt so every request an agent
+# makes shares one long prefix (cacheable by the provider); only the case
+# itself goes in the user prompt
+ANALYZE_INSTRUCTIONS = string.Template("""For each case you are given a SOURCE TRUTH and a CLAIM. Analyze whether the CLAIM is a faithful representation of the SOURCE TRUTH, or if it's a mutation (distortion, exaggeration, missing context, etc.).
+
+Respond with a JSON object containing:
+{
+    "verdict": "faithful" | "mutation" | "uncertain",
+    "confidence": <float 0.0-1.0>,
+    "reasoning": "<your detailed reasoning>",
+    "evidence": ["<specific evidence point 1>", "<specific evidence point 2>", ...]
+}
+
+Focus on your specific expertise as $agent_name. Be precise and cite specific differences or matches.""")
+
+RESPOND_INSTRUCTIONS = string.Template("""You previously analyzed a case. You are given its SOURCE TRUTH, the CLAIM, and your colleagues' verdicts. Review their opinions and provide a brief response.
+
+As $agent_name, do you:
+1. Agree with any points raised?
+2. Disagree with any conclusions?
+3. Want to update your assessment based on new perspectives?
+
+Keep your response concise (2-3 sentences). Focus on the most important point of agreement or disagreement.""")
 
+BATCH_ANALYZE_INSTRUCTIONS = string.Template("""You are given several numbered cases, each with a SOURCE TRUTH and a CLAIM. For every case, analyze whether the CLAIM is a faithful representation of its SOURCE TRUTH, or if it's a mutation (distortion, exaggeration, missing context, etc.).
 
-@dataclass
+Judge each case independently and respond with a JSON object containing one verdict per case:
+{
+    "verdicts": [
+        {
+            "id": <case number>,
+            "verdict": "faithful" | "mutation" | "uncertain",
+            "confidence": <float 0.0-1.0>,
+            "reasoning": "<your detailed reasoning>",
+            "evidence": ["<specific evidence point 1>", "<specific evidence point 2>", ...]
+        },
+        ...
+    ]
+}
+
+Focus on your specific expertise as $agent_name. Be precise and cite specific differences or matches.""")
+
+ANALYZE_PROMPT_TEMPLATE = string.Template("""SOURCE TRUTH:
+$truth
+
+CLAIM:
+$claim""")
+
+RESPOND_PROMPT_TEMPLATE = string.Template("""SOURCE TRUTH: $truth
+
+CLAIM: $claim
+
+OTHER AGENTS' VERDICTS:
+$verdicts_text""")
+
+
+@dataclass(slots=True, frozen=True)
 class AgentVerdict:
-    """Structured verdict from an agent."""
+    """Structured verdict from an agent. Immutable once produced."""
     agent_name: str
     verdict: str  # "faithful", "mutation", "uncertain"
     confidence: float  # 0.0 to 1.0
@@ -20,15 +346,134 @@ class AgentVerdict:
     evidence: list[str]
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Built directly rather than with asdict(), which deep-copies every field
+        return {
+            "agent_name": self.agent_name,
+            "verdict": self.verdict,
+            "confidence": self.confidence,
+            "reasoning": self.reasoning,
+            "evidence": list(self.evidence),
+        }
+
+
+def format_other_verdicts(verdicts: list[AgentVerdict]) -> dict[str, str]:
+    """
+    Render, for each agent, the debate text of every other agent's verdict.
+
+    Each verdict is formatted once and each agent's text is joined from the
+    slices around its own verdict, instead of every agent re-filtering and
+    re-formatting the whole jury in every round.
+
+    Args:
+        verdicts: One verdict per agent
+
+    Returns:
+        Mapping of agent name to the text of the other agents' verdicts
+    """
+    blocks = [
+        f"**{v.agent_name}** ({v.verdict}, {v.confidence:.0%} confidence):\n{v.reasoning}"
+        for v in verdicts
+    ]
+    return {
+        v.agent_name: "\n\n".join(blocks[:i] + blocks[i + 1:])
+        for i, v in enumerate(verdicts)
+    }
 
 
 class BaseAgent(ABC):
     """Abstract base class for fact-checking agents in the jury."""
 
-    def __init__(self, model: str = "gpt-4o-mini"):
+    # Completion budgets per call site: a verdict object and a 2-3 sentence
+    # rebuttal are far shorter than the API default, and a tight cap bounds
+    # worst-case decode time
+    analyze_max_tokens = 400
+    respond_max_tokens = 150
+
+    # Rebuttals are asked for in 2-3 sentences; the stream is cut after this many
+    respond_max_sentences = 3
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        deterministic: bool = False,
+        fast_triage: bool = False
+    ):
+        """
+        Args:
+            model: OpenAI model name
+            deterministic: Sample at temperature 0 and cache responses, so
+                identical requests are answered without another API call
+            fast_triage: Also accept claims that are verbatim excerpts of the
+                truth without an LLM call. Off by default: an excerpt can
+                still drop a caveat, which is exactly what the jury checks
+        """
         self.model = model
-        self._client = OpenAI(api_key=OPENAI_API_KEY)
+        self.deterministic = deterministic
+        self.fast_triage = fast_triage
+        self._client = get_client()
+
+    @property
+    def _aclient(self) -> AsyncOpenAI:
+        """Async client for the running event loop."""
+        return _get_async_client()
+
+    @staticmethod
+    def analyze_all(agents: list['BaseAgent'], claim: str, truth: str) -> list[AgentVerdict]:
+        """
+        Have several agents analyze a claim concurrently on the shared worker pool.
+
+        Args:
+            agents: Agents to run
+            claim: The claim to verify
+            truth: The source/ground truth text
+
+        Returns:
+            One AgentVerdict per agent, in agent order. An agent that raises
+            gets an "uncertain" verdict describing the error.
+        """
+        futures = [_EXECUTOR.submit(agent.analyze, claim, truth) for agent in agents]
+
+        verdicts = []
+        for agent, future in zip(agents, futures):
+            try:
+                verdicts.append(future.result())
+            except Exception as e:
+                verdicts.append(AgentVerdict(
+                    agent_name=agent.name,
+                    verdict="uncertain",
+                    confidence=0.0,
+                    reasoning=f"Error: {str(e)}",
+                    evidence=[]
+                ))
+
+        return verdicts
+
+    @staticmethod
+    def respond_all(agents: list['BaseAgent'], others: dict[str, str], claim: str, truth: str) -> list[str]:
+        """
+        Have several agents respond to each other concurrently on the shared worker pool.
+
+        Args:
+            agents: Agents to run
+            others: Each agent's name mapped to the rendered text of the
+                other agents' verdicts (see format_other_verdicts())
+            claim: The claim being verified
+            truth: The source/ground truth text
+
+        Returns:
+            One response per agent, in agent order. An agent that raises
+            gets a bracketed error message instead.
+        """
+        futures = [_EXECUTOR.submit(agent.respond_to, others[agent.name], claim, truth) for agent in agents]
+
+        responses = []
+        for future in futures:
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                responses.append(f"[Error generating response: {str(e)}]")
+
+        return responses
 
     @property
     @abstractmethod
@@ -54,6 +499,21 @@ class BaseAgent(ABC):
         """The system prompt defining this agent's perspective."""
         pass
 
+    @functools.cached_property
+    def analyze_system_prompt(self) -> str:
+        """System prompt for analyze(): the persona plus the static task instructions."""
+        return f"{self.system_prompt}\n\n{ANALYZE_INSTRUCTIONS.substitute(agent_name=self.name)}"
+
+    @functools.cached_property
+    def respond_system_prompt(self) -> str:
+        """System prompt for respond_to(): the persona plus the static debate instructions."""
+        return f"{self.system_prompt}\n\n{RESPOND_INSTRUCTIONS.substitute(agent_name=self.name)}"
+
+    @functools.cached_property
+    def batch_system_prompt(self) -> str:
+        """System prompt for analyze_batch(): the persona plus the batch instructions."""
+        return f"{self.system_prompt}\n\n{BATCH_ANALYZE_INSTRUCTIONS.substitute(agent_name=self.name)}"
+
     def analyze(self, claim: str, truth: str) -> AgentVerdict:
         """
         Analyze a claim against the source truth.
@@ -65,115 +525,489 @@ class BaseAgent(ABC):
         Returns:
             AgentVerdict with the agent's assessment
         """
-        prompt = f"""Analyze whether the following CLAIM is a faithful representation of the SOURCE TRUTH, or if it's a mutation (distortion, exaggeration, missing context, etc.).
+        triaged = self._fast_triage(claim, truth)
+        if triaged:
+            return triaged
+
+        response = self._call_llm(
+            self._build_analyze_prompt(claim, truth),
+            self.analyze_system_prompt,
+            schema=VERDICT_SCHEMA,
+            max_tokens=self.analyze_max_tokens
+        )
+        return self._parse_verdict(response)
 
-SOURCE TRUTH:
-{truth}
+    async def analyze_async(self, claim: str, truth: str) -> AgentVerdict:
+        """
+        Async variant of analyze() so a jury can run its agents concurrently.
 
-CLAIM:
-{claim}
+        Args:
+            claim: The claim to verify
+            truth: The source/ground truth text
 
-Respond with a JSON object containing:
-{{
-    "verdict": "faithful" | "mutation" | "uncertain",
-    "confidence": <float 0.0-1.0>,
-    "reasoning": "<your detailed reasoning>",
-    "evidence": ["<specific evidence point 1>", "<specific evidence point 2>", ...]
-}}
+        Returns:
+            AgentVerdict with the agent's assessment
+        """
+        triaged = self._fast_triage(claim, truth)
+        if triaged:
+            return triaged
+
+        response = await self._call_llm_async(
+            self._build_analyze_prompt(claim, truth),
+            self.analyze_system_prompt,
+            schema=VERDICT_SCHEMA,
+            max_tokens=self.analyze_max_tokens
+        )
+        return self._parse_verdict(response)
+
+    def _fast_triage(self, claim: str, truth: str) -> Optional[AgentVerdict]:
+        """
+        Return a verdict for trivially faithful claims without calling the LLM.
 
-Focus on your specific expertise as {self.name}. Be precise and cite specific differences or matches."""
+        A claim identical to the truth (ignoring case and whitespace) is always
+        accepted. With fast_triage enabled, a claim is also accepted when it
+        appears verbatim in the truth, or when its words are a subset of the
+        truth's and it cites exactly the same numbers. Anything else, including
+        any number missing from the truth, goes to the LLM.
+        """
+        claim_norm = _normalize(claim)
+        truth_norm = _normalize(truth)
+        if not claim_norm:
+            return None
+
+        if claim_norm == truth_norm:
+            confidence, reasoning = 0.95, "The claim matches the source truth verbatim."
+        elif not self.fast_triage:
+            return None
+        elif claim_norm in truth_norm:
+            confidence, reasoning = 0.95, "The claim is a verbatim excerpt of the source truth."
+        elif (
+            set(_NUMBER_RE.findall(claim_norm)) == set(_NUMBER_RE.findall(truth_norm))
+            and set(_WORD_RE.findall(claim_norm)) <= set(_WORD_RE.findall(truth_norm))
+        ):
+            confidence, reasoning = 0.85, (
+                "Every word and number in the claim appears in the source truth."
+            )
+        else:
+            return None
 
-        response = self._call_llm(prompt, self.system_prompt)
-        return self._parse_verdict(response)
+        return AgentVerdict(
+            agent_name=self.name,
+            verdict="faithful",
+            confidence=confidence,
+            reasoning=f"{reasoning} (fast triage, no LLM call)",
+            evidence=[]
+        )
 
-    def respond_to(self, other_verdicts: list['AgentVerdict'], claim: str, truth: str) -> str:
+    def analyze_batch(
+        self,
+        pairs: list[tuple[str, str]],
+        max_batch_size: int = 10,
+        max_batch_tokens: int = 12_000
+    ) -> list[AgentVerdict]:
         """
-        Respond to other agents' verdicts during debate.
+        Analyze many (claim, truth) pairs, several per LLM call.
+
+        Pairs are packed into numbered cases in one prompt, so the per-request
+        overhead and the instructions' prefill are paid once per batch
+        instead of once per claim.
 
         Args:
-            other_verdicts: Verdicts from other agents
-            claim: The original claim
-            truth: The source truth
+            pairs: (claim, truth) tuples to verify
+            max_batch_size: Most cases sent in a single request
+            max_batch_tokens: Rough cap on prompt plus completion tokens per request
 
         Returns:
-            The agent's response/rebuttal
+            One AgentVerdict per pair, in input order
         """
-        verdicts_text = "\n\n".join([
-            f"**{v.agent_name}** ({v.verdict}, {v.confidence:.0%} confidence):\n{v.reasoning}"
-            for v in other_verdicts if v.agent_name != self.name
-        ])
+        verdicts = []
+        for batch in self._split_batches(pairs, max_batch_size, max_batch_tokens):
+            response = self._call_llm(
+                self._build_batch_prompt(batch),
+                self.batch_system_prompt,
+                schema=BATCH_VERDICT_SCHEMA,
+                max_tokens=self.analyze_max_tokens * len(batch)
+            )
+            verdicts.extend(self._parse_batch_verdicts(response, len(batch)))
+
+        return verdicts
+
+    async def analyze_batch_async(
+        self,
+        pairs: list[tuple[str, str]],
+        max_batch_size: int = 10,
+        max_batch_tokens: int = 12_000
+    ) -> list[AgentVerdict]:
+        """Async variant of analyze_batch(); the batches are sent concurrently."""
+        batches = self._split_batches(pairs, max_batch_size, max_batch_tokens)
+        responses = await asyncio.gather(*(
+            self._call_llm_async(
+                self._build_batch_prompt(batch),
+                self.batch_system_prompt,
+                schema=BATCH_VERDICT_SCHEMA,
+                max_tokens=self.analyze_max_tokens * len(batch)
+            )
+            for batch in batches
+        ))
+        return [
+            verdict
+            for batch, response in zip(batches, responses)
+            for verdict in self._parse_batch_verdicts(response, len(batch))
+        ]
+
+    def analyze_many(
+        self,
+        pairs: list[tuple[str, str]],
+        poll_interval: float = 30.0
+    ) -> list[AgentVerdict]:
+        """
+        Analyze many (claim, truth) pairs through the OpenAI Batch API.
 
-        prompt = f"""You previously analyzed this case. Now review your colleagues' opinions and provide a brief response.
+        Intended for offline, dataset-scale runs: requests are billed at the
+        discounted batch rate and may take up to 24h to complete.
 
-SOURCE TRUTH: {truth}
+        Args:
+            pairs: (claim, truth) tuples to verify
+            poll_interval: Seconds to wait between batch status checks
 
-CLAIM: {claim}
+        Returns:
+            One AgentVerdict per pair, in input order; a pair whose request
+            failed gets an "uncertain" verdict
 
-OTHER AGENTS' VERDICTS:
-{verdicts_text}
+        Raises:
+            RuntimeError: If the batch job ends without any output
+        """
+        if not pairs:
+            return []
+
+        bodies = {
+            f"{self.name}:{i}": self._completion_params(
+                self._build_analyze_prompt(claim, truth),
+                self.analyze_system_prompt,
+                VERDICT_SCHEMA,
+                self.analyze_max_tokens
+            )
+            for i, (claim, truth) in enumerate(pairs)
+        }
+        outputs = run_chat_batch(self._client, bodies, poll_interval)
+
+        return [
+            self._parse_verdict(output) if output else AgentVerdict(
+                agent_name=self.name,
+                verdict="uncertain",
+                confidence=0.0,
+                reasoning="Error: batch request failed",
+                evidence=[]
+            )
+            for output in outputs.values()
+        ]
+
+    def _build_analyze_prompt(self, claim: str, truth: str) -> str:
+        """Build the user prompt for analyzing a claim against the source truth."""
+        return ANALYZE_PROMPT_TEMPLATE.substitute(truth=truth, claim=claim)
+
+    def _split_batches(
+        self,
+        pairs: list[tuple[str, str]],
+        max_batch_size: int,
+        max_batch_tokens: int
+    ) -> list[list[tuple[str, str]]]:
+        """Group pairs into batches bounded by case count and estimated tokens."""
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for claim, truth in pairs:
+            # ~4 characters per prompt token, plus this case's completion budget
+            tokens = (len(claim) + len(truth)) // 4 + self.analyze_max_tokens
+            if batch and (len(batch) >= max_batch_size or batch_tokens + tokens > max_batch_tokens):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append((claim, truth))
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _build_batch_prompt(self, batch: list[tuple[str, str]]) -> str:
+        """Build the user prompt listing numbered cases."""
+        return "\n\n".join(
+            f"CASE {i}:\n{self._build_analyze_prompt(claim, truth)}"
+            for i, (claim, truth) in enumerate(batch, start=1)
+        )
 
-As {self.name}, do you:
-1. Agree with any points raised?
-2. Disagree with any conclusions?
-3. Want to update your assessment based on new perspectives?
+    def _parse_batch_verdicts(self, response: str, count: int) -> list[AgentVerdict]:
+        """Split a batch response into one verdict per case, in case order."""
+        by_id = {}
+        try:
+            for item in json_loads(response)["verdicts"]:
+                by_id[int(item["id"])] = item
+        except (ValueError, KeyError, TypeError):
+            pass
 
-Keep your response concise (2-3 sentences). Focus on the most important point of agreement or disagreement."""
+        verdicts = []
+        for i in range(1, count + 1):
+            try:
+                verdicts.append(self._verdict_from_data(by_id[i]))
+            except (KeyError, ValueError, AttributeError):
+                verdicts.append(AgentVerdict(
+                    agent_name=self.name,
+                    verdict="uncertain",
+                    confidence=0.0,
+                    reasoning=f"Error: case {i} missing from batch response",
+                    evidence=[]
+                ))
+
+        return verdicts
+
+    def respond_to(self, other_verdicts_text: str, claim: str, truth: str) -> str:
+        """
+        Respond to other agents' verdicts during debate.
+
+        Args:
+            other_verdicts_text: The other agents' verdicts, as rendered by
+                format_other_verdicts()
+            claim: The original claim
+            truth: The source truth
+
+        Returns:
+            The agent's response/rebuttal
+        """
+        return self._call_llm(
+            self._build_respond_prompt(other_verdicts_text, claim, truth),
+            self.respond_system_prompt,
+            max_tokens=self.respond_max_tokens,
+            stop_after_sentences=self.respond_max_sentences,
+            stop=["\n\n"]
+        )
+
+    async def respond_to_async(self, other_verdicts_text: str, claim: str, truth: str) -> str:
+        """Async variant of respond_to()."""
+        return await self._call_llm_async(
+            self._build_respond_prompt(other_verdicts_text, claim, truth),
+            self.respond_system_prompt,
+            max_tokens=self.respond_max_tokens,
+            stop_after_sentences=self.respond_max_sentences,
+            stop=["\n\n"]
+        )
 
-        return self._call_llm(prompt, self.system_prompt)
+    def _build_respond_prompt(self, other_verdicts_text: str, claim: str, truth: str) -> str:
+        """Build the user prompt for responding to other agents' verdicts."""
+        return RESPOND_PROMPT_TEMPLATE.substitute(
+            truth=truth, claim=claim, verdicts_text=other_verdicts_text
+        )
 
-    def _call_llm(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def _call_llm(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_json: bool = False,
+        schema: Optional[dict] = None,
+        max_tokens: int = 1000,
+        stop_after_sentences: Optional[int] = None,
+        stop: Optional[list[str]] = None,
+        stop_at_verdict: bool = False
+    ) -> str:
         """
         Call the LLM with the given prompt.
 
         Args:
             prompt: The user prompt
             system_prompt: Optional system prompt
+            stop_at_json: Stream the response and stop generating as soon as
+                the first JSON object is complete
+            schema: Optional JSON schema the response must conform to
+                (OpenAI structured outputs)
+            max_tokens: Completion token budget
+            stop_after_sentences: Stream the response and stop generating
+                after this many sentences
+            stop: Stop sequences passed to the API
+            stop_at_verdict: Stream the response and stop generating as soon
+                as a verdict object's verdict and confidence fields are
+                complete (the rest of the object is cut off)
 
         Returns:
             The LLM response text
         """
+        params = self._completion_params(prompt, system_prompt, schema, max_tokens, stop)
+
+        cache_key = None
+        if self.deterministic:
+            cache_key = ResponseCache.key(
+                params, stop_at_json=stop_at_json, stop_after_sentences=stop_after_sentences,
+                stop_at_verdict=stop_at_verdict
+            )
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        content = self._request_completion(
+            params, self._stream_scanner(stop_at_json, stop_after_sentences, stop_at_verdict)
+        )
+        if cache_key is not None:
+            _RESPONSE_CACHE.put(cache_key, content)
+        return content
+
+    @staticmethod
+    def _stream_scanner(stop_at_json: bool, stop_after_sentences: Optional[int], stop_at_verdict: bool = False):
+        """Scanner that decides where to cut a streamed response, or None to not stream."""
+        if stop_at_verdict:
+            return _VerdictFieldsScanner()
+        if stop_at_json:
+            return _JsonObjectScanner()
+        if stop_after_sentences:
+            return _SentenceScanner(stop_after_sentences)
+        return None
+
+    def _request_completion(self, params: dict, scanner=None) -> str:
+        """Send a chat completion request, streaming it until the scanner says to stop."""
+        if scanner is None:
+            response = self._client.chat.completions.create(**params)
+            return response.choices[0].message.content
+
+        stream = self._client.chat.completions.create(**params, stream=True)
+        parts = []
+        try:
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                text = chunk.choices[0].delta.content
+                end = scanner.feed(text)
+                if end != -1:
+                    parts.append(text[:end])
+                    break
+                parts.append(text)
+        finally:
+            # Closing the stream aborts generation of the rest of the response
+            stream.close()
+
+        return "".join(parts)
+
+    async def _call_llm_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_at_json: bool = False,
+        schema: Optional[dict] = None,
+        max_tokens: int = 1000,
+        stop_after_sentences: Optional[int] = None,
+        stop: Optional[list[str]] = None,
+        stop_at_verdict: bool = False
+    ) -> str:
+        """
+        Async variant of _call_llm() using the AsyncOpenAI client.
+
+        Requests go through the shared request pool, which bounds concurrency
+        and backs off on rate-limit errors.
+        """
+        params = self._completion_params(prompt, system_prompt, schema, max_tokens, stop)
+
+        cache_key = None
+        if self.deterministic:
+            cache_key = ResponseCache.key(
+                params, stop_at_json=stop_at_json, stop_after_sentences=stop_after_sentences,
+                stop_at_verdict=stop_at_verdict
+            )
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Rough token estimate: ~4 characters per prompt token plus the completion budget
+        estimated_tokens = (len(prompt) + len(system_prompt or "")) // 4 + params["max_tokens"]
+
+        async def request() -> str:
+            scanner = self._stream_scanner(stop_at_json, stop_after_sentences, stop_at_verdict)
+            if scanner is None:
+                response = await self._aclient.chat.completions.create(**params)
+                return response.choices[0].message.content
+
+            stream = await self._aclient.chat.completions.create(**params, stream=True)
+            parts = []
+            try:
+                async for chunk in stream:
+                    if not chunk.choices or not chunk.choices[0].delta.content:
+                        continue
+                    text = chunk.choices[0].delta.content
+                    end = scanner.feed(text)
+                    if end != -1:
+                        parts.append(text[:end])
+                        break
+                    parts.append(text)
+            finally:
+                await stream.close()
+
+            return "".join(parts)
+
+        content = await _REQUEST_POOL.run(request, estimated_tokens)
+        if cache_key is not None:
+            _RESPONSE_CACHE.put(cache_key, content)
+        return content
+
+    def _completion_params(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        schema: Optional[dict] = None,
+        max_tokens: int = 1000,
+        stop: Optional[list[str]] = None
+    ) -> dict:
+        """Build the chat completion request body for a prompt."""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = self._client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=1000
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 0.0 if self.deterministic else 0.7,
+            "max_tokens": max_tokens,
+        }
+        if schema is not None:
+            params["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "verdict", "schema": schema, "strict": True},
+            }
+        if stop:
+            params["stop"] = stop
+        return params
+
+    def _verdict_from_data(self, data: dict) -> AgentVerdict:
+        """Build an AgentVerdict from a decoded verdict JSON object."""
+        return AgentVerdict(
+            agent_name=self.name,
+            verdict=data.get("verdict", "uncertain").lower(),
+            confidence=float(data.get("confidence", 0.5)),
+            reasoning=data.get("reasoning", "No reasoning provided"),
+            evidence=data.get("evidence", [])
         )
 
-        return response.choices[0].message.content
-
     def _parse_verdict(self, response: str) -> AgentVerdict:
         """Parse LLM response into AgentVerdict."""
+        # Structured outputs: the response is exactly one schema-valid object
+        try:
+            return AgentVerdict(agent_name=self.name, **json_loads(response))
+        except (json.JSONDecodeError, TypeError):
+            pass
+
+        # Free-form or truncated responses (refusals, max_tokens cut-offs)
         try:
             # Try to extract JSON from the response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                data = json.loads(json_match.group())
-                return AgentVerdict(
-                    agent_name=self.name,
-                    verdict=data.get("verdict", "uncertain").lower(),
-                    confidence=float(data.get("confidence", 0.5)),
-                    reasoning=data.get("reasoning", "No reasoning provided"),
-                    evidence=data.get("evidence", [])
-                )
-        except (json.JSONDecodeError, KeyError, ValueError):
+            json_text = extract_json(response)
+            if json_text:
+                return self._verdict_from_data(json_loads(json_text))
+        except (json.JSONDecodeError, KeyError, ValueError, AttributeError):
             pass
 
-        # Fallback: try to parse from text
-        verdict = "uncertain"
-        if "faithful" in response.lower():
-            verdict = "faithful"
-        elif "mutation" in response.lower():
-            verdict = "mutation"
+        # Fallback: recover the fields of a truncated verdict object. Prose is
+        # not guessed at - "faithful" and "mutation" often both appear in it
+        verdict_match = _VERDICT_FIELD_RE.search(response)
+        confidence_match = _CONFIDENCE_FIELD_RE.search(response)
 
         return AgentVerdict(
             agent_name=self.name,
-            verdict=verdict,
-            confidence=0.5,
+            verdict=verdict_match.group(1).lower() if verdict_match else "uncertain",
+            confidence=min(float(confidence_match.group(1)), 1.0) if confidence_match else 0.5,
             reasoning=response[:500],
             evidence=[]
         )
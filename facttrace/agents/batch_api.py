@@ -0,0 +1,59 @@
+"""Offline chat completions through the OpenAI Batch API."""
+
+import time
+
+from openai import OpenAI
+
+# base_agent builds on this module, so the codec comes straight from orjson
+# rather than through agents.base_agent
+from orjson import dumps as json_dumps, loads as json_loads
+
+# Batch states after which the output file will not change
+_FINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+def run_chat_batch(client: OpenAI, bodies: dict[str, dict], poll_interval: float = 30.0) -> dict[str, str]:
+    """
+    Run chat completions as one Batch API job and wait for it to finish.
+
+    Batch jobs cost half as much as online requests and don't count against
+    the online rate limits, but complete within a 24h window rather than
+    seconds - use them for dataset-scale evaluation, not live debates.
+
+    Args:
+        client: OpenAI client
+        bodies: Chat completion request bodies, by custom_id
+        poll_interval: Seconds between status checks
+
+    Returns:
+        Each request's response text by custom_id; "" for requests that failed
+    """
+    lines = b"".join(
+        json_dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}) + b"\n"
+        for custom_id, body in bodies.items()
+    )
+    input_file = client.files.create(file=("requests.jsonl", lines), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    while batch.status not in _FINAL_STATES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    # An expired batch still returns the requests it finished in time
+    if batch.output_file_id is None:
+        raise RuntimeError(f"Batch {batch.id} {batch.status} without output")
+
+    results = {}
+    for line in client.files.content(batch.output_file_id).content.splitlines():
+        if not line.strip():
+            continue
+        item = json_loads(line)
+        response = item.get("response")
+        if response and response.get("status_code") == 200:
+            results[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"] or ""
+
+    return {custom_id: results.get(custom_id, "") for custom_id in bodies}
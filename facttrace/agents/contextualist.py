@@ -13,6 +13,9 @@ class ContextualistAgent(BaseAgent):
     - Implications that differ between claim and source
     """
 
+    # Explaining lost context takes more words than a numeric mismatch
+    analyze_max_tokens = 500
+
     @property
     def name(self) -> str:
         return "Contextualist"
@@ -0,0 +1,293 @@
+"""Jury Agent - runs the whole jury's initial analysis in a single LLM call."""
+
+import functools
+import json
+from collections import Counter
+from typing import Optional
+
+from agents.base_agent import BaseAgent, AgentVerdict
+from agents.literalist import LiteralistAgent
+from agents.contextualist import ContextualistAgent
+from agents.statistician import StatisticianAgent
+
+# Shared decoder for the fused responses; raw_decode stops at the end of the
+# first JSON value, ignoring any trailing text
+_DECODER = json.JSONDecoder()
+
+
+class JuryAgent(BaseAgent):
+    """
+    Fuses the member agents' analyses into one chat completion.
+
+    Instead of one request per agent, each re-sending the same truth and
+    claim, a single prompt describes every member's persona and asks for a
+    JSON array with one verdict per member. This costs one round trip and
+    one prefill of the source text for the whole jury.
+
+    As a single agent (analyze(), analyze_all()), the jury answers with its
+    foreperson's ruling.
+    """
+
+    def __init__(
+        self,
+        members: Optional[list[BaseAgent]] = None,
+        model: str = "gpt-4o-mini",
+        deterministic: bool = False
+    ):
+        super().__init__(model=model, deterministic=deterministic)
+        self.members = members or [
+            LiteralistAgent(model=model, deterministic=deterministic),
+            ContextualistAgent(model=model, deterministic=deterministic),
+            StatisticianAgent(model=model, deterministic=deterministic),
+        ]
+
+    @property
+    def name(self) -> str:
+        return "Jury"
+
+    @property
+    def role_description(self) -> str:
+        return "I deliver each jury member's independent verdict in a single pass."
+
+    @property
+    def color(self) -> str:
+        return "white"
+
+    @property
+    def system_prompt(self) -> str:
+        personas = "\n\n".join(
+            f"=== {member.name.upper()} ===\n{member.system_prompt}"
+            for member in self.members
+        )
+        return f"""You are a JURY of {len(self.members)} independent fact-checking experts. Each expert's instructions follow.
+
+{personas}
+
+Answer as each expert in turn. Every expert judges independently - do not let one expert's conclusion influence another's."""
+
+    @functools.cached_property
+    def analyze_system_prompt(self) -> str:
+        agent_names = ", ".join(f'"{member.name}"' for member in self.members)
+        return f"""{self.system_prompt}
+
+For each case you are given a SOURCE TRUTH and a CLAIM. Analyze whether the CLAIM is a faithful representation of the SOURCE TRUTH, or if it's a mutation (distortion, exaggeration, missing context, etc.).
+
+Respond with a JSON array containing one object per expert, in this order: {agent_names}.
+[
+    {{
+        "agent": "<expert name>",
+        "verdict": "faithful" | "mutation" | "uncertain",
+        "confidence": <float 0.0-1.0>,
+        "reasoning": "<the expert's detailed reasoning>",
+        "evidence": ["<specific evidence point 1>", "<specific evidence point 2>", ...]
+    }},
+    ...
+]
+
+Each expert must focus on their own specialty. Be precise and cite specific differences or matches."""
+
+    @functools.cached_property
+    def ruling_system_prompt(self) -> str:
+        agent_names = ", ".join(f'"{member.name}"' for member in self.members)
+        return f"""{self.system_prompt}
+
+For each case you are given a SOURCE TRUTH and a CLAIM. Analyze whether the CLAIM is a faithful representation of the SOURCE TRUTH, or if it's a mutation (distortion, exaggeration, missing context, etc.).
+
+Then, as the jury's impartial FOREPERSON, weigh the experts' verdicts and deliver the final ruling: which experts made the strongest arguments, whether they agree, and what the key issues are.
+
+Respond with a JSON object. "verdicts" holds one object per expert, in this order: {agent_names}.
+{{
+    "verdicts": [
+        {{
+            "agent": "<expert name>",
+            "verdict": "faithful" | "mutation" | "uncertain",
+            "confidence": <float 0.0-1.0>,
+            "reasoning": "<the expert's detailed reasoning>",
+            "evidence": ["<specific evidence point 1>", "<specific evidence point 2>", ...]
+        }},
+        ...
+    ],
+    "ruling": {{
+        "verdict": "faithful" | "mutation" | "uncertain",
+        "confidence": <float 0.0-1.0>,
+        "reasoning": "<synthesis of key points and final judgment>",
+        "mutation_type": "<if mutation: 'numerical', 'temporal', 'contextual', 'framing', or null>",
+        "dissenting_opinions": ["<brief dissent if any>"]
+    }}
+}}
+
+Each expert must focus on their own specialty. Be precise and cite specific differences or matches."""
+
+    def analyze(self, claim: str, truth: str) -> AgentVerdict:
+        """
+        The jury's collective verdict on a claim, from analyze_with_ruling().
+
+        Args:
+            claim: The claim to verify
+            truth: The source/ground truth text
+
+        Returns:
+            The foreperson's ruling as an AgentVerdict, with each member's
+            position as evidence
+        """
+        return self._ruling_verdict(*self.analyze_with_ruling(claim, truth))
+
+    async def analyze_async(self, claim: str, truth: str) -> AgentVerdict:
+        """Async variant of analyze()."""
+        return self._ruling_verdict(*await self.analyze_with_ruling_async(claim, truth))
+
+    def analyze_fused(self, claim: str, truth: str) -> list[AgentVerdict]:
+        """
+        Analyze a claim as every jury member in one LLM call.
+
+        Args:
+            claim: The claim to verify
+            truth: The source/ground truth text
+
+        Returns:
+            One AgentVerdict per member, in member order
+        """
+        response = self._call_llm(
+            self._build_analyze_prompt(claim, truth), self.analyze_system_prompt, max_tokens=self.analyze_max_tokens
+        )
+        return self._parse_fused_verdicts(response)
+
+    async def analyze_fused_async(self, claim: str, truth: str) -> list[AgentVerdict]:
+        """Async variant of analyze_fused()."""
+        response = await self._call_llm_async(
+            self._build_analyze_prompt(claim, truth), self.analyze_system_prompt, max_tokens=self.analyze_max_tokens
+        )
+        return self._parse_fused_verdicts(response)
+
+    def analyze_with_ruling(self, claim: str, truth: str) -> tuple[list[AgentVerdict], Optional[dict]]:
+        """
+        Analyze a claim as every jury member and rule on it, in one LLM call.
+
+        Replaces analyze_fused() followed by a separate synthesis request for
+        one-shot juries, halving the round trips per case.
+
+        Args:
+            claim: The claim to verify
+            truth: The source/ground truth text
+
+        Returns:
+            One AgentVerdict per member, in member order, and the foreperson's
+            ruling (verdict, confidence, reasoning, mutation_type,
+            dissenting_opinions), or None if the response had none
+        """
+        response = self._call_llm(
+            self._build_analyze_prompt(claim, truth), self.ruling_system_prompt, max_tokens=self._ruling_max_tokens
+        )
+        return self._parse_ruling_response(response)
+
+    async def analyze_with_ruling_async(self, claim: str, truth: str) -> tuple[list[AgentVerdict], Optional[dict]]:
+        """Async variant of analyze_with_ruling()."""
+        response = await self._call_llm_async(
+            self._build_analyze_prompt(claim, truth), self.ruling_system_prompt, max_tokens=self._ruling_max_tokens
+        )
+        return self._parse_ruling_response(response)
+
+    @property
+    def _ruling_max_tokens(self) -> int:
+        # _completion_params() scales this by the member count; leave room for
+        # about one more verdict-sized object (the ruling)
+        return self.analyze_max_tokens + self.analyze_max_tokens // len(self.members)
+
+    def _completion_params(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        schema: Optional[dict] = None,
+        max_tokens: int = 1000,
+        stop: Optional[list[str]] = None
+    ) -> dict:
+        params = super()._completion_params(prompt, system_prompt, schema, max_tokens, stop)
+        # Room for every member's verdict in one completion
+        params["max_tokens"] *= len(self.members)
+        return params
+
+    def _parse_fused_verdicts(self, response: str) -> list[AgentVerdict]:
+        """Split the JSON array response into per-member verdicts."""
+        items = []
+        start = response.find("[")
+        if start != -1:
+            try:
+                items, _ = _DECODER.raw_decode(response, start)
+            except json.JSONDecodeError:
+                items = []
+        return self._verdicts_from_items(items)
+
+    def _parse_ruling_response(self, response: str) -> tuple[list[AgentVerdict], Optional[dict]]:
+        """Split the {"verdicts": [...], "ruling": {...}} response."""
+        data = {}
+        start = response.find("{")
+        if start != -1:
+            try:
+                data, _ = _DECODER.raw_decode(response, start)
+            except json.JSONDecodeError:
+                data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        ruling = data.get("ruling")
+        if not isinstance(ruling, dict) or "verdict" not in ruling:
+            ruling = None
+        return self._verdicts_from_items(data.get("verdicts", [])), ruling
+
+    def _ruling_verdict(self, verdicts: list[AgentVerdict], ruling: Optional[dict]) -> AgentVerdict:
+        """
+        Fold the members' verdicts and the ruling into one AgentVerdict.
+
+        Without a usable ruling, the members' confidence-weighted majority
+        stands in for it.
+        """
+        evidence = [f"{v.agent_name}: {v.verdict} ({v.confidence:.0%})" for v in verdicts]
+        if ruling is not None:
+            try:
+                return AgentVerdict(
+                    agent_name=self.name,
+                    verdict=str(ruling["verdict"]).lower(),
+                    confidence=float(ruling.get("confidence", 0.5)),
+                    reasoning=ruling.get("reasoning", "No reasoning provided"),
+                    evidence=evidence
+                )
+            except (KeyError, ValueError, TypeError):
+                pass
+
+        weights = Counter()
+        for v in verdicts:
+            weights[v.verdict] += v.confidence
+        verdict, weight = weights.most_common(1)[0] if weights else ("uncertain", 0.0)
+        return AgentVerdict(
+            agent_name=self.name,
+            verdict=verdict,
+            confidence=weight / len(verdicts) if verdicts else 0.0,
+            reasoning="No ruling in the jury's response; confidence-weighted majority of its members.",
+            evidence=evidence
+        )
+
+    def _verdicts_from_items(self, items) -> list[AgentVerdict]:
+        """Match decoded verdict objects to members by their "agent" field."""
+        by_name = {}
+        if isinstance(items, list):
+            for item in items:
+                if isinstance(item, dict):
+                    by_name[str(item.get("agent", "")).lower()] = item
+
+        verdicts = []
+        for member in self.members:
+            data = by_name.get(member.name.lower())
+            try:
+                if data is None:
+                    raise ValueError("missing from fused response")
+                verdicts.append(member._verdict_from_data(data))
+            except (KeyError, ValueError, AttributeError) as e:
+                verdicts.append(AgentVerdict(
+                    agent_name=member.name,
+                    verdict="uncertain",
+                    confidence=0.0,
+                    reasoning=f"Error: {str(e)}",
+                    evidence=[]
+                ))
+
+        return verdicts
@@ -13,6 +13,9 @@ class LiteralistAgent(BaseAgent):
     - Direct contradictions between claim and source
     """
 
+    # Exact-match findings are short lists of discrepancies
+    analyze_max_tokens = 300
+
     @property
     def name(self) -> str:
         return "Literalist"
@@ -0,0 +1,155 @@
+"""Concurrency pool and rate limiter for async LLM requests."""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from typing import Awaitable, Callable, TypeVar
+
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+T = TypeVar("T")
+
+# Failures worth retrying: 429s, 5xx responses, and timeouts/dropped
+# connections (APITimeoutError subclasses APIConnectionError)
+TRANSIENT_ERRORS = (RateLimitError, InternalServerError, APIConnectionError)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the provider is failing."""
+
+
+class RequestPool:
+    """
+    Bounds in-flight LLM requests and paces them under the account's limits.
+
+    Modeled on OpenAI's api_request_parallel_processor: a semaphore caps
+    concurrency, and two leaky buckets (requests/min and tokens/min) delay
+    new requests until there is capacity for them. Requests that still hit
+    a 429 (or another transient error) are retried with exponential backoff,
+    honoring Retry-After.
+
+    A circuit breaker sits in front: after breaker_threshold requests in a
+    row fail even after retrying, requests fail fast with CircuitOpenError
+    for breaker_reset seconds, then one success closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        requests_per_minute: float = 500,
+        tokens_per_minute: float = 200_000,
+        max_retries: int = 5,
+        breaker_threshold: int = 5,
+        breaker_reset: float = 30.0
+    ):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+
+        # Bucket state is shared by every event loop using the pool
+        self._lock = threading.Lock()
+        self._available_requests = requests_per_minute
+        self._available_tokens = tokens_per_minute
+        self._last_refill = time.monotonic()
+
+        # Circuit breaker state, also shared across loops (guarded by _lock)
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+
+        # asyncio.Semaphore is bound to the loop it is first used on
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take capacity for one request; return 0, or seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+
+            self._available_requests = min(
+                self.requests_per_minute,
+                self._available_requests + elapsed * self.requests_per_minute / 60
+            )
+            self._available_tokens = min(
+                self.tokens_per_minute,
+                self._available_tokens + elapsed * self.tokens_per_minute / 60
+            )
+
+            # A single request larger than the whole bucket must still go through
+            tokens = min(tokens, self.tokens_per_minute)
+            if self._available_requests >= 1 and self._available_tokens >= tokens:
+                self._available_requests -= 1
+                self._available_tokens -= tokens
+                return 0.0
+
+            request_wait = (1 - self._available_requests) * 60 / self.requests_per_minute
+            token_wait = (tokens - self._available_tokens) * 60 / self.tokens_per_minute
+            return max(request_wait, token_wait, 0.01)
+
+    async def run(self, make_request: Callable[[], Awaitable[T]], estimated_tokens: int = 1000) -> T:
+        """
+        Run a request under the concurrency and rate limits.
+
+        Args:
+            make_request: Zero-argument callable returning a fresh awaitable
+            estimated_tokens: Prompt plus completion tokens the request may use
+
+        Returns:
+            The request's result
+
+        Raises:
+            CircuitOpenError: The provider has been failing; nothing was sent
+        """
+        async with self._semaphore():
+            for attempt in range(self.max_retries + 1):
+                if time.monotonic() < self._open_until:
+                    raise CircuitOpenError("LLM provider unavailable (circuit breaker open)")
+
+                while (wait := self._try_acquire(estimated_tokens)) > 0:
+                    await asyncio.sleep(wait)
+
+                try:
+                    result = await make_request()
+                except TRANSIENT_ERRORS as e:
+                    if attempt == self.max_retries:
+                        self._record_failure()
+                        raise
+                    await asyncio.sleep(self._backoff(e, attempt))
+                else:
+                    self._record_success()
+                    return result
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.breaker_threshold:
+                self._open_until = time.monotonic() + self.breaker_reset
+
+    @staticmethod
+    def _backoff(error: Exception, attempt: int) -> float:
+        """Seconds to wait after a transient error, preferring the server's Retry-After."""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return min(60.0, 2 ** attempt) + random.uniform(0, 1)
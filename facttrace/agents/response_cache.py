@@ -0,0 +1,93 @@
+"""In-memory LRU cache for deterministic LLM responses, optionally backed by disk."""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of completion text keyed on the full request.
+
+    Values are stored as-is, so any immutable result (e.g. a replayable
+    sequence of debate events) can be cached the same way.
+
+    With a directory, entries are also written through to one JSON file per
+    key there, so repeated runs (ablation sweeps, regressions) reuse earlier
+    responses across processes. Disk-backed values must be JSON-serializable.
+    The key already covers the model and the full prompt, so changing either
+    simply misses.
+
+    Only safe for deterministic (temperature 0) requests - caching sampled
+    responses would silently freeze the variation the debate relies on.
+    """
+
+    def __init__(self, maxsize: int = 4096, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    @staticmethod
+    def key(params: dict, **extra) -> str:
+        """Hash a chat completion request body (model, messages, temperature, ...)."""
+        payload = json.dumps({**params, **extra}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        value = self._read(key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._remember(key, value)
+        self._write(key, value)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries; files on disk are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _read(self, key: str) -> Optional[Any]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self.directory / f"{key}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, value: Any) -> None:
+        if self.directory is None:
+            return
+        path = self.directory / f"{key}.json"
+        # Write-then-rename, so a concurrent reader never sees a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            tmp.unlink(missing_ok=True)
@@ -2,23 +2,36 @@
 
 import asyncio
 import csv
-import json
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import AsyncGenerator
-from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterable, Literal
+from contextlib import aclosing, asynccontextmanager, contextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config import MODELS, SETUPS
+from pydantic_core import to_json
+
+try:
+    # FastAPI >= 0.135: SSE framing and keep-alive pings handled by the router
+    from fastapi.sse import EventSourceResponse, ServerSentEvent
+except ImportError:
+    EventSourceResponse = None
+    ServerSentEvent = None
+
+from config import (
+    DEBATE_CACHE_SIZE, DEFAULT_MODEL, DEFAULT_SETUP, MODELS,
+    SERVER_RELOAD, SERVER_WORKERS, SETUPS, THREAD_POOL_SIZE,
+)
+from api.compression import EventStreamGZipMiddleware
 from agents import LiteralistAgent, ContextualistAgent, StatisticianAgent
-from debate.protocol import DebateProtocol, DebateResult
+from agents.base_agent import format_other_verdicts, json_dumps
+from agents.response_cache import ResponseCache
+from debate.protocol import DebateProtocol, DebateResult, SingleAgentBaseline
 from debate.verdict import VerdictSynthesizer
 from debate.crew import FactCheckCrew
 
@@ -35,9 +48,9 @@ def load_cases():
             truth = row['truth'].strip()
 
             # Generate a short name from the claim (first few words)
-            words = claim.split()[:5]
-            name = ' '.join(words)
-            if len(claim.split()) > 5:
+            words = claim.split()
+            name = ' '.join(words[:5])
+            if len(words) > 5:
                 name += '...'
 
             cases.append({
@@ -52,6 +65,28 @@ def load_cases():
 
 
 CASES = load_cases()
+CASES_BY_ID = {c["id"]: c for c in CASES}
+
+# Cases never change after startup, so their responses are serialized once
+CASES_JSON = json_dumps({"cases": CASES, "count": len(CASES)})
+CASE_JSON_BY_ID = {c["id"]: json_dumps(c) for c in CASES}
+
+# Likewise for the setup and model listings
+SETUPS_JSON = json_dumps({
+    "setups": {k: {"name": k, **v} for k, v in SETUPS.items()},
+    "default": "crew-jury"
+})
+MODELS_JSON = json_dumps({"models": MODELS, "default": "mini"})
+ROOT_JSON = json_dumps({
+    "name": "FactTrace API",
+    "version": "1.0.0",
+    "description": "Multi-Agent Fact Verification System",
+    "endpoints": {
+        "cases": "/api/cases",
+        "setups": "/api/setups",
+        "debate_stream": f"/api/debate/stream?case_id=1&setup={DEFAULT_SETUP}&model={DEFAULT_MODEL}"
+    }
+})
 
 AGENT_CLASSES = {
     "literalist": LiteralistAgent,
@@ -63,15 +98,24 @@ AGENT_CLASSES = {
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
+    # Blocking LLM calls get their own pool, sized for I/O-bound work and not
+    # shared with anything else using the loop's default executor
+    executor = ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="llm")
+    app.state.llm_executor = executor
+
     print("=" * 50)
     print("FactTrace API Server")
     print("=" * 50)
     print(f"Cases loaded: {len(CASES)}")
     print(f"Setups available: {list(SETUPS.keys())}")
     print(f"Models: {MODELS}")
+    print(f"LLM worker threads: {THREAD_POOL_SIZE}")
     print("=" * 50)
-    yield
-    print("Shutting down...")
+    try:
+        yield
+    finally:
+        print("Shutting down...")
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
@@ -81,15 +125,20 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# CORS - allow React dev server
+# CORS - allow React dev server on any local port (one precompiled regex match per request)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:5173", "http://127.0.0.1:5173", "*"],
+    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # The API is read-only; browsers may cache the preflight for a day
+    allow_methods=["GET"],
+    allow_headers=["Accept", "Cache-Control", "Last-Event-ID"],
+    max_age=86400,
 )
 
+# Compress debate streams; each event is still flushed as soon as it is sent
+app.add_middleware(EventStreamGZipMiddleware)
+
 
 # ============== Models ==============
 
@@ -99,6 +148,40 @@ class DebateRequest(BaseModel):
     model: str = "mini"
 
 
+# Query parameter types for the debate stream, validated by pydantic-core
+SetupName = Literal[tuple(SETUPS)]
+ModelName = Literal[tuple(MODELS)]
+
+
+class DebateEvent(BaseModel):
+    """One SSE event of a streamed debate (mirrors DebateEvent in ui/src/types.ts)."""
+    type: Literal[
+        "case", "setup", "agents", "phase", "status", "agent_thinking",
+        "agent_verdict", "debate_round", "agent_response", "final_verdict", "done",
+    ]
+    data: Any = None
+
+
+def sse_frame(event: DebateEvent) -> bytes:
+    """Encode an event as an SSE data frame."""
+    # to_json returns bytes, so frames skip the str -> utf-8 round trip
+    return b"data: " + to_json(event) + b"\n\n"
+
+
+def prebuilt_event(event_type: str, data=None):
+    """
+    Build an event whose payload never changes, serialized once up front.
+
+    With EventSourceResponse the result is a ServerSentEvent carrying the
+    finished JSON, so the router frames it without encoding it again. On
+    the StreamingResponse fallback it is the complete SSE frame as bytes.
+    """
+    event = DebateEvent(type=event_type, data=data)
+    if ServerSentEvent is None:
+        return sse_frame(event)
+    return ServerSentEvent(raw_data=to_json(event).decode("utf-8"))
+
+
 class CaseResponse(BaseModel):
     id: int
     name: str
@@ -107,421 +190,456 @@ class CaseResponse(BaseModel):
     truth: str
 
 
+# ============== Agent Rosters ==============
+# Fixed per paradigm, so the intro events are built once at import time
+
+BASELINE_AGENTS = (
+    {"name": "Investigator", "color": "#9B8BC8", "role": "Comprehensive fact-checking"},
+)
+
+ADVERSARIAL_AGENTS = (
+    {"name": "Proponent", "color": "#52c41a", "role": "Argues FOR faithfulness"},
+    {"name": "Opponent", "color": "#ff4d4f", "role": "Argues AGAINST faithfulness"},
+    {"name": "Judge", "color": "#5B4B8A", "role": "Neutral arbiter"},
+)
+
+JURY_AGENTS = (
+    {"name": "The Numerical Hawk", "color": "#1890ff", "role": "Numbers don't lie, but rounding can kill"},
+    {"name": "The Temporal Detective", "color": "#52c41a", "role": "In a pandemic, yesterday's truth is today's lie"},
+    {"name": "The Spirit Defender", "color": "#722ed1", "role": "Would a reasonable person be misled?"},
+    {"name": "The Harm Assessor", "color": "#eb2f96", "role": "Facts shape behavior"},
+    {"name": "The Devil's Advocate", "color": "#ff4d4f", "role": "ADVERSARIAL - stress-tests consensus"},
+)
+
+CRITIC_PROPOSER_AGENTS = (
+    {"name": "Proposer", "color": "#1890ff", "role": "Initial assessment"},
+    {"name": "Critic", "color": "#ff4d4f", "role": "Challenge & critique"},
+    {"name": "Synthesizer", "color": "#faad14", "role": "Reconcile views"},
+    {"name": "Judge", "color": "#5B4B8A", "role": "Final verdict"},
+)
+
+ADVERSARIAL_COLORS = {"Proponent": "#52c41a", "Opponent": "#ff4d4f"}
+
+JURY_COLORS = {
+    "The Numerical Hawk": "#1890ff",
+    "The Temporal Detective": "#52c41a",
+    "The Spirit-of-the-Law Defender": "#722ed1",
+    "The Harm Assessor": "#eb2f96",
+    "The Devil's Advocate": "#ff4d4f",
+}
+
+CRITIC_PROPOSER_COLORS = {"Proposer": "#1890ff", "Critic": "#ff4d4f", "Synthesizer": "#faad14"}
+
+DEFAULT_AGENT_COLOR = "#9B8BC8"
+
+BASELINE_AGENTS_EVENT = prebuilt_event("agents", BASELINE_AGENTS)
+ADVERSARIAL_AGENTS_EVENT = prebuilt_event("agents", ADVERSARIAL_AGENTS)
+JURY_AGENTS_EVENT = prebuilt_event("agents", JURY_AGENTS)
+CRITIC_PROPOSER_AGENTS_EVENT = prebuilt_event("agents", CRITIC_PROPOSER_AGENTS)
+
+
 # ============== Helpers ==============
 
+async def run_blocking(fn, *args, **kwargs):
+    """Run a blocking LLM call on the server's LLM thread pool."""
+    # Falls back to the default executor if the app was started without its lifespan
+    executor = getattr(app.state, "llm_executor", None)
+    return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+
+# Agents and synthesizers hold no per-debate state once built, so one
+# instance per (name, model) is shared by every debate
+@functools.lru_cache(maxsize=32)
+def get_agent(agent_name: str, model: str):
+    """Get the shared agent instance for a name and model."""
+    return AGENT_CLASSES[agent_name](model=model)
+
+
+@functools.lru_cache(maxsize=32)
+def get_synthesizer(strategy: str, model: str) -> VerdictSynthesizer:
+    """Get the shared synthesizer for a strategy and model."""
+    return VerdictSynthesizer(strategy=strategy, model=model)
+
+
 def create_agents(agent_names: list[str], model: str) -> list:
     """Create agent instances."""
-    return [AGENT_CLASSES[name](model=model) for name in agent_names]
+    return [get_agent(name, model) for name in agent_names]
 
 
-async def run_agent_analysis(agent, claim: str, truth: str):
-    """Run agent analysis in thread pool."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, agent.analyze, claim, truth)
+# Idle crews by (model, max_rounds). A crew's CrewAI agents are mutated while
+# a debate runs, so each crew serves one debate at a time and is returned to
+# the pool afterwards; the pool grows to the peak number of concurrent debates.
+_CREW_POOL: dict[tuple[str, int], list[FactCheckCrew]] = {}
+_CREW_POOL_LOCK = threading.Lock()
 
 
-async def run_agent_response(agent, verdicts, claim: str, truth: str):
-    """Run agent response in thread pool."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, agent.respond_to, verdicts, claim, truth)
+@contextmanager
+def checkout_crew(model: str, max_rounds: int):
+    """Borrow an idle FactCheckCrew for (model, max_rounds), building one if none is free."""
+    key = (model, max_rounds)
+    with _CREW_POOL_LOCK:
+        idle = _CREW_POOL.setdefault(key, [])
+        crew = idle.pop() if idle else None
+    if crew is None:
+        crew = FactCheckCrew(model=model, max_rounds=max_rounds)
+    try:
+        yield crew
+    finally:
+        with _CREW_POOL_LOCK:
+            _CREW_POOL[key].append(crew)
 
 
-async def run_synthesis(synthesizer, debate_result):
-    """Run verdict synthesis in thread pool."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, synthesizer.synthesize, debate_result)
+def run_crew(model: str, max_rounds: int, method: str, *args, **kwargs):
+    """Call a method on a pooled crew. Blocking; run it in a worker thread."""
+    with checkout_crew(model, max_rounds) as crew:
+        return getattr(crew, method)(*args, **kwargs)
 
 
 # ============== SSE Streaming ==============
 
-async def stream_debate(case: dict, setup_name: str, model_name: str) -> AsyncGenerator[str, None]:
-    """Stream debate events as Server-Sent Events."""
-    setup = SETUPS[setup_name]
-    model = MODELS[model_name]
-    paradigm = setup.get("paradigm", "baseline")
+DONE_EVENT = prebuilt_event("done")
 
-    def send_event(event_type: str, data) -> str:
-        return f"data: {json.dumps({'type': event_type, 'data': data})}\n\n"
 
-    # Send case info
-    yield send_event('case', case)
-    await asyncio.sleep(0.05)
+@functools.lru_cache(maxsize=1024)
+def _text_event(event_type: str, text: str):
+    return prebuilt_event(event_type, text)
 
-    # Send setup info
-    yield send_event('setup', {'name': setup_name, 'description': setup['description'], 'paradigm': paradigm})
-    await asyncio.sleep(0.05)
 
-    loop = asyncio.get_event_loop()
+@functools.lru_cache(maxsize=256)
+def _flat_event(event_type: str, items: tuple):
+    return prebuilt_event(event_type, dict(items))
 
-    # ============== PARADIGM: BASELINE (Single Agent) ==============
-    if paradigm == "baseline":
-        yield send_event('phase', 'Single Agent Analysis')
-        yield send_event('status', 'Analyzing claim...')
 
-        agent_info = [{"name": "Investigator", "color": "#9B8BC8", "role": "Comprehensive fact-checking"}]
-        yield send_event('agents', agent_info)
+def send_event(event_type: str, data) -> DebateEvent:
+    """Wrap one event of the debate stream."""
+    # Phase and status lines come from a small, fixed set of strings
+    if isinstance(data, str):
+        return _text_event(event_type, data)
+    # agent_thinking repeats the same name and color every round
+    if event_type == 'agent_thinking':
+        return _flat_event(event_type, tuple(data.items()))
+    return DebateEvent(type=event_type, data=data)
 
-        crew = FactCheckCrew(model=model, max_rounds=1)
-        result = await loop.run_in_executor(
-            None, crew.analyze, case["claim"], case["truth"], case["id"]
-        )
 
-        verdict = result.initial_verdicts[0]
+# ============== PARADIGM: BASELINE (Single Agent) ==============
+
+async def stream_baseline(case: dict, setup: dict, model: str) -> AsyncGenerator[DebateEvent, None]:
+    """Single agent baseline (CrewAI)."""
+    yield send_event('phase', 'Single Agent Analysis')
+    yield send_event('status', 'Analyzing claim...')
+
+    yield BASELINE_AGENTS_EVENT
+
+    result = await run_blocking(
+        run_crew, model, 1, "analyze", case["claim"], case["truth"], case["id"]
+    )
+
+    verdict = result.initial_verdicts[0]
+    yield send_event('agent_verdict', {
+        'agent_name': 'Investigator',
+        'color': '#9B8BC8',
+        'verdict': verdict.verdict,
+        'confidence': verdict.confidence,
+        'reasoning': verdict.reasoning,
+        'evidence': verdict.evidence
+    })
+
+    yield send_event('final_verdict', {
+        'verdict': result.final_verdict,
+        'confidence': result.final_confidence,
+        'reasoning': result.final_reasoning,
+        'mutation_type': result.mutation_type
+    })
+
+
+# ============== PARADIGM: ADVERSARIAL DEBATE ==============
+
+async def stream_adversarial(case: dict, setup: dict, model: str) -> AsyncGenerator[DebateEvent, None]:
+    """Proponent vs. opponent debate, settled by a judge."""
+    yield ADVERSARIAL_AGENTS_EVENT
+
+    yield send_event('phase', 'Phase 1: Opening Arguments')
+    yield send_event('agent_thinking', {'agent_name': 'Proponent', 'color': '#52c41a'})
+    yield send_event('status', 'Proponent building case for faithfulness...')
+
+    rounds = setup.get("rounds", 2)
+    result = await run_blocking(
+        run_crew, model, rounds, "run_debate", case["claim"], case["truth"], case["id"]
+    )
+
+    # Stream the adversarial verdicts
+    color_map = ADVERSARIAL_COLORS
+    for verdict in result.initial_verdicts:
         yield send_event('agent_verdict', {
-            'agent_name': 'Investigator',
-            'color': '#9B8BC8',
+            'agent_name': verdict.agent_name,
+            'color': color_map.get(verdict.agent_name, DEFAULT_AGENT_COLOR),
             'verdict': verdict.verdict,
             'confidence': verdict.confidence,
             'reasoning': verdict.reasoning,
             'evidence': verdict.evidence
         })
 
-        yield send_event('final_verdict', {
-            'verdict': result.final_verdict,
-            'confidence': result.final_confidence,
-            'reasoning': result.final_reasoning,
-            'mutation_type': result.mutation_type
-        })
+    if result.debate_rounds:
+        yield send_event('phase', 'Phase 2: Rebuttals')
+        yield send_event('status', 'Agents exchanging rebuttals...')
 
-    # ============== PARADIGM: ADVERSARIAL DEBATE ==============
-    elif paradigm == "adversarial":
-        agent_info = [
-            {"name": "Proponent", "color": "#52c41a", "role": "Argues FOR faithfulness"},
-            {"name": "Opponent", "color": "#ff4d4f", "role": "Argues AGAINST faithfulness"},
-            {"name": "Judge", "color": "#5B4B8A", "role": "Neutral arbiter"},
-        ]
-        yield send_event('agents', agent_info)
-        await asyncio.sleep(0.1)
-
-        yield send_event('phase', 'Phase 1: Opening Arguments')
-        yield send_event('agent_thinking', {'agent_name': 'Proponent', 'color': '#52c41a'})
-        yield send_event('status', 'Proponent building case for faithfulness...')
-        await asyncio.sleep(0.1)
-
-        rounds = setup.get("rounds", 2)
-        crew = FactCheckCrew(model=model, max_rounds=rounds)
-
-        result = await loop.run_in_executor(
-            None, crew.run_debate, case["claim"], case["truth"], case["id"]
-        )
+    yield send_event('phase', 'Phase 3: Judge Deliberation')
+    yield send_event('agent_thinking', {'agent_name': 'Judge', 'color': '#5B4B8A'})
 
-        # Stream the adversarial verdicts
-        color_map = {"Proponent": "#52c41a", "Opponent": "#ff4d4f"}
-        for verdict in result.initial_verdicts:
-            yield send_event('agent_verdict', {
-                'agent_name': verdict.agent_name,
-                'color': color_map.get(verdict.agent_name, "#9B8BC8"),
-                'verdict': verdict.verdict,
-                'confidence': verdict.confidence,
-                'reasoning': verdict.reasoning,
-                'evidence': verdict.evidence
-            })
-            await asyncio.sleep(0.1)
-
-        if result.debate_rounds:
-            yield send_event('phase', 'Phase 2: Rebuttals')
-            yield send_event('status', 'Agents exchanging rebuttals...')
-            await asyncio.sleep(0.1)
-
-        yield send_event('phase', 'Phase 3: Judge Deliberation')
-        yield send_event('agent_thinking', {'agent_name': 'Judge', 'color': '#5B4B8A'})
-        await asyncio.sleep(0.1)
-
-        yield send_event('final_verdict', {
-            'verdict': result.final_verdict,
-            'confidence': result.final_confidence,
-            'reasoning': result.final_reasoning,
-            'mutation_type': result.mutation_type,
-            'dissenting': result.dissenting_opinions
+    yield send_event('final_verdict', {
+        'verdict': result.final_verdict,
+        'confidence': result.final_confidence,
+        'reasoning': result.final_reasoning,
+        'mutation_type': result.mutation_type,
+        'dissenting': result.dissenting_opinions
+    })
+
+
+# ============== PARADIGM: JURY PANEL (6-Agent) ==============
+
+async def stream_jury(case: dict, setup: dict, model: str) -> AsyncGenerator[DebateEvent, None]:
+    """Jury panel debating until consensus."""
+    yield JURY_AGENTS_EVENT
+
+    yield send_event('phase', 'Phase 1: 6-Agent Tribunal Debate')
+
+    # Show thinking for each juror
+    for agent in JURY_AGENTS:
+        yield send_event('agent_thinking', {'agent_name': agent['name'], 'color': agent['color']})
+
+    yield send_event('status', '5 agents debating until 80% consensus (max 10 rounds)...')
+
+    result = await run_blocking(
+        run_crew, model, 10, "run_debate", case["claim"], case["truth"], case["id"]
+    )
+
+    # Stream individual verdicts
+    color_map = JURY_COLORS
+    for verdict in result.initial_verdicts:
+        yield send_event('agent_verdict', {
+            'agent_name': verdict.agent_name,
+            'color': color_map.get(verdict.agent_name, DEFAULT_AGENT_COLOR),
+            'verdict': verdict.verdict,
+            'confidence': verdict.confidence,
+            'reasoning': verdict.reasoning,
+            'evidence': verdict.evidence
         })
 
-    # ============== PARADIGM: JURY PANEL (6-Agent) ==============
-    elif paradigm == "jury":
-        agent_info = [
-            {"name": "The Numerical Hawk", "color": "#1890ff", "role": "Numbers don't lie, but rounding can kill"},
-            {"name": "The Temporal Detective", "color": "#52c41a", "role": "In a pandemic, yesterday's truth is today's lie"},
-            {"name": "The Spirit Defender", "color": "#722ed1", "role": "Would a reasonable person be misled?"},
-            {"name": "The Harm Assessor", "color": "#eb2f96", "role": "Facts shape behavior"},
-            {"name": "The Devil's Advocate", "color": "#ff4d4f", "role": "ADVERSARIAL - stress-tests consensus"},
-        ]
-        yield send_event('agents', agent_info)
-        await asyncio.sleep(0.1)
+    actual_rounds = len(result.debate_rounds) if result.debate_rounds else 1
+    yield send_event('phase', f'Synthesis Judge Verdict (after {actual_rounds} rounds)')
+    yield send_event('final_verdict', {
+        'verdict': result.final_verdict,
+        'confidence': result.final_confidence,
+        'reasoning': result.final_reasoning,
+        'mutation_type': result.mutation_type,
+        'dissenting': result.dissenting_opinions
+    })
 
-        yield send_event('phase', 'Phase 1: 6-Agent Tribunal Debate')
 
-        crew = FactCheckCrew(model=model, max_rounds=10)
+# ============== PARADIGM: CRITIC-PROPOSER-JUDGE ==============
 
-        # Show thinking for each juror
-        for agent in agent_info:
-            yield send_event('agent_thinking', {'agent_name': agent['name'], 'color': agent['color']})
-            await asyncio.sleep(0.05)
+async def stream_critic_proposer(case: dict, setup: dict, model: str) -> AsyncGenerator[DebateEvent, None]:
+    """Proposer, critic and synthesizer, then a judge."""
+    yield CRITIC_PROPOSER_AGENTS_EVENT
 
-        yield send_event('status', '5 agents debating until 80% consensus (max 10 rounds)...')
+    yield send_event('phase', 'Step 1: Proposer Assessment')
+    yield send_event('agent_thinking', {'agent_name': 'Proposer', 'color': '#1890ff'})
+    yield send_event('status', 'Proposer generating initial interpretation...')
 
-        result = await loop.run_in_executor(
-            None, crew.run_debate, case["claim"], case["truth"], case["id"]
-        )
+    result = await run_blocking(
+        run_crew, model, 3, "run_debate", case["claim"], case["truth"], case["id"]
+    )
 
-        # Stream individual verdicts
-        color_map = {
-            "The Numerical Hawk": "#1890ff",
-            "The Temporal Detective": "#52c41a",
-            "The Spirit-of-the-Law Defender": "#722ed1",
-            "The Harm Assessor": "#eb2f96",
-            "The Devil's Advocate": "#ff4d4f",
-        }
-        for verdict in result.initial_verdicts:
-            yield send_event('agent_verdict', {
-                'agent_name': verdict.agent_name,
-                'color': color_map.get(verdict.agent_name, "#9B8BC8"),
-                'verdict': verdict.verdict,
-                'confidence': verdict.confidence,
-                'reasoning': verdict.reasoning,
-                'evidence': verdict.evidence
-            })
-            await asyncio.sleep(0.1)
-
-        actual_rounds = len(result.debate_rounds) if result.debate_rounds else 1
-        yield send_event('phase', f'Synthesis Judge Verdict (after {actual_rounds} rounds)')
-        yield send_event('final_verdict', {
-            'verdict': result.final_verdict,
-            'confidence': result.final_confidence,
-            'reasoning': result.final_reasoning,
-            'mutation_type': result.mutation_type,
-            'dissenting': result.dissenting_opinions
+    # Stream each step
+    color_map = CRITIC_PROPOSER_COLORS
+    step_names = ["Proposer Assessment", "Critic Challenge", "Synthesizer Reconciliation"]
+
+    for i, verdict in enumerate(result.initial_verdicts):
+        if i == 1:
+            yield send_event('phase', 'Step 2: Critic Challenge')
+            yield send_event('agent_thinking', {'agent_name': 'Critic', 'color': '#ff4d4f'})
+        elif i == 2:
+            yield send_event('phase', 'Step 3: Synthesizer Reconciliation')
+            yield send_event('agent_thinking', {'agent_name': 'Synthesizer', 'color': '#faad14'})
+
+        yield send_event('agent_verdict', {
+            'agent_name': verdict.agent_name,
+            'color': color_map.get(verdict.agent_name, DEFAULT_AGENT_COLOR),
+            'verdict': verdict.verdict,
+            'confidence': verdict.confidence,
+            'reasoning': verdict.reasoning,
+            'evidence': verdict.evidence
         })
 
-    # ============== PARADIGM: CRITIC-PROPOSER-JUDGE ==============
-    elif paradigm == "critic-proposer":
-        agent_info = [
-            {"name": "Proposer", "color": "#1890ff", "role": "Initial assessment"},
-            {"name": "Critic", "color": "#ff4d4f", "role": "Challenge & critique"},
-            {"name": "Synthesizer", "color": "#faad14", "role": "Reconcile views"},
-            {"name": "Judge", "color": "#5B4B8A", "role": "Final verdict"},
-        ]
-        yield send_event('agents', agent_info)
-        await asyncio.sleep(0.1)
-
-        yield send_event('phase', 'Step 1: Proposer Assessment')
-        yield send_event('agent_thinking', {'agent_name': 'Proposer', 'color': '#1890ff'})
-        yield send_event('status', 'Proposer generating initial interpretation...')
-
-        crew = FactCheckCrew(model=model, max_rounds=3)
-
-        result = await loop.run_in_executor(
-            None, crew.run_debate, case["claim"], case["truth"], case["id"]
-        )
+    yield send_event('phase', 'Step 4: Judge Final Verdict')
+    yield send_event('agent_thinking', {'agent_name': 'Judge', 'color': '#5B4B8A'})
 
-        # Stream each step
-        color_map = {"Proposer": "#1890ff", "Critic": "#ff4d4f", "Synthesizer": "#faad14"}
-        step_names = ["Proposer Assessment", "Critic Challenge", "Synthesizer Reconciliation"]
+    yield send_event('final_verdict', {
+        'verdict': result.final_verdict,
+        'confidence': result.final_confidence,
+        'reasoning': result.final_reasoning,
+        'mutation_type': result.mutation_type,
+        'dissenting': result.dissenting_opinions
+    })
 
-        for i, verdict in enumerate(result.initial_verdicts):
-            if i == 1:
-                yield send_event('phase', 'Step 2: Critic Challenge')
-                yield send_event('agent_thinking', {'agent_name': 'Critic', 'color': '#ff4d4f'})
-            elif i == 2:
-                yield send_event('phase', 'Step 3: Synthesizer Reconciliation')
-                yield send_event('agent_thinking', {'agent_name': 'Synthesizer', 'color': '#faad14'})
 
-            yield send_event('agent_verdict', {
-                'agent_name': verdict.agent_name,
-                'color': color_map.get(verdict.agent_name, "#9B8BC8"),
-                'verdict': verdict.verdict,
-                'confidence': verdict.confidence,
-                'reasoning': verdict.reasoning,
-                'evidence': verdict.evidence
-            })
-            await asyncio.sleep(0.1)
-
-        yield send_event('phase', 'Step 4: Judge Final Verdict')
-        yield send_event('agent_thinking', {'agent_name': 'Judge', 'color': '#5B4B8A'})
-        await asyncio.sleep(0.1)
-
-        yield send_event('final_verdict', {
-            'verdict': result.final_verdict,
-            'confidence': result.final_confidence,
-            'reasoning': result.final_reasoning,
-            'mutation_type': result.mutation_type,
-            'dissenting': result.dissenting_opinions
+# ============== PARADIGM: ITERATIVE DEBATE (6-Agent) ==============
+
+async def stream_iterative(case: dict, setup: dict, model: str) -> AsyncGenerator[DebateEvent, None]:
+    """Multi-round debate streamed live from the crew's callbacks."""
+    yield JURY_AGENTS_EVENT
+
+    rounds = setup.get("rounds", 5)
+
+    yield send_event('status', f'6-AGENT DEBATE: 3-{rounds} rounds until 80% consensus...')
+    yield send_event('status', "Devil's Advocate will challenge any emerging consensus!")
+
+    color_map = JURY_COLORS
+
+    # The crew runs in a worker thread; its callbacks hand events to the
+    # event loop, so the stream awaits them without polling
+    loop = asyncio.get_running_loop()
+    event_queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(event_type: str, data):
+        loop.call_soon_threadsafe(event_queue.put_nowait, (event_type, data))
+
+    def on_round_start(round_num):
+        """Called when a new round starts."""
+        if round_num == 1:
+            emit('phase', 'Round 1: Initial Positions')
+        else:
+            emit('phase', f'Round {round_num}: Rebuttals')
+        emit('debate_round', round_num)
+
+    def on_agent_thinking(agent_name):
+        """Called when an agent starts thinking."""
+        emit('agent_thinking', {
+            'agent_name': agent_name,
+            'color': color_map.get(agent_name, DEFAULT_AGENT_COLOR)
         })
 
-    # ============== PARADIGM: ITERATIVE DEBATE (6-Agent) ==============
-    elif paradigm == "iterative":
-        import queue
-        import threading
-
-        agent_info = [
-            {"name": "The Numerical Hawk", "color": "#1890ff", "role": "Numbers don't lie, but rounding can kill"},
-            {"name": "The Temporal Detective", "color": "#52c41a", "role": "In a pandemic, yesterday's truth is today's lie"},
-            {"name": "The Spirit Defender", "color": "#722ed1", "role": "Would a reasonable person be misled?"},
-            {"name": "The Harm Assessor", "color": "#eb2f96", "role": "Facts shape behavior"},
-            {"name": "The Devil's Advocate", "color": "#ff4d4f", "role": "ADVERSARIAL - stress-tests consensus"},
-        ]
-        yield send_event('agents', agent_info)
-        await asyncio.sleep(0.1)
-
-        rounds = setup.get("rounds", 5)
-
-        yield send_event('status', f'6-AGENT DEBATE: 3-{rounds} rounds until 80% consensus...')
-        yield send_event('status', "Devil's Advocate will challenge any emerging consensus!")
-
-        color_map = {
-            "The Numerical Hawk": "#1890ff",
-            "The Temporal Detective": "#52c41a",
-            "The Spirit-of-the-Law Defender": "#722ed1",
-            "The Harm Assessor": "#eb2f96",
-            "The Devil's Advocate": "#ff4d4f",
-        }
-
-        # Use a queue to stream events from the background thread
-        event_queue = queue.Queue()
-        result_holder = [None]
-
-        current_round = [1]
-
-        def on_round_start(round_num):
-            """Called when a new round starts."""
-            if round_num == 1:
-                event_queue.put(('phase', 'Round 1: Initial Positions'))
-            else:
-                event_queue.put(('phase', f'Round {round_num}: Rebuttals'))
-            event_queue.put(('debate_round', round_num))
-
-        def on_agent_thinking(agent_name):
-            """Called when an agent starts thinking."""
-            event_queue.put(('agent_thinking', {
-                'agent_name': agent_name,
-                'color': color_map.get(agent_name, "#9B8BC8")
-            }))
-
-        def on_verdict(verdict):
-            """Called when each agent submits a verdict."""
-            event_queue.put(('agent_verdict', {
-                'agent_name': verdict.agent_name,
-                'color': color_map.get(verdict.agent_name, "#9B8BC8"),
-                'verdict': verdict.verdict,
-                'confidence': verdict.confidence,
-                'reasoning': verdict.reasoning,
-                'evidence': verdict.evidence
-            }))
+    def on_verdict(verdict):
+        """Called when each agent submits a verdict."""
+        emit('agent_verdict', {
+            'agent_name': verdict.agent_name,
+            'color': color_map.get(verdict.agent_name, DEFAULT_AGENT_COLOR),
+            'verdict': verdict.verdict,
+            'confidence': verdict.confidence,
+            'reasoning': verdict.reasoning,
+            'evidence': verdict.evidence
+        })
 
-        def on_round_complete(round_num, verdicts):
-            """Called when a round completes."""
-            event_queue.put(('round_complete', round_num))
+    def on_round_complete(round_num, verdicts):
+        """Called when a round completes."""
+        emit('status', f'Round {round_num} complete')
 
-        def run_debate():
-            crew = FactCheckCrew(model=model, max_rounds=rounds)
-            result_holder[0] = crew.run_debate(
+    def run_debate():
+        try:
+            return run_crew(
+                model, rounds, "run_debate",
                 case["claim"], case["truth"], case["id"],
                 on_verdict=on_verdict,
                 on_round_complete=on_round_complete,
                 on_agent_thinking=on_agent_thinking,
                 on_round_start=on_round_start
             )
-            event_queue.put(('done', None))
+        finally:
+            emit('done', None)
 
-        # Start debate in background thread
-        debate_thread = threading.Thread(target=run_debate)
-        debate_thread.start()
+    debate_task = asyncio.create_task(run_blocking(run_debate))
 
-        # Stream events as they come in
+    # Stream events as they come in. 'done' is emitted just before the worker
+    # returns, so only a stream closed early (client gone) cancels the debate
+    finished = False
+    try:
         while True:
-            try:
-                event_type, event_data = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: event_queue.get(timeout=0.5)
-                )
+            event_type, event_data = await event_queue.get()
+            if event_type == 'done':
+                finished = True
+                break
+            yield send_event(event_type, event_data)
+    finally:
+        if not finished:
+            debate_task.cancel()
+
+    # Re-raises anything the crew raised
+    result = await debate_task
+
+    actual_rounds = len(result.debate_rounds) if result.debate_rounds else 1
+    if actual_rounds < rounds:
+        yield send_event('status', f'Consensus reached after {actual_rounds} round(s)')
+    else:
+        yield send_event('status', f'Max rounds reached - taking majority vote')
 
-                if event_type == 'done':
-                    break
-                elif event_type == 'debate_round':
-                    yield send_event('debate_round', event_data)
-                elif event_type == 'agent_thinking':
-                    yield send_event('agent_thinking', event_data)
-                elif event_type == 'agent_verdict':
-                    yield send_event('agent_verdict', event_data)
-                elif event_type == 'round_complete':
-                    yield send_event('status', f'Round {event_data} complete')
-                elif event_type == 'phase':
-                    yield send_event('phase', event_data)
-
-                await asyncio.sleep(0.05)
-            except:
-                # Queue timeout - check if thread is still alive
-                if not debate_thread.is_alive():
-                    break
+    yield send_event('phase', 'Synthesis Judge Deliberation')
+    yield send_event('agent_thinking', {'agent_name': 'The Synthesis Judge', 'color': '#faad14'})
 
-        debate_thread.join()
-        result = result_holder[0]
+    yield send_event('final_verdict', {
+        'verdict': result.final_verdict,
+        'confidence': result.final_confidence,
+        'reasoning': result.final_reasoning,
+        'mutation_type': result.mutation_type,
+        'dissenting': result.dissenting_opinions
+    })
 
-        actual_rounds = len(result.debate_rounds) if result.debate_rounds else 1
-        if actual_rounds < rounds:
-            yield send_event('status', f'Consensus reached after {actual_rounds} round(s)')
-        else:
-            yield send_event('status', f'Max rounds reached - taking majority vote')
-
-        yield send_event('phase', 'Synthesis Judge Deliberation')
-        yield send_event('agent_thinking', {'agent_name': 'The Synthesis Judge', 'color': '#faad14'})
-        await asyncio.sleep(0.1)
-
-        yield send_event('final_verdict', {
-            'verdict': result.final_verdict,
-            'confidence': result.final_confidence,
-            'reasoning': result.final_reasoning,
-            'mutation_type': result.mutation_type,
-            'dissenting': result.dissenting_opinions
-        })
 
-    # ============== LEGACY: Non-CrewAI paths ==============
-    elif setup.get("mode") == "single":
-        # Original single agent baseline
-        yield send_event('phase', 'Single Agent Analysis')
-        yield send_event('status', 'Analyzing claim...')
+# ============== LEGACY: Non-CrewAI paths ==============
 
-        from debate.protocol import SingleAgentBaseline
-        baseline = SingleAgentBaseline(model=model)
+async def stream_single_agent(case: dict, setup: dict, model: str) -> AsyncGenerator[DebateEvent, None]:
+    """Legacy single agent baseline (non-CrewAI)."""
+    # Original single agent baseline
+    yield send_event('phase', 'Single Agent Analysis')
+    yield send_event('status', 'Analyzing claim...')
 
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, baseline.analyze, case["claim"], case["truth"], case["id"]
-        )
+    baseline = SingleAgentBaseline(model=model)
 
-        verdict = result.initial_verdicts[0]
-        yield send_event('agent_verdict', {
-            'agent_name': 'Single Agent',
-            'color': 'gold',
-            'verdict': verdict.verdict,
-            'confidence': verdict.confidence,
-            'reasoning': verdict.reasoning,
-            'evidence': verdict.evidence
-        })
+    result = await run_blocking(
+        baseline.analyze, case["claim"], case["truth"], case["id"]
+    )
 
-        yield send_event('final_verdict', {
-            'verdict': verdict.verdict,
-            'confidence': verdict.confidence,
-            'reasoning': verdict.reasoning,
-            'mutation_type': None
-        })
+    verdict = result.initial_verdicts[0]
+    yield send_event('agent_verdict', {
+        'agent_name': 'Single Agent',
+        'color': 'gold',
+        'verdict': verdict.verdict,
+        'confidence': verdict.confidence,
+        'reasoning': verdict.reasoning,
+        'evidence': verdict.evidence
+    })
 
-    else:
-        # Original multi-agent jury
-        agents = create_agents(setup["agents"], model)
+    yield send_event('final_verdict', {
+        'verdict': verdict.verdict,
+        'confidence': verdict.confidence,
+        'reasoning': verdict.reasoning,
+        'mutation_type': None
+    })
+
+
+async def stream_agent_jury(case: dict, setup: dict, model: str) -> AsyncGenerator[DebateEvent, None]:
+    """Legacy multi-agent jury with optional deliberation (non-CrewAI)."""
+    # Original multi-agent jury
+    agents = create_agents(setup["agents"], model)
 
-        # Send agent intro
-        agent_info = [{"name": a.name, "color": a.color, "role": a.role_description} for a in agents]
-        yield send_event('agents', agent_info)
-        await asyncio.sleep(0.1)
+    # Send agent intro
+    agent_info = [{"name": a.name, "color": a.color, "role": a.role_description} for a in agents]
+    yield send_event('agents', agent_info)
 
-        # Phase 1: Independent Analysis
-        yield send_event('phase', 'Phase 1: Independent Analysis')
-        await asyncio.sleep(0.1)
+    # Phase 1: Independent Analysis
+    yield send_event('phase', 'Phase 1: Independent Analysis')
 
-        verdicts = []
-        for agent in agents:
-            yield send_event('agent_thinking', {'agent_name': agent.name, 'color': agent.color})
+    # All agents analyze at once; verdicts stream in as they finish
+    for agent in agents:
+        yield send_event('agent_thinking', {'agent_name': agent.name, 'color': agent.color})
 
-            verdict = await run_agent_analysis(agent, case["claim"], case["truth"])
-            verdicts.append(verdict)
+    async def analyze(agent):
+        return agent, await run_blocking(agent.analyze, case["claim"], case["truth"])
+
+    tasks = [asyncio.create_task(analyze(agent)) for agent in agents]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            agent, verdict = await next_done
 
             yield send_event('agent_verdict', {
                 'agent_name': verdict.agent_name,
@@ -531,53 +649,188 @@ async def stream_debate(case: dict, setup_name: str, model_name: str) -> AsyncGe
                 'reasoning': verdict.reasoning,
                 'evidence': verdict.evidence
             })
-            await asyncio.sleep(0.1)
-
-        # Phase 2: Deliberation (if enabled)
-        if setup["mode"] == "deliberation" and setup.get("rounds", 0) > 0:
-            yield send_event('phase', 'Phase 2: Deliberation')
-            await asyncio.sleep(0.1)
-
-            for round_num in range(1, setup.get("rounds", 1) + 1):
-                yield send_event('debate_round', round_num)
-
-                for agent in agents:
-                    yield send_event('agent_thinking', {'agent_name': agent.name, 'color': agent.color})
-
-                    response = await run_agent_response(agent, verdicts, case["claim"], case["truth"])
-
-                    yield send_event('agent_response', {
-                        'agent_name': agent.name,
-                        'color': agent.color,
-                        'response': response
-                    })
-                    await asyncio.sleep(0.1)
-
-        # Phase 3: Synthesis
-        yield send_event('phase', 'Phase 3: Verdict Synthesis')
-        yield send_event('status', 'Judge synthesizing final verdict...')
-        await asyncio.sleep(0.1)
-
-        debate_result = DebateResult(
-            case_id=case["id"],
-            claim=case["claim"],
-            truth=case["truth"],
-            initial_verdicts=verdicts,
-            debate_rounds=[]
-        )
+    finally:
+        for task in tasks:
+            task.cancel()
 
-        synthesizer = VerdictSynthesizer(strategy=setup["synthesis"], model=model)
-        final = await run_synthesis(synthesizer, debate_result)
+    # Synthesis and deliberation see verdicts in agent order
+    verdicts = [task.result()[1] for task in tasks]
 
-        yield send_event('final_verdict', {
-            'verdict': final.verdict,
-            'confidence': final.confidence,
-            'reasoning': final.reasoning,
-            'mutation_type': final.mutation_type,
-            'dissenting': final.dissenting_opinions
-        })
+    # Phase 2: Deliberation (if enabled)
+    if setup["mode"] == "deliberation" and setup.get("rounds", 0) > 0:
+        yield send_event('phase', 'Phase 2: Deliberation')
+
+        others = format_other_verdicts(verdicts)
+
+        for round_num in range(1, setup.get("rounds", 1) + 1):
+            yield send_event('debate_round', round_num)
+
+            for agent in agents:
+                yield send_event('agent_thinking', {'agent_name': agent.name, 'color': agent.color})
+
+                response = await run_blocking(
+                    agent.respond_to, others[agent.name], case["claim"], case["truth"]
+                )
+
+                yield send_event('agent_response', {
+                    'agent_name': agent.name,
+                    'color': agent.color,
+                    'response': response
+                })
+
+    # Phase 3: Synthesis
+    yield send_event('phase', 'Phase 3: Verdict Synthesis')
+    yield send_event('status', 'Judge synthesizing final verdict...')
+
+    debate_result = DebateResult(
+        case_id=case["id"],
+        claim=case["claim"],
+        truth=case["truth"],
+        initial_verdicts=verdicts,
+        debate_rounds=[]
+    )
+
+    synthesizer = get_synthesizer(setup["synthesis"], model)
+    final = await run_blocking(synthesizer.synthesize, debate_result)
+
+    yield send_event('final_verdict', {
+        'verdict': final.verdict,
+        'confidence': final.confidence,
+        'reasoning': final.reasoning,
+        'mutation_type': final.mutation_type,
+        'dissenting': final.dissenting_opinions
+    })
+
+
+# Paradigm -> handler; setups without a known paradigm fall back to the legacy paths
+PARADIGM_HANDLERS = {
+    "baseline": stream_baseline,
+    "adversarial": stream_adversarial,
+    "jury": stream_jury,
+    "critic-proposer": stream_critic_proposer,
+    "iterative": stream_iterative,
+}
+
+
+async def stream_debate(case: dict, setup_name: str, model_name: str) -> AsyncGenerator[DebateEvent, None]:
+    """Stream debate events; serialized to SSE frames by the endpoint."""
+    setup = SETUPS[setup_name]
+    model = MODELS[model_name]
+    paradigm = setup.get("paradigm", "baseline")
+
+    handler = PARADIGM_HANDLERS.get(paradigm)
+    if handler is None:
+        handler = stream_single_agent if setup.get("mode") == "single" else stream_agent_jury
+
+    # Send case info
+    yield send_event('case', case)
+
+    # Send setup info
+    yield send_event('setup', {'name': setup_name, 'description': setup['description'], 'paradigm': paradigm})
+
+    # aclosing() runs the handler's cleanup as soon as the client disconnects
+    async with aclosing(handler(case, setup, model)) as events:
+        async for event in events:
+            yield event
+
+    yield DONE_EVENT
 
-    yield send_event('done', None)
+
+# Cases are fixed, so a finished debate for (case, setup, model) is replayed
+# from its recorded events instead of re-running the LLM pipeline
+DEBATE_CACHE = ResponseCache(maxsize=DEBATE_CACHE_SIZE)
+
+
+async def cached_stream_debate(case: dict, setup_name: str, model_name: str) -> AsyncGenerator[DebateEvent, None]:
+    """Replay a cached debate, or stream a live one and record it once it completes."""
+    cache_key = ResponseCache.key({"case_id": case["id"], "setup": setup_name, "model": model_name})
+    cached = DEBATE_CACHE.get(cache_key)
+    if cached is not None:
+        for event in cached:
+            yield event
+        return
+
+    events = []
+    async for event in stream_debate(case, setup_name, model_name):
+        events.append(event)
+        yield event
+
+    # Only debates that ran to completion are replayable
+    if events and events[-1] is DONE_EVENT:
+        DEBATE_CACHE.put(cache_key, tuple(events))
+
+
+SSE_PING = b": ping\n\n"
+
+
+async def coalesce_frames(
+    frames: AsyncIterable[bytes],
+    max_bytes: int = 8192,
+    ping_interval: float = 15.0
+) -> AsyncGenerator[bytes, None]:
+    """
+    Merge SSE frames that are already waiting into one response chunk.
+
+    Frames are pulled ahead by a background task while the previous chunk is
+    being written, so a slow client (or a cache replay) gets a few large
+    writes instead of one per event. A frame is never held back waiting for
+    more, so live events are not delayed. While the debate is idle (e.g. a
+    long LLM call), a keep-alive comment is sent every ping_interval seconds
+    so proxies do not drop the connection, matching EventSourceResponse.
+
+    Args:
+        frames: Complete SSE frames, each ending in a blank line
+        max_bytes: Flush once a merged chunk reaches this size
+        ping_interval: Seconds of silence before a keep-alive comment
+
+    Returns:
+        Async generator of merged chunks
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump():
+        try:
+            async for frame in frames:
+                queue.put_nowait(frame)
+        except Exception as e:
+            queue.put_nowait(e)
+        else:
+            queue.put_nowait(None)
+
+    pump_task = asyncio.create_task(pump())
+    getter = None
+    try:
+        finished = False
+        while not finished:
+            # Keep the same pending get() across pings so no frame is lost
+            getter = getter or asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter}, timeout=ping_interval)
+            if not done:
+                yield SSE_PING
+                continue
+            item = getter.result()
+            getter = None
+
+            chunk = bytearray()
+            error = None
+            while True:
+                if item is None or isinstance(item, Exception):
+                    finished = True
+                    error = item
+                    break
+                chunk += item
+                if len(chunk) >= max_bytes or queue.empty():
+                    break
+                item = queue.get_nowait()
+
+            if chunk:
+                yield bytes(chunk)
+            if error is not None:
+                raise error
+    finally:
+        pump_task.cancel()
+        if getter is not None:
+            getter.cancel()
 
 
 # ============== API Endpoints ==============
@@ -585,100 +838,107 @@ async def stream_debate(case: dict, setup_name: str, model_name: str) -> AsyncGe
 @app.get("/")
 async def root():
     """Health check and API info."""
-    return {
-        "name": "FactTrace API",
-        "version": "1.0.0",
-        "description": "Multi-Agent Fact Verification System",
-        "endpoints": {
-            "cases": "/api/cases",
-            "setups": "/api/setups",
-            "debate_stream": "/api/debate/stream?case_id=1&setup=jury-llm&model=mini"
-        }
-    }
+    return Response(ROOT_JSON, media_type="application/json")
 
 
 @app.get("/api/cases")
 async def get_cases():
     """Get all available test cases."""
-    return {"cases": CASES, "count": len(CASES)}
+    return Response(CASES_JSON, media_type="application/json")
 
 
 @app.get("/api/cases/{case_id}")
 async def get_case(case_id: int):
     """Get a specific case by ID."""
-    case = next((c for c in CASES if c["id"] == case_id), None)
-    if not case:
+    case_json = CASE_JSON_BY_ID.get(case_id)
+    if case_json is None:
         raise HTTPException(status_code=404, detail=f"Case {case_id} not found")
-    return case
+    return Response(case_json, media_type="application/json")
 
 
 @app.get("/api/setups")
 async def get_setups():
     """Get all available debate setups."""
-    return {
-        "setups": {k: {"name": k, **v} for k, v in SETUPS.items()},
-        "default": "crew-jury"
-    }
+    return Response(SETUPS_JSON, media_type="application/json")
 
 
 @app.get("/api/models")
 async def get_models():
     """Get available models."""
-    return {"models": MODELS, "default": "mini"}
+    return Response(MODELS_JSON, media_type="application/json")
 
 
-@app.get("/api/debate/stream")
-async def stream_debate_endpoint(
+def debate_params(
     case_id: int,
-    setup: str = "jury-llm",
-    model: str = "mini"
-):
+    setup: SetupName = DEFAULT_SETUP,
+    model: ModelName = DEFAULT_MODEL
+) -> tuple[dict, str, str]:
     """
-    Stream a debate as Server-Sent Events.
+    Validate the debate stream's query parameters.
 
-    Watch the jury deliberate in real-time!
+    Runs as a dependency so errors are returned as HTTP errors before the
+    event stream starts. Unknown setups and models are rejected with a 422
+    by the Literal types; only the case lookup is done here.
     """
-    # Validate case
-    case = next((c for c in CASES if c["id"] == case_id), None)
+    case = CASES_BY_ID.get(case_id)
     if not case:
         raise HTTPException(status_code=404, detail=f"Case {case_id} not found")
 
-    # Validate setup
-    if setup not in SETUPS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid setup '{setup}'. Available: {list(SETUPS.keys())}"
-        )
-
-    # Validate model
-    if model not in MODELS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid model '{model}'. Available: {list(MODELS.keys())}"
+    return case, setup, model
+
+
+if EventSourceResponse is not None:
+    @app.get("/api/debate/stream", response_class=EventSourceResponse)
+    async def stream_debate_endpoint(
+        params: tuple[dict, str, str] = Depends(debate_params)
+    ) -> AsyncIterable[DebateEvent]:
+        """
+        Stream a debate as Server-Sent Events.
+
+        Watch the jury deliberate in real-time!
+        """
+        async for event in cached_stream_debate(*params):
+            yield event
+else:
+    @app.get("/api/debate/stream")
+    async def stream_debate_endpoint(params: tuple[dict, str, str] = Depends(debate_params)):
+        """
+        Stream a debate as Server-Sent Events.
+
+        Watch the jury deliberate in real-time!
+        """
+        async def frames():
+            async for event in cached_stream_debate(*params):
+                # Prebuilt events are already framed
+                yield event if isinstance(event, bytes) else sse_frame(event)
+
+        return StreamingResponse(
+            coalesce_frames(frames()),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            }
         )
 
-    return StreamingResponse(
-        stream_debate(case, setup, model),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        }
-    )
-
 
 # ============== Run Server ==============
 
 def main():
-    """Run the server."""
+    """Run the server (from the facttrace directory: python -m api.server)."""
     import uvicorn
+    # uvicorn[standard] provides uvloop and the httptools parser; "auto" falls
+    # back to asyncio and h11 if they are not installed
     uvicorn.run(
         "api.server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        reload_dirs=[str(Path(__file__).parent.parent)]
+        loop="auto",
+        http="auto",
+        workers=SERVER_WORKERS,
+        reload=SERVER_RELOAD,
+        reload_dirs=[str(Path(__file__).parent.parent)] if SERVER_RELOAD else None
     )
 
 
@@ -8,6 +8,53 @@ load_dotenv()
 # API Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Rate limits for concurrent (async) LLM requests - match your OpenAI account tier
+MAX_CONCURRENT_REQUESTS = int(os.getenv("FACTTRACE_MAX_CONCURRENT_REQUESTS", "16"))
+MAX_REQUESTS_PER_MINUTE = float(os.getenv("FACTTRACE_MAX_REQUESTS_PER_MINUTE", "500"))
+MAX_TOKENS_PER_MINUTE = float(os.getenv("FACTTRACE_MAX_TOKENS_PER_MINUTE", "200000"))
+
+# Consecutive failed requests (after retries) that trip the circuit breaker,
+# and how long requests then fail fast before the provider is tried again
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("FACTTRACE_BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("FACTTRACE_BREAKER_RESET_SECONDS", "30"))
+
+# Per-request timeout (seconds) for OpenAI calls; a straggler past it is
+# abandoned and retried instead of stalling the whole debate round
+REQUEST_TIMEOUT = float(os.getenv("FACTTRACE_REQUEST_TIMEOUT", "30"))
+
+# Seconds an idle connection to the API stays open for reuse, so later
+# debate rounds skip the TCP and TLS handshakes
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("FACTTRACE_HTTP_KEEPALIVE_SECONDS", "60"))
+
+# Worker threads for blocking LLM calls in the API server
+THREAD_POOL_SIZE = int(os.getenv("FACTTRACE_THREAD_POOL_SIZE", "64"))
+
+# API server processes (falls back to the conventional WEB_CONCURRENCY);
+# auto-reload is for development and runs a single worker
+SERVER_WORKERS = int(os.getenv("FACTTRACE_SERVER_WORKERS", os.getenv("WEB_CONCURRENCY", "1")))
+SERVER_RELOAD = os.getenv("FACTTRACE_SERVER_RELOAD", "0") == "1"
+
+# Max cached responses for deterministic agents (BaseAgent(deterministic=True))
+RESPONSE_CACHE_SIZE = int(os.getenv("FACTTRACE_RESPONSE_CACHE_SIZE", "4096"))
+
+# Directory where deterministic agents' responses also persist across runs,
+# one file per request hash; unset keeps the cache in memory only
+RESPONSE_CACHE_DIR = os.getenv("FACTTRACE_RESPONSE_CACHE_DIR") or None
+
+# Directory where run_all_setups keeps each finished (case, setup) result,
+# so repeated experiment runs only execute what changed
+RUN_CACHE_DIR = os.getenv("FACTTRACE_RUN_CACHE_DIR", ".facttrace_cache")
+
+# Max characters of each agent's reasoning saved in run_all_setups results,
+# cut at a sentence boundary; 0 keeps it in full
+PERSISTED_REASONING_CHARS = int(os.getenv("FACTTRACE_PERSISTED_REASONING_CHARS", "2000"))
+
+# Max finished debates kept for replay by the API server, keyed by (case, setup, model); 0 disables
+DEBATE_CACHE_SIZE = int(os.getenv("FACTTRACE_DEBATE_CACHE_SIZE", "256"))
+
+# Max finished crew debates kept for reuse, keyed by (claim, truth, model, rounds); 0 disables
+CREW_RESULT_CACHE_SIZE = int(os.getenv("FACTTRACE_CREW_RESULT_CACHE_SIZE", "1024"))
+
 # Model Configuration
 MODELS = {
     "mini": "gpt-4.1-mini",   # Development/testing
@@ -2,7 +2,6 @@
 
 from debate.protocol import DebateProtocol, SingleAgentBaseline, DebateResult, DebateRound
 from debate.verdict import VerdictSynthesizer, FinalVerdict
-from debate.crew import FactCheckCrew, CrewDebateResult
 
 __all__ = [
     # Original protocol
@@ -16,3 +15,11 @@ __all__ = [
     "FactCheckCrew",
     "CrewDebateResult",
 ]
+
+
+def __getattr__(name: str):
+    # CrewAI is slow to import, so the crew module loads on first use only
+    if name in ("FactCheckCrew", "CrewDebateResult"):
+        from debate import crew
+        return getattr(crew, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,26 +9,38 @@ Implements the 6-agent jury panel debate:
 6. The Synthesis Judge - Summarizes and forces final verdict
 """
 
+import asyncio
+import functools
 import json
 import re
-from typing import Optional, Callable
-from dataclasses import dataclass, field
+from collections import Counter
+from typing import Literal, Optional, Callable
+from dataclasses import dataclass, field, replace
 
-from crewai import Agent, Task, Crew, Process
+from crewai import Agent, Task, Crew, CrewOutput, Process
+from pydantic import BaseModel
 from crewai.llm import LLM
 
-from config import OPENAI_API_KEY
-from agents.base_agent import AgentVerdict
+from config import CREW_RESULT_CACHE_SIZE, OPENAI_API_KEY, MAX_CONCURRENT_REQUESTS, REQUEST_TIMEOUT
+from agents.base_agent import BATCH_ANALYZE_INSTRUCTIONS, VERDICT_SCHEMA, AgentVerdict, BaseAgent, get_client, run_blocking
+from agents.batch_api import run_chat_batch
+from agents.request_pool import TRANSIENT_ERRORS, CircuitOpenError
+from agents.response_cache import ResponseCache
+from debate.protocol import DebateResult, SingleAgentBaseline
 
 
-@dataclass
+# (round number, that round's verdicts)
+DebateRoundRecord = tuple[int, tuple[AgentVerdict, ...]]
+
+
+@dataclass(slots=True)
 class CrewDebateResult:
     """Result from a CrewAI debate session."""
     case_id: int
     claim: str
     truth: str
     initial_verdicts: list[AgentVerdict]
-    debate_rounds: list = field(default_factory=list)
+    debate_rounds: list[DebateRoundRecord] = field(default_factory=list)
     final_verdict: Optional[str] = None
     final_confidence: float = 0.0
     final_reasoning: str = ""
@@ -38,6 +50,16 @@ class CrewDebateResult:
 
 # ============== Agent Factory Functions ==============
 
+# Completion budget for the judge's ruling; bounds worst-case decode time
+JUDGE_MAX_TOKENS = 800
+
+
+@functools.lru_cache(maxsize=8)
+def get_llm(model: str, max_tokens: Optional[int] = None) -> LLM:
+    """Shared LLM client for a model, so every agent uses one connection pool."""
+    return LLM(model=model, api_key=OPENAI_API_KEY, max_tokens=max_tokens, timeout=REQUEST_TIMEOUT)
+
+
 def create_numerical_hawk_agent(model: str) -> Agent:
     """The Numerical Hawk - Obsesses over quantitative precision."""
     return Agent(
@@ -66,7 +88,7 @@ YOU ARE PEDANTIC ABOUT:
 CATCHPHRASE: "Numbers don't lie, but rounding can kill."
 
 Be confrontational about numerical errors. Small errors compound into big lies.""",
-        llm=LLM(model=model, api_key=OPENAI_API_KEY),
+        llm=get_llm(model),
         verbose=False,
         allow_delegation=False,
     )
@@ -100,7 +122,7 @@ YOU ARE PEDANTIC ABOUT:
 CATCHPHRASE: "In a pandemic, yesterday's truth is today's lie."
 
 Time is sacred. Call out EVERY temporal shift.""",
-        llm=LLM(model=model, api_key=OPENAI_API_KEY),
+        llm=get_llm(model),
         verbose=False,
         allow_delegation=False,
     )
@@ -135,7 +157,7 @@ YOUR STANDARDS:
 CATCHPHRASE: "Would a reasonable person be misled? That's the only question."
 
 Push back against excessive pedantry while maintaining honesty.""",
-        llm=LLM(model=model, api_key=OPENAI_API_KEY),
+        llm=get_llm(model),
         verbose=False,
         allow_delegation=False,
     )
@@ -175,7 +197,7 @@ YOU BREAK TIES based on potential real-world impact.
 CATCHPHRASE: "Facts don't exist in a vacuum—they shape behavior."
 
 Be the ethical compass. Evaluate consequences, not just accuracy.""",
-        llm=LLM(model=model, api_key=OPENAI_API_KEY),
+        llm=get_llm(model),
         verbose=False,
         allow_delegation=False,
     )
@@ -213,7 +235,7 @@ YOUR PURPOSE:
 CATCHPHRASE: "You're all agreeing too fast. What are you missing?"
 
 Be provocative. Be challenging. Make this a REAL debate.""",
-        llm=LLM(model=model, api_key=OPENAI_API_KEY),
+        llm=get_llm(model),
         verbose=False,
         allow_delegation=False,
     )
@@ -258,7 +280,7 @@ YOUR VERDICT MUST:
 CATCHPHRASE: "Truth is not found in any single perspective, but in the cybernetic dance between them."
 
 Your verdict reflects not just accuracy, but WISDOM—the integration of multiple valid epistemologies.""",
-        llm=LLM(model=model, api_key=OPENAI_API_KEY),
+        llm=get_llm(model, max_tokens=JUDGE_MAX_TOKENS),
         verbose=False,
         allow_delegation=False,
     )
@@ -266,12 +288,46 @@ Your verdict reflects not just accuracy, but WISDOM—the integration of multipl
 
 # ============== Parsing Utilities ==============
 
+_DECODER = json.JSONDecoder()
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s")
+
+
+def _first_sentence(text: str, limit: int = 80) -> str:
+    """Return the first sentence of text, cut to limit characters."""
+    sentence = _SENTENCE_END_RE.split(text.strip(), maxsplit=1)[0]
+    return sentence if len(sentence) <= limit else sentence[:limit - 3] + "..."
+
+
+# First verdict word in unparseable output; case-insensitive, so no lowered copy
+_VERDICT_WORD_RE = re.compile(r"\b(faithful|mutation)\b", re.IGNORECASE)
+
+
+def _fallback_verdict(output: str) -> str:
+    """Verdict named first in free text, or "uncertain" if there is none."""
+    match = _VERDICT_WORD_RE.search(output)
+    return match.group(1).lower() if match else "uncertain"
+
+
+def _format_position(v: AgentVerdict) -> str:
+    """A debater's final position, as listed for the Synthesis Judge."""
+    return f"**{v.agent_name}** votes '{v.verdict}' ({v.confidence:.0%} confidence):\n{v.reasoning}"
+
+
+def _first_json_object(output: str) -> Optional[dict]:
+    """Decode the JSON object starting at the first '{' in one pass, ignoring trailing text."""
+    start = output.find("{")
+    if start == -1:
+        return None
+    data, _ = _DECODER.raw_decode(output, start)
+    return data if isinstance(data, dict) else None
+
+
 def parse_verdict_from_output(output: str, agent_name: str) -> AgentVerdict:
     """Parse an agent's output into an AgentVerdict."""
     try:
-        json_match = re.search(r'\{[\s\S]*\}', output)
-        if json_match:
-            data = json.loads(json_match.group())
+        data = _first_json_object(output)
+        if data is not None:
             return AgentVerdict(
                 agent_name=agent_name,
                 verdict=data.get("verdict", "uncertain").lower(),
@@ -279,50 +335,42 @@ def parse_verdict_from_output(output: str, agent_name: str) -> AgentVerdict:
                 reasoning=data.get("reasoning", "No reasoning provided"),
                 evidence=data.get("evidence", [])
             )
-    except (json.JSONDecodeError, KeyError, ValueError):
+    except (KeyError, ValueError, AttributeError):
         pass
 
     # Fallback parsing
-    verdict = "uncertain"
-    if "faithful" in output.lower():
-        verdict = "faithful"
-    elif "mutation" in output.lower():
-        verdict = "mutation"
-
     return AgentVerdict(
         agent_name=agent_name,
-        verdict=verdict,
+        verdict=_fallback_verdict(output),
         confidence=0.5,
         reasoning=output[:500] if output else "No response",
         evidence=[]
     )
 
 
+def _final_from_data(data: dict) -> dict:
+    """Normalize the judge's decoded verdict object."""
+    return {
+        "verdict": data.get("verdict", "uncertain").lower(),
+        "confidence": float(data.get("confidence", 0.5)),
+        "reasoning": data.get("reasoning", "No reasoning provided"),
+        "mutation_type": data.get("mutation_type") if data.get("mutation_type") != "null" else None,
+        "dissenting_opinions": data.get("dissenting_opinions", [])
+    }
+
+
 def parse_final_verdict(output: str) -> dict:
     """Parse the judge's final verdict output."""
     try:
-        json_match = re.search(r'\{[\s\S]*\}', output)
-        if json_match:
-            data = json.loads(json_match.group())
-            return {
-                "verdict": data.get("verdict", "uncertain").lower(),
-                "confidence": float(data.get("confidence", 0.5)),
-                "reasoning": data.get("reasoning", "No reasoning provided"),
-                "mutation_type": data.get("mutation_type"),
-                "dissenting_opinions": data.get("dissenting_opinions", [])
-            }
-    except (json.JSONDecodeError, KeyError, ValueError):
+        data = _first_json_object(output)
+        if data is not None:
+            return _final_from_data(data)
+    except (KeyError, ValueError, AttributeError):
         pass
 
     # Fallback
-    verdict = "uncertain"
-    if "faithful" in output.lower():
-        verdict = "faithful"
-    elif "mutation" in output.lower():
-        verdict = "mutation"
-
     return {
-        "verdict": verdict,
+        "verdict": _fallback_verdict(output),
         "confidence": 0.5,
         "reasoning": output[:500] if output else "No reasoning",
         "mutation_type": None,
@@ -330,8 +378,204 @@ def parse_final_verdict(output: str) -> dict:
     }
 
 
+def _crew_final_verdict(result: CrewOutput) -> dict:
+    """
+    Read the judge's ruling from its CrewOutput.
+
+    Uses CrewAI's already-decoded json_dict when there is one, and otherwise
+    parses .raw - never str(result), which renders json_dict as a Python
+    repr rather than JSON.
+    """
+    if isinstance(result.json_dict, dict):
+        try:
+            return _final_from_data(result.json_dict)
+        except (KeyError, ValueError, AttributeError):
+            pass
+    return parse_final_verdict(result.raw)
+
+
 # ============== 6-AGENT DEBATE CREW ==============
 
+# Share of agents that must agree for the debate to stop early
+CONSENSUS_THRESHOLD = 0.8
+
+# Mean confidence above which a unanimous panel skips the Synthesis Judge
+UNANIMOUS_CONFIDENCE = 0.85
+
+# Reasoning recorded for a verdict taken before its reasoning was generated
+QUICK_VERDICT_REASONING = "<streamed, truncated>"
+
+# Minimum confidence of every agent in a unanimous first round for the
+# debate to use FactCheckCrew.confident_min_rounds
+CONFIDENT_AGREEMENT = 0.9
+
+# Finished debates by (claim, truth, crew configuration), so reprocessed
+# cases cost no LLM calls
+_RESULT_CACHE = ResponseCache(CREW_RESULT_CACHE_SIZE)
+
+
+# ============== Task Templates ==============
+
+# Case text first and round-specific instructions last, so every round of a
+# case shares one prompt prefix after the agent's (static) backstory and the
+# provider's automatic prefix caching can reuse it
+DEBATER_TASK_TEMPLATE = """SOURCE TRUTH:
+{truth}
+
+CLAIM:
+{claim}
+
+{instructions}"""
+
+FIRST_ROUND_INSTRUCTIONS = """Analyze whether this CLAIM faithfully represents the SOURCE.
+Provide your INDEPENDENT assessment. Focus on your area of expertise."""
+
+LATER_ROUND_INSTRUCTIONS = """Continue the investigation. Review your colleagues' assessments:
+
+{context}
+
+Consider their arguments. Respond to points you agree or disagree with.
+Have they raised valid concerns you missed? Do you want to update your assessment?"""
+
+
+DEBATER_OUTPUT_FORMAT = """A JSON object:
+{
+    "verdict": "faithful" | "mutation" | "uncertain",
+    "confidence": <float 0.0-1.0>,
+    "reasoning": "<your reasoning>",
+    "evidence": ["<point 1>", "<point 2>", ...]
+}"""
+
+JUDGE_OUTPUT_FORMAT = """A JSON object:
+{
+    "verdict": "faithful" | "mutation",
+    "confidence": <float 0.0-1.0>,
+    "reasoning": "<Your synthesis grounded in cybernetics and epistemic pluralism - explain how different ways of knowing converged or diverged, and what the feedback loops revealed>",
+    "mutation_type": "<temporal|numerical|contextual|framing|null>",
+    "dissenting_opinions": ["<valuable minority epistemology that deserves preservation>", ...]
+}"""
+
+
+# The judge's static rubric leads its task so the per-case material that
+# follows it leaves a long cacheable prefix after the (static) backstory
+JUDGE_FRAMEWORK = """Apply your CYBERNETIC and EPISTEMIC PLURALIST framework:
+
+1. MAP THE EPISTEMIC LANDSCAPE: What truth does each agent's way of knowing reveal?
+   - Numerical Hawk: Quantitative precision epistemology
+   - Temporal Detective: Time-bound truth epistemology
+   - Spirit Defender: Pragmatic/contextual epistemology
+   - Harm Assessor: Consequentialist epistemology
+   - Devil's Advocate: Dialectical epistemology
+
+2. TRACE THE FEEDBACK LOOPS: How did agents' positions evolve through debate? What corrections emerged?
+
+3. FIND CONVERGENCE: What claims survived scrutiny from MULTIPLE epistemic approaches?
+
+4. HONOR DIVERGENCE: What legitimate minority views must be preserved as valuable dissent?
+
+5. SYNTHESIZE: Ground your verdict in the CONVERGENCE of multiple ways of knowing, not just majority vote.
+
+Remember: Truth emerges from the cybernetic dance between perspectives, not from any single viewpoint."""
+
+
+class FinalVerdictOutput(BaseModel):
+    """
+    Structured-outputs schema for the judge's ruling (CrewAI Task.output_json).
+
+    CrewAI's strict schema drops Optional's null, so "no mutation" is the
+    string "null", as in JUDGE_OUTPUT_FORMAT.
+    """
+    verdict: Literal["faithful", "mutation"]
+    confidence: float
+    reasoning: str
+    mutation_type: Literal["temporal", "numerical", "contextual", "framing", "null"]
+    dissenting_opinions: list[str]
+
+
+class CrewPersonaAgent(BaseAgent):
+    """
+    Runs a CrewAI agent's persona through BaseAgent's async request path.
+
+    CrewAI's akickoff still makes its LLM calls with the blocking client on
+    worker threads. A debater turn is a single completion with no tools or
+    delegation, so sending it straight through the shared per-loop
+    AsyncOpenAI client and request pool is equivalent and keeps every
+    round's calls on one event loop and one connection pool.
+    """
+
+    def __init__(self, agent: Agent, model: str):
+        super().__init__(model=model)
+        self.agent = agent
+
+    @property
+    def name(self) -> str:
+        return self.agent.role
+
+    @property
+    def role_description(self) -> str:
+        return self.agent.goal
+
+    @property
+    def color(self) -> str:
+        return "white"
+
+    @functools.cached_property
+    def persona(self) -> str:
+        """The persona framing CrewAI gives the agent."""
+        return f"You are {self.agent.role}. {self.agent.backstory}\nYour personal goal is: {self.agent.goal}"
+
+    @functools.cached_property
+    def system_prompt(self) -> str:
+        # The persona plus the output format: everything that never changes
+        # between calls, so it is one cacheable prefix
+        return f"{self.persona}\n\nRespond with {DEBATER_OUTPUT_FORMAT}"
+
+    @functools.cached_property
+    def batch_system_prompt(self) -> str:
+        # The batch instructions carry their own output format
+        return f"{self.persona}\n\n{BATCH_ANALYZE_INSTRUCTIONS.substitute(agent_name=self.name)}"
+
+    def _build_analyze_prompt(self, claim: str, truth: str) -> str:
+        # A packed case reads like the first-round task
+        return DEBATER_TASK_TEMPLATE.format(truth=truth, claim=claim, instructions=FIRST_ROUND_INSTRUCTIONS)
+
+    async def debate_async(self, task_inputs: dict) -> str:
+        """
+        Answer one debate round.
+
+        Args:
+            task_inputs: Fields for DEBATER_TASK_TEMPLATE
+
+        Returns:
+            The raw response, a VERDICT_SCHEMA object
+        """
+        return await self._call_llm_async(
+            DEBATER_TASK_TEMPLATE.format(**task_inputs), self.system_prompt, stop_at_json=True,
+            schema=VERDICT_SCHEMA, max_tokens=self.analyze_max_tokens
+        )
+
+    def request_body(self, task_inputs: dict) -> dict:
+        """The chat completion request debate_async() sends, for offline batching."""
+        return self._completion_params(
+            DEBATER_TASK_TEMPLATE.format(**task_inputs), self.system_prompt,
+            VERDICT_SCHEMA, self.analyze_max_tokens
+        )
+
+    async def quick_verdict_async(self, task_inputs: dict) -> AgentVerdict:
+        """
+        Answer one debate round with only a verdict and confidence.
+
+        The response is streamed and cut off as soon as both fields are
+        complete - usually within the first few tokens - so the round does
+        not wait for the reasoning to be decoded.
+        """
+        response = await self._call_llm_async(
+            DEBATER_TASK_TEMPLATE.format(**task_inputs), self.system_prompt,
+            schema=VERDICT_SCHEMA, max_tokens=self.analyze_max_tokens, stop_at_verdict=True
+        )
+        return replace(self._parse_verdict(response), reasoning=QUICK_VERDICT_REASONING)
+
+
 class FactCheckCrew:
     """
     6-Agent Debate Crew for Fact Verification.
@@ -340,6 +584,7 @@ class FactCheckCrew:
     - Minimum 3 rounds, maximum 5 rounds
     - Each round: All 5 debaters see previous positions and respond
     - Consensus (80%+ agreement) can stop debate after round 3
+    - A unanimous, confident (all 90%+) first round only needs 1 round
     - If no consensus after max rounds, take majority vote
     - Synthesis Judge renders final verdict with reasoning
 
@@ -352,9 +597,27 @@ class FactCheckCrew:
     6. The Synthesis Judge - Summarizes and forces final verdict
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", max_rounds: int = 5):
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        max_rounds: int = 5,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        min_rounds: int = 3,
+        confident_min_rounds: int = 1,
+        quick_verdicts: bool = False
+    ):
         self.model = model
         self.max_rounds = max_rounds
+        # Rounds before consensus may end the debate, and the shorter minimum
+        # for cases whose first round is unanimous and confident
+        self.min_rounds = min_rounds
+        self.confident_min_rounds = confident_min_rounds
+        # From min_rounds on, take debaters' verdicts without their reasoning
+        # (see CrewPersonaAgent.quick_verdict_async), trading the final
+        # rounds' arguments for latency
+        self.quick_verdicts = quick_verdicts
+        # Cap on debater kickoffs in flight at once, to respect provider rate limits
+        self.max_concurrent = max_concurrent
 
         # Create all 6 specialized agents
         self.numerical_hawk = create_numerical_hawk_agent(model)
@@ -373,24 +636,143 @@ class FactCheckCrew:
             ("The Devil's Advocate", self.devils_advocate),
         ]
 
-    def _check_consensus(self, verdicts: list[AgentVerdict], threshold: float = 0.8) -> bool:
-        """Check if agents have reached consensus (80%+ same verdict)."""
-        vote_counts = {}
-        for v in verdicts:
-            vote_counts[v.verdict] = vote_counts.get(v.verdict, 0) + 1
-
-        total = len(verdicts)
-        for count in vote_counts.values():
-            if count / total >= threshold:
-                return True
-        return False
-
-    def _get_majority_verdict(self, verdicts: list[AgentVerdict]) -> str:
-        """Get the majority verdict from the agents."""
-        vote_counts = {}
-        for v in verdicts:
-            vote_counts[v.verdict] = vote_counts.get(v.verdict, 0) + 1
-        return max(vote_counts, key=vote_counts.get)
+        # Debaters call the API directly; the judge keeps a reusable crew
+        # whose kickoff fills the task template from its inputs
+        self._debaters = {name: CrewPersonaAgent(agent, model) for name, agent in self.agents}
+        self._judge_crew = self._single_task_crew(self.judge, "{task}", JUDGE_OUTPUT_FORMAT, FinalVerdictOutput)
+
+    def _consensus_reached(self, round_num: int, history: list[list[AgentVerdict]]) -> bool:
+        """Whether the debate may stop after round_num, given every round so far."""
+        first_round = history[0]
+        confident_start = (
+            len({v.verdict for v in first_round}) == 1
+            and min(v.confidence for v in first_round) >= CONFIDENT_AGREEMENT
+        )
+        min_rounds = self.confident_min_rounds if confident_start else self.min_rounds
+        return round_num >= min_rounds and self._vote_stats(history[-1])[1] >= CONSENSUS_THRESHOLD
+
+    @staticmethod
+    def _vote_stats(verdicts: list[AgentVerdict]) -> tuple[str, float]:
+        """Return the majority verdict and the share of agents that voted for it."""
+        top, top_count = Counter(v.verdict for v in verdicts).most_common(1)[0]
+        return top, top_count / len(verdicts)
+
+    @staticmethod
+    def _peer_context(name: str, history: list[list[AgentVerdict]]) -> str:
+        """
+        Summarize the debate so far for one debater.
+
+        Colleagues' last-round positions are given in full, the debater's own
+        only as a reminder, and earlier rounds as one line per agent, so the
+        prompt stays roughly the same size however many rounds have passed.
+        """
+        *earlier, last = history
+        lines = []
+        if earlier:
+            lines.append("Earlier rounds (digest):")
+            for round_num, verdicts in enumerate(earlier, 1):
+                lines.append(f"Round {round_num}: " + "; ".join(
+                    f"{v.agent_name}: {v.verdict} - {_first_sentence(v.reasoning)}" for v in verdicts
+                ))
+            lines.append("")
+
+        lines.append(f"Round {len(history)}:")
+        for v in last:
+            if v.agent_name == name:
+                lines.append(f"You ({v.agent_name}): {v.verdict} ({v.confidence:.0%})")
+            else:
+                lines.append(f"{v.agent_name}: {v.verdict} ({v.confidence:.0%}) - {v.reasoning[:200]}")
+        return "\n".join(lines)
+
+    @classmethod
+    def _task_inputs(cls, claim: str, truth: str, name: str, history: list[list[AgentVerdict]]) -> dict:
+        """Fill DEBATER_TASK_TEMPLATE for the debater's next round."""
+        if not history:
+            # Round 1: Independent initial positions
+            instructions = FIRST_ROUND_INSTRUCTIONS
+        else:
+            # Subsequent rounds: See others' positions and respond
+            instructions = LATER_ROUND_INSTRUCTIONS.format(context=cls._peer_context(name, history))
+        return {"truth": truth, "claim": claim, "instructions": instructions}
+
+    @staticmethod
+    def _single_task_crew(
+        agent: Agent,
+        description: str,
+        expected_output: str,
+        output_json: Optional[type[BaseModel]] = None
+    ) -> Crew:
+        """Build a reusable one-agent crew whose task description is a kickoff-input template."""
+        task = Task(description=description, expected_output=expected_output, agent=agent, output_json=output_json)
+        return Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=False,
+        )
+
+    async def _run_agent_task(
+        self,
+        semaphore: asyncio.Semaphore,
+        index: int,
+        name: str,
+        task_inputs: dict,
+        quick: bool = False
+    ) -> tuple[int, AgentVerdict]:
+        """Run one debater's task."""
+        async with semaphore:
+            return index, await self._debater_verdict(name, task_inputs, quick)
+
+    async def _debater_verdict(self, name: str, task_inputs: dict, quick: bool = False) -> AgentVerdict:
+        """Get a debater's verdict, abstaining if the provider stays unavailable."""
+        try:
+            if quick:
+                return await self._debaters[name].quick_verdict_async(task_inputs)
+            result = await self._debaters[name].debate_async(task_inputs)
+        except (CircuitOpenError, *TRANSIENT_ERRORS) as e:
+            # A degraded ballot keeps the debate going instead of losing the case
+            return AgentVerdict(
+                agent_name=name,
+                verdict="uncertain",
+                confidence=0.0,
+                reasoning=f"Provider unavailable: {e}",
+                evidence=[]
+            )
+        return parse_verdict_from_output(result, name)
+
+    async def _packed_first_round(
+        self,
+        name: str,
+        pairs: list[tuple[str, str]],
+        pack_size: int
+    ) -> list[AgentVerdict]:
+        """A debater's first-round verdicts for many cases, pack_size cases per request."""
+        try:
+            return await self._debaters[name].analyze_batch_async(pairs, max_batch_size=pack_size)
+        except (CircuitOpenError, *TRANSIENT_ERRORS) as e:
+            return [
+                AgentVerdict(
+                    agent_name=name,
+                    verdict="uncertain",
+                    confidence=0.0,
+                    reasoning=f"Provider unavailable: {e}",
+                    evidence=[]
+                )
+                for _ in pairs
+            ]
+
+    @staticmethod
+    def _round_context(round_num: int, round_verdicts: list[AgentVerdict]) -> str:
+        """Summarize a round for the Synthesis Judge's view of the debate."""
+        return f"\n=== Round {round_num} ===\n" + "".join(
+            f"\n{v.agent_name}: {v.verdict} ({v.confidence:.0%}) - {v.reasoning[:300]}...\n"
+            for v in round_verdicts
+        )
+
+    @staticmethod
+    def _round_record(round_num: int, round_verdicts: list[AgentVerdict]) -> DebateRoundRecord:
+        """Record a round for CrewDebateResult.debate_rounds."""
+        return round_num, tuple(round_verdicts)
 
     def run_debate(
         self,
@@ -401,105 +783,374 @@ class FactCheckCrew:
         on_round_complete: Optional[Callable] = None,
         on_agent_thinking: Optional[Callable] = None,
         on_round_start: Optional[Callable] = None,
+        force_judge: bool = False,
+    ) -> CrewDebateResult:
+        """Run the 6-agent debate (blocking wrapper around run_debate_async)."""
+        return run_blocking(self.run_debate_async(
+            claim, truth, case_id,
+            on_verdict=on_verdict,
+            on_round_complete=on_round_complete,
+            on_agent_thinking=on_agent_thinking,
+            on_round_start=on_round_start,
+            force_judge=force_judge
+        ))
+
+    async def run_debate_async(
+        self,
+        claim: str,
+        truth: str,
+        case_id: int = 0,
+        on_verdict: Optional[Callable] = None,
+        on_round_complete: Optional[Callable] = None,
+        on_agent_thinking: Optional[Callable] = None,
+        on_round_start: Optional[Callable] = None,
+        force_judge: bool = False,
     ) -> CrewDebateResult:
-        """Run the 6-agent debate."""
+        """
+        Run the 6-agent debate, with each round's debaters kicked off concurrently.
+
+        A case this crew's configuration has already debated is answered from
+        the result cache, replaying its rounds through the callbacks.
+        """
+        cache_key = self._result_key(claim, truth, force_judge)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            for round_num, round_verdicts in cached.debate_rounds:
+                if on_round_start:
+                    on_round_start(round_num)
+                for v in round_verdicts:
+                    if on_agent_thinking:
+                        on_agent_thinking(v.agent_name)
+                    if on_verdict:
+                        on_verdict(v)
+                if on_round_complete:
+                    on_round_complete(round_num, list(round_verdicts))
+            return replace(cached, case_id=case_id)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
         all_verdicts = []
         debate_rounds = []
-        current_context = ""
+        history = []
+        # Round summaries for the judge, joined once when it is called
+        context_parts = []
 
         for round_num in range(1, self.max_rounds + 1):
             # Notify round start
             if on_round_start:
                 on_round_start(round_num)
 
-            round_verdicts = []
-            round_context = f"\n=== Round {round_num} ===\n"
-
-            for name, agent in self.agents:
-                # Notify that agent is thinking
-                if on_agent_thinking:
+            # Every debater only sees earlier rounds, so a round's tasks run in parallel
+            if on_agent_thinking:
+                for name, _ in self.agents:
                     on_agent_thinking(name)
-                if round_num == 1:
-                    # Round 1: Independent initial positions
-                    task_desc = f"""Analyze whether this CLAIM faithfully represents the SOURCE.
-
-SOURCE TRUTH:
-{truth}
-
-CLAIM:
-{claim}
-
-Provide your INDEPENDENT assessment. Focus on your area of expertise."""
-                else:
-                    # Subsequent rounds: See others' positions and respond
-                    task_desc = f"""Continue the investigation. Review your colleagues' assessments:
-
-{current_context}
-
-SOURCE TRUTH:
-{truth}
 
-CLAIM:
-{claim}
-
-Consider their arguments. Respond to points you agree or disagree with.
-Have they raised valid concerns you missed? Do you want to update your assessment?"""
+            quick = self.quick_verdicts and round_num >= self.min_rounds
+            tasks = [
+                asyncio.create_task(self._run_agent_task(
+                    semaphore, i, name, self._task_inputs(claim, truth, name, history), quick
+                ))
+                for i, (name, _) in enumerate(self.agents)
+            ]
+
+            # From the minimum round on, stop waiting once enough agents agree that
+            # the rest can no longer prevent consensus; the stragglers are cancelled
+            consensus_votes = CONSENSUS_THRESHOLD * len(self.agents) if round_num >= self.min_rounds else None
+            tally = Counter()
+            round_verdicts = [None] * len(self.agents)
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    i, verdict = await next_done
+                    round_verdicts[i] = verdict
+                    if on_verdict:
+                        on_verdict(verdict)
+                    tally[verdict.verdict] += 1
+                    if consensus_votes is not None and tally[verdict.verdict] >= consensus_votes:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+            round_verdicts = [v for v in round_verdicts if v is not None]
 
-                task = Task(
-                    description=task_desc,
-                    expected_output="""A JSON object:
-{
-    "verdict": "faithful" | "mutation" | "uncertain",
-    "confidence": <float 0.0-1.0>,
-    "reasoning": "<your reasoning>",
-    "evidence": ["<point 1>", "<point 2>", ...]
-}""",
-                    agent=agent,
-                )
+            all_verdicts = round_verdicts
+            history.append(round_verdicts)
+            debate_rounds.append(self._round_record(round_num, round_verdicts))
+            context_parts.append(self._round_context(round_num, round_verdicts))
 
-                crew = Crew(
-                    agents=[agent],
-                    tasks=[task],
-                    process=Process.sequential,
-                    verbose=False,
-                )
-                result = crew.kickoff()
-                output = str(result)
-                verdict = parse_verdict_from_output(output, name)
-                round_verdicts.append(verdict)
-                round_context += f"\n{name}: {verdict.verdict} ({verdict.confidence:.0%}) - {verdict.reasoning[:300]}...\n"
+            if on_round_complete:
+                on_round_complete(round_num, round_verdicts)
 
-                if on_verdict:
-                    on_verdict(verdict)
+            # Check for consensus (80%+ agreement) - stop early, but only after the minimum rounds
+            if self._consensus_reached(round_num, history):
+                break
 
-            all_verdicts = round_verdicts
-            debate_rounds.append({
-                "round": round_num,
-                "verdicts": [(v.agent_name, v.verdict, v.confidence, v.reasoning) for v in round_verdicts]
+        final = None if force_judge else self._unanimous_final(all_verdicts)
+        if final is None:
+            judge_result = await self._judge_crew.akickoff(inputs={
+                "task": self._judge_task_description(claim, truth, all_verdicts, len(debate_rounds), "".join(context_parts))
             })
-            current_context += round_context
+            final = _crew_final_verdict(judge_result)
+        result = self._debate_result(case_id, claim, truth, all_verdicts, debate_rounds, final)
+        _RESULT_CACHE.put(cache_key, result)
+        return result
+
+    def _result_key(self, claim: str, truth: str, force_judge: bool) -> str:
+        """Result cache key: the case plus everything about the crew that shapes its result."""
+        return ResponseCache.key({
+            "claim": claim,
+            "truth": truth,
+            "model": self.model,
+            "max_rounds": self.max_rounds,
+            "min_rounds": self.min_rounds,
+            "confident_min_rounds": self.confident_min_rounds,
+            "quick_verdicts": self.quick_verdicts,
+            "force_judge": force_judge,
+        })
+
+    def run_batch(
+        self,
+        cases: list[tuple[str, str, int]],
+        force_judge: bool = False,
+        poll_interval: float = 30.0
+    ) -> list[CrewDebateResult]:
+        """
+        Debate many cases with each round's debater calls as one OpenAI Batch API job.
+
+        Batch jobs cost half as much but may take up to 24h each, so this is
+        for offline dataset evaluation; the judge still rules online.
+        See run_debate_batch_async() for arguments and results.
+        """
+        return run_blocking(self.run_debate_batch_async(
+            cases, force_judge, offline=True, poll_interval=poll_interval
+        ))
+
+    async def run_debate_batch_async(
+        self,
+        cases: list[tuple[str, str, int]],
+        force_judge: bool = False,
+        offline: bool = False,
+        poll_interval: float = 30.0,
+        pack_size: int = 1,
+        return_exceptions: bool = False
+    ) -> list[CrewDebateResult]:
+        """
+        Debate many cases together, without streaming callbacks.
+
+        Each round sends every debater's request for every case still
+        debating at once (the shared request pool paces them), and the judge
+        rules on all cases in one akickoff_for_each call. Cases drop out
+        individually once they reach consensus. Cases already in the result
+        cache, and repeats within the batch, are debated only once.
+
+        Args:
+            cases: (claim, truth, case_id) tuples
+            force_judge: Run the Synthesis Judge even on unanimous cases
+            offline: Send each round's debater calls as one Batch API job
+            poll_interval: Seconds between batch status checks when offline
+            pack_size: Cases per request in the first round, when the
+                debaters have no history yet and each case's prompt is
+                independent; the persona is then sent once per pack
+            return_exceptions: Return a failed case's exception in its place
+                instead of raising it, so the other cases' results survive
+
+        Returns:
+            One CrewDebateResult (or, with return_exceptions, exception) per
+            case, in input order
+        """
+        keys = [self._result_key(claim, truth, force_judge) for claim, truth, _ in cases]
+        results = {key: _RESULT_CACHE.get(key) for key in keys}
+        misses = {key: case for key, case in zip(keys, cases) if results[key] is None}
+
+        if misses:
+            debated = await self._run_debate_batch_uncached(
+                list(misses.values()), force_judge, offline, poll_interval, pack_size
+            )
+            for key, result in zip(misses, debated):
+                if not isinstance(result, Exception):
+                    _RESULT_CACHE.put(key, result)
+                results[key] = result
+
+        failed = [results[key] for key in keys if isinstance(results[key], Exception)]
+        if failed and not return_exceptions:
+            raise failed[0]
+        return [
+            results[key] if isinstance(results[key], Exception) else replace(results[key], case_id=case_id)
+            for key, (_, _, case_id) in zip(keys, cases)
+        ]
 
-            if on_round_complete:
-                on_round_complete(round_num, round_verdicts)
+    async def _run_debate_batch_uncached(
+        self,
+        cases: list[tuple[str, str, int]],
+        force_judge: bool,
+        offline: bool = False,
+        poll_interval: float = 30.0,
+        pack_size: int = 1
+    ) -> list[CrewDebateResult]:
+        """
+        Debate distinct cases together; see run_debate_batch_async().
+
+        A failure is confined to the cases it hit: those get the exception in
+        place of a result, and the rest of the batch carries on.
+        """
+        # akickoff_for_each copies its crew, and a copy of a crew that has
+        # already run takes the last interpolated text as its template, so
+        # batches copy from a crew that never runs itself
+        judge_crew = self._single_task_crew(self.judge, "{task}", JUDGE_OUTPUT_FORMAT, FinalVerdictOutput)
+
+        verdicts: list[list[AgentVerdict]] = [[] for _ in cases]
+        rounds: list[list[DebateRoundRecord]] = [[] for _ in cases]
+        histories: list[list[list[AgentVerdict]]] = [[] for _ in cases]
+        contexts: list[list[str]] = [[] for _ in cases]
+        failures: dict[int, Exception] = {}
+        active = list(range(len(cases)))
+
+        for round_num in range(1, self.max_rounds + 1):
+            if not active:
+                break
 
-            # Check for consensus (80%+ agreement) - stop early, but only after minimum 3 rounds
-            if round_num >= 3 and self._check_consensus(round_verdicts):
+            # outputs[a][k]: debater a's verdict (or exception) for case active[k]
+            try:
+                if offline:
+                    outputs = await asyncio.to_thread(
+                        self._offline_round, cases, active, histories, poll_interval
+                    )
+                    outputs = [[outputs[a, i] for i in active] for a in range(len(self.agents))]
+                elif round_num == 1 and pack_size > 1:
+                    pairs = [(cases[i][0], cases[i][1]) for i in active]
+                    outputs = await asyncio.gather(*(
+                        self._packed_first_round(name, pairs, pack_size) for name, _ in self.agents
+                    ))
+                else:
+                    quick = self.quick_verdicts and round_num >= self.min_rounds
+                    outputs = await asyncio.gather(*(
+                        asyncio.gather(*(
+                            self._debater_verdict(
+                                name, self._task_inputs(cases[i][0], cases[i][1], name, histories[i]), quick
+                            )
+                            for i in active
+                        ), return_exceptions=True)
+                        for name, _ in self.agents
+                    ))
+            except Exception as e:
+                # Batch jobs and packed requests serve every active case at once
+                failures.update((i, e) for i in active)
                 break
 
+            still_active = []
+            for k, i in enumerate(active):
+                round_verdicts = [outputs[a][k] for a in range(len(self.agents))]
+                error = next((v for v in round_verdicts if isinstance(v, Exception)), None)
+                if error is not None:
+                    failures[i] = error
+                    continue
+                verdicts[i] = round_verdicts
+                histories[i].append(round_verdicts)
+                rounds[i].append(self._round_record(round_num, round_verdicts))
+                contexts[i].append(self._round_context(round_num, round_verdicts))
+                if not self._consensus_reached(round_num, histories[i]):
+                    still_active.append(i)
+            active = still_active
+
+        finals = [
+            None if force_judge or i in failures else self._unanimous_final(v)
+            for i, v in enumerate(verdicts)
+        ]
+        to_judge = [i for i, final in enumerate(finals) if final is None and i not in failures]
+        if to_judge:
+            try:
+                judge_outputs = await judge_crew.akickoff_for_each(inputs=[
+                    {"task": self._judge_task_description(
+                        cases[i][0], cases[i][1], verdicts[i], len(rounds[i]), "".join(contexts[i])
+                    )}
+                    for i in to_judge
+                ])
+            except Exception as e:
+                failures.update((i, e) for i in to_judge)
+            else:
+                for i, output in zip(to_judge, judge_outputs):
+                    finals[i] = _crew_final_verdict(output)
+
+        return [
+            failures[i] if i in failures
+            else self._debate_result(case_id, claim, truth, verdicts[i], rounds[i], finals[i])
+            for i, (claim, truth, case_id) in enumerate(cases)
+        ]
+
+    def _offline_round(
+        self,
+        cases: list[tuple[str, str, int]],
+        active: list[int],
+        histories: list[list[list[AgentVerdict]]],
+        poll_interval: float
+    ) -> dict[tuple[int, int], AgentVerdict]:
+        """Run one round for the active cases as a Batch API job; verdicts by (debater index, case index)."""
+        bodies = {
+            f"{a}:{i}": self._debaters[name].request_body(
+                self._task_inputs(cases[i][0], cases[i][1], name, histories[i])
+            )
+            for a, (name, _) in enumerate(self.agents)
+            for i in active
+        }
+        outputs = run_chat_batch(get_client(), bodies, poll_interval)
+        return {
+            (a, i): parse_verdict_from_output(outputs[f"{a}:{i}"], name)
+            for a, (name, _) in enumerate(self.agents)
+            for i in active
+        }
+
+    def _unanimous_final(self, all_verdicts: list[AgentVerdict]) -> Optional[dict]:
+        """
+        Build the final verdict locally when the judge could not change it.
+
+        Returns None unless every debater gave the same definite verdict with
+        an average confidence of at least UNANIMOUS_CONFIDENCE. A round that
+        ended early has fewer verdicts than debaters; the missing ones might
+        have dissented, so it goes to the judge.
+        """
+        if len(all_verdicts) < len(self.agents):
+            return None
+        verdict = all_verdicts[0].verdict
+        if verdict == "uncertain" or any(v.verdict != verdict for v in all_verdicts):
+            return None
+        confidence = sum(v.confidence for v in all_verdicts) / len(all_verdicts)
+        if confidence < UNANIMOUS_CONFIDENCE:
+            return None
+        return {
+            "verdict": verdict,
+            "confidence": confidence,
+            "reasoning": "Unanimous consensus: " + "; ".join(
+                f"{v.agent_name}: {v.reasoning[:150]}" for v in all_verdicts
+            ),
+            "mutation_type": None,
+            "dissenting_opinions": []
+        }
+
+    def _judge_task_description(
+        self,
+        claim: str,
+        truth: str,
+        all_verdicts: list[AgentVerdict],
+        num_rounds: int,
+        current_context: str
+    ) -> str:
+        """Build the Synthesis Judge's task from the final round and the debate history."""
         # Determine consensus status and majority verdict
-        reached_consensus = self._check_consensus(all_verdicts)
-        majority_verdict = self._get_majority_verdict(all_verdicts)
+        majority_verdict, majority_share = self._vote_stats(all_verdicts)
+        reached_consensus = majority_share >= CONSENSUS_THRESHOLD
 
         # Final synthesis by judge
-        verdicts_summary = "\n\n".join([
-            f"**{v.agent_name}** votes '{v.verdict}' ({v.confidence:.0%} confidence):\n{v.reasoning}"
-            for v in all_verdicts
-        ])
+        verdicts_summary = "\n\n".join(map(_format_position, all_verdicts))
 
         consensus_status = "CONSENSUS REACHED" if reached_consensus else f"NO CONSENSUS after {self.max_rounds} rounds - MAJORITY VOTE: {majority_verdict}"
 
-        judge_task = Task(
-            description=f"""After {len(debate_rounds)} round(s) of cybernetic deliberation, synthesize the final verdict through epistemic pluralism.
+        closing = (
+            "The agents reached consensus - explain what epistemic convergence produced this agreement."
+            if reached_consensus
+            else f"The majority voted '{majority_verdict}' - synthesize why multiple epistemic lenses point to this conclusion, or explain your disagreement."
+        )
+
+        return f"""{JUDGE_FRAMEWORK}
+
+After {num_rounds} round(s) of cybernetic deliberation, synthesize the final verdict through epistemic pluralism.
 
 STATUS: {consensus_status}
 
@@ -515,46 +1166,18 @@ FINAL POSITIONS (Each represents a distinct epistemic lens):
 DEBATE HISTORY:
 {current_context}
 
-Apply your CYBERNETIC and EPISTEMIC PLURALIST framework:
-
-1. MAP THE EPISTEMIC LANDSCAPE: What truth does each agent's way of knowing reveal?
-   - Numerical Hawk: Quantitative precision epistemology
-   - Temporal Detective: Time-bound truth epistemology
-   - Spirit Defender: Pragmatic/contextual epistemology
-   - Harm Assessor: Consequentialist epistemology
-   - Devil's Advocate: Dialectical epistemology
-
-2. TRACE THE FEEDBACK LOOPS: How did agents' positions evolve through debate? What corrections emerged?
-
-3. FIND CONVERGENCE: What claims survived scrutiny from MULTIPLE epistemic approaches?
-
-4. HONOR DIVERGENCE: What legitimate minority views must be preserved as valuable dissent?
-
-5. SYNTHESIZE: Ground your verdict in the CONVERGENCE of multiple ways of knowing, not just majority vote.
-
-{"The agents reached consensus - explain what epistemic convergence produced this agreement." if reached_consensus else "The majority voted '" + majority_verdict + "' - synthesize why multiple epistemic lenses point to this conclusion, or explain your disagreement."}
-
-Remember: Truth emerges from the cybernetic dance between perspectives, not from any single viewpoint.""",
-            expected_output="""A JSON object:
-{
-    "verdict": "faithful" | "mutation",
-    "confidence": <float 0.0-1.0>,
-    "reasoning": "<Your synthesis grounded in cybernetics and epistemic pluralism - explain how different ways of knowing converged or diverged, and what the feedback loops revealed>",
-    "mutation_type": "<temporal|numerical|contextual|framing|null>",
-    "dissenting_opinions": ["<valuable minority epistemology that deserves preservation>", ...]
-}""",
-            agent=self.judge,
-        )
-
-        judge_crew = Crew(
-            agents=[self.judge],
-            tasks=[judge_task],
-            process=Process.sequential,
-            verbose=False,
-        )
-        judge_result = judge_crew.kickoff()
-        final = parse_final_verdict(str(judge_result))
+{closing}"""
 
+    @staticmethod
+    def _debate_result(
+        case_id: int,
+        claim: str,
+        truth: str,
+        all_verdicts: list[AgentVerdict],
+        debate_rounds: list[DebateRoundRecord],
+        final: dict
+    ) -> CrewDebateResult:
+        """Combine the final round and the final ruling into a CrewDebateResult."""
         return CrewDebateResult(
             case_id=case_id,
             claim=claim,
@@ -567,3 +1190,44 @@ Remember: Truth emerges from the cybernetic dance between perspectives, not from
             mutation_type=final.get("mutation_type"),
             dissenting_opinions=final.get("dissenting_opinions", [])
         )
+
+
+async def compare_with_baseline_async(
+    cases: list[tuple[str, str, int]],
+    model: str,
+    max_in_flight: int = 4
+) -> list[tuple[DebateResult, CrewDebateResult]]:
+    """
+    Run the single-agent baseline and the debate crew on every case, concurrently.
+
+    Both are I/O-bound on the same provider, so each case's baseline call
+    overlaps its debate, and up to max_in_flight cases run at once (the
+    shared request pool still paces the individual requests). A crew's
+    judge task is rewritten by each kickoff, so every case in flight
+    borrows its own crew, as the API server's checkout_crew does.
+
+    Args:
+        cases: (claim, truth, case_id) tuples
+        model: Model both setups use
+        max_in_flight: Most cases being evaluated at the same time
+
+    Returns:
+        (baseline result, crew result) per case, in input order
+    """
+    baseline = SingleAgentBaseline(model=model)
+    semaphore = asyncio.Semaphore(max_in_flight)
+    # Idle crews; grows to at most max_in_flight, all on this event loop
+    idle_crews: list[FactCheckCrew] = []
+
+    async def compare(claim: str, truth: str, case_id: int) -> tuple[DebateResult, CrewDebateResult]:
+        async with semaphore:
+            crew = idle_crews.pop() if idle_crews else FactCheckCrew(model=model)
+            try:
+                return await asyncio.gather(
+                    baseline.analyze_async(claim, truth, case_id),
+                    crew.run_debate_async(claim, truth, case_id)
+                )
+            finally:
+                idle_crews.append(crew)
+
+    return [tuple(pair) for pair in await asyncio.gather(*(compare(*case) for case in cases))]
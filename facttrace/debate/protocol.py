@@ -1,10 +1,13 @@
 """Debate protocol that orchestrates multi-agent deliberation."""
 
+import asyncio
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from agents.base_agent import BaseAgent, AgentVerdict
+from agents.base_agent import VERDICT_SCHEMA, BaseAgent, AgentVerdict, extract_json, format_other_verdicts, get_client, json_loads, pooled_completion
+from agents.batch_api import run_chat_batch
+from agents.jury import JuryAgent
 
 
 @dataclass
@@ -25,6 +28,8 @@ class DebateResult:
     final_verdict: Optional[str] = None
     final_confidence: float = 0.0
     final_reasoning: str = ""
+    mutation_type: Optional[str] = None
+    dissenting_opinions: list[str] = field(default_factory=list)
 
 
 class DebateProtocol:
@@ -34,6 +39,20 @@ class DebateProtocol:
     Supports multiple modes:
     - "one-shot": Each agent analyzes independently, then majority vote
     - "deliberation": Agents see each other's verdicts and can respond
+
+    With fused=True the initial verdicts come from a single JuryAgent call
+    instead of one call per agent. A fused one-shot protocol with
+    jury_ruling=True also has that call rule on the case, filling the
+    result's final_* fields so no separate synthesis request is needed.
+
+    With eager_synthesis=True, an async one-shot protocol stops waiting for
+    the initial verdicts as soon as a majority of agents agree on a definite
+    verdict, so synthesis can start without the slowest agents; those are
+    cancelled and left out of the result.
+
+    A deliberation is skipped when every initial verdict is the same
+    definite verdict at or above consensus_threshold confidence: the
+    rounds could only restate it (None always deliberates).
     """
 
     def __init__(
@@ -41,12 +60,23 @@ class DebateProtocol:
         agents: list[BaseAgent],
         mode: str = "one-shot",
         max_rounds: int = 1,
-        parallel: bool = True
+        parallel: bool = True,
+        fused: bool = False,
+        jury_ruling: bool = False,
+        eager_synthesis: bool = False,
+        consensus_threshold: Optional[float] = 0.9
     ):
         self.agents = agents
         self.mode = mode
         self.max_rounds = max_rounds
         self.parallel = parallel
+        self.fused = fused
+        self._jury = JuryAgent(members=agents, model=agents[0].model) if fused and agents else None
+        # A ruling is only final when no deliberation follows it
+        self.jury_ruling = jury_ruling and self._jury is not None and mode == "one-shot"
+        # Deliberation rounds need every agent's initial position
+        self.eager_synthesis = eager_synthesis and mode == "one-shot"
+        self.consensus_threshold = consensus_threshold
 
     def run_debate(self, claim: str, truth: str, case_id: int = 0) -> DebateResult:
         """
@@ -61,50 +91,274 @@ class DebateProtocol:
             DebateResult with all verdicts and discussion
         """
         # Phase 1: Collect initial verdicts from all agents
-        initial_verdicts = self._collect_initial_verdicts(claim, truth)
+        if self.jury_ruling:
+            initial_verdicts, ruling = self._jury_ruling(claim, truth)
+        else:
+            initial_verdicts, ruling = self._collect_initial_verdicts(claim, truth), None
 
         debate_rounds = []
 
         # Phase 2: Optional deliberation rounds
-        if self.mode == "deliberation" and self.max_rounds > 0:
+        if self._should_deliberate(initial_verdicts):
+            # Every round responds to the same initial verdicts, so render them once
+            others = format_other_verdicts(initial_verdicts)
             for round_num in range(1, self.max_rounds + 1):
                 debate_round = self._run_debate_round(
-                    round_num, claim, truth, initial_verdicts
+                    round_num, claim, truth, others
                 )
                 debate_rounds.append(debate_round)
 
-        return DebateResult(
+        return self._apply_ruling(DebateResult(
             case_id=case_id,
             claim=claim,
             truth=truth,
             initial_verdicts=initial_verdicts,
             debate_rounds=debate_rounds
+        ), ruling)
+
+    async def run_debate_async(self, claim: str, truth: str, case_id: int = 0) -> DebateResult:
+        """
+        Async variant of run_debate().
+
+        All agents analyze the claim concurrently, so the initial phase
+        takes as long as the slowest agent instead of the sum of all of them.
+
+        Args:
+            claim: The claim to verify
+            truth: The source truth
+            case_id: Identifier for the case
+
+        Returns:
+            DebateResult with all verdicts and discussion
+        """
+        initial_verdicts, ruling = await self._analyze_async(claim, truth)
+        debate_rounds = await self._run_debate_rounds_async(claim, truth, initial_verdicts)
+
+        return self._apply_ruling(DebateResult(
+            case_id=case_id,
+            claim=claim,
+            truth=truth,
+            initial_verdicts=initial_verdicts,
+            debate_rounds=debate_rounds
+        ), ruling)
+
+    async def run_debates_async(
+        self,
+        cases: list[dict],
+        max_in_flight: int = 4,
+        return_exceptions: bool = False
+    ) -> list[DebateResult]:
+        """
+        Run debates on many cases, pipelining analysis and deliberation.
+
+        Cases flow through two bounded queues: analysis workers collect the
+        initial verdicts and hand each case on to deliberation workers, so
+        case N+1 is being analyzed while case N is being debated.
+
+        Args:
+            cases: Case dicts with "claim", "truth" and "id" keys
+            max_in_flight: Workers per stage, and capacity of each queue
+            return_exceptions: Return a failed case's exception in its place
+                instead of raising it
+
+        Returns:
+            One DebateResult (or, with return_exceptions, exception) per
+            case, in input order
+
+        Raises:
+            Exception: Without return_exceptions, the first failing case's
+                error, in input order; a failure does not stop the workers,
+                so it is raised once every other case has finished
+        """
+        results: list[Optional[DebateResult]] = [None] * len(cases)
+        errors: dict[int, Exception] = {}
+        analyze_q: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+        respond_q: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+
+        async def analyze_worker():
+            while True:
+                index, case = await analyze_q.get()
+                try:
+                    verdicts, ruling = await self._analyze_async(case["claim"], case["truth"])
+                except Exception as e:
+                    errors[index] = e
+                else:
+                    await respond_q.put((index, case, verdicts, ruling))
+                finally:
+                    analyze_q.task_done()
+
+        async def respond_worker():
+            while True:
+                index, case, verdicts, ruling = await respond_q.get()
+                try:
+                    results[index] = self._apply_ruling(DebateResult(
+                        case_id=case.get("id", index),
+                        claim=case["claim"],
+                        truth=case["truth"],
+                        initial_verdicts=verdicts,
+                        debate_rounds=await self._run_debate_rounds_async(
+                            case["claim"], case["truth"], verdicts
+                        )
+                    ), ruling)
+                except Exception as e:
+                    errors[index] = e
+                finally:
+                    respond_q.task_done()
+
+        workers = [asyncio.create_task(analyze_worker()) for _ in range(max_in_flight)]
+        workers += [asyncio.create_task(respond_worker()) for _ in range(max_in_flight)]
+        try:
+            for index, case in enumerate(cases):
+                await analyze_q.put((index, case))
+            await analyze_q.join()
+            await respond_q.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if errors and not return_exceptions:
+            raise errors[min(errors)]
+        for index, error in errors.items():
+            results[index] = error
+        return results
+
+    async def _run_debate_rounds_async(
+        self,
+        claim: str,
+        truth: str,
+        verdicts: list[AgentVerdict]
+    ) -> list[DebateRound]:
+        """Run the deliberation rounds, if this protocol's mode has any."""
+        debate_rounds = []
+
+        if self._should_deliberate(verdicts):
+            others = format_other_verdicts(verdicts)
+            for round_num in range(1, self.max_rounds + 1):
+                debate_rounds.append(
+                    await self._run_debate_round_async(round_num, claim, truth, others)
+                )
+
+        return debate_rounds
+
+    def _should_deliberate(self, verdicts: list[AgentVerdict]) -> bool:
+        """Whether deliberation rounds should run, given the initial verdicts."""
+        if self.mode != "deliberation" or self.max_rounds <= 0:
+            return False
+        if self.consensus_threshold is None or not verdicts:
+            return True
+        settled = verdicts[0].verdict != "uncertain" and all(
+            v.verdict == verdicts[0].verdict and v.confidence >= self.consensus_threshold
+            for v in verdicts
+        )
+        return not settled
+
+    async def _analyze_async(self, claim: str, truth: str) -> tuple[list[AgentVerdict], Optional[dict]]:
+        """Initial verdicts, plus the jury's ruling when it gives one."""
+        if self.jury_ruling:
+            try:
+                return await self._jury.analyze_with_ruling_async(claim, truth)
+            except Exception as e:
+                return self._error_verdicts(e), None
+        return await self._collect_initial_verdicts_async(claim, truth), None
+
+    def _jury_ruling(self, claim: str, truth: str) -> tuple[list[AgentVerdict], Optional[dict]]:
+        """Initial verdicts and the ruling from one JuryAgent call."""
+        try:
+            return self._jury.analyze_with_ruling(claim, truth)
+        except Exception as e:
+            return self._error_verdicts(e), None
+
+    @staticmethod
+    def _apply_ruling(result: DebateResult, ruling: Optional[dict]) -> DebateResult:
+        """Fill the result's final verdict from a jury ruling, if there is one."""
+        if ruling is not None:
+            try:
+                result.final_verdict = str(ruling["verdict"]).lower()
+                result.final_confidence = float(ruling.get("confidence", 0.5))
+                result.final_reasoning = ruling.get("reasoning", "No reasoning provided")
+                result.mutation_type = ruling.get("mutation_type")
+                result.dissenting_opinions = ruling.get("dissenting_opinions", [])
+            except (KeyError, ValueError, TypeError):
+                result.final_verdict = None
+        return result
+
+    async def _collect_initial_verdicts_async(self, claim: str, truth: str) -> list[AgentVerdict]:
+        """Have all agents analyze the claim concurrently."""
+        if self._jury:
+            try:
+                return await self._jury.analyze_fused_async(claim, truth)
+            except Exception as e:
+                return self._error_verdicts(e)
+
+        if self.eager_synthesis:
+            return await self._collect_quorum_verdicts_async(claim, truth)
+
+        results = await asyncio.gather(
+            *(agent.analyze_async(claim, truth) for agent in self.agents),
+            return_exceptions=True
         )
 
+        verdicts = []
+        for agent, result in zip(self.agents, results):
+            if isinstance(result, Exception):
+                verdicts.append(AgentVerdict(
+                    agent_name=agent.name,
+                    verdict="uncertain",
+                    confidence=0.0,
+                    reasoning=f"Error: {str(result)}",
+                    evidence=[]
+                ))
+            else:
+                verdicts.append(result)
+
+        return verdicts
+
+    async def _collect_quorum_verdicts_async(self, claim: str, truth: str) -> list[AgentVerdict]:
+        """Initial verdicts in agent order, up to the first majority agreeing on a definite verdict."""
+        async def analyze(index: int, agent: BaseAgent) -> tuple[int, AgentVerdict]:
+            try:
+                return index, await agent.analyze_async(claim, truth)
+            except Exception as e:
+                return index, AgentVerdict(
+                    agent_name=agent.name,
+                    verdict="uncertain",
+                    confidence=0.0,
+                    reasoning=f"Error: {str(e)}",
+                    evidence=[]
+                )
+
+        quorum = len(self.agents) // 2 + 1
+        tasks = [asyncio.create_task(analyze(i, agent)) for i, agent in enumerate(self.agents)]
+        verdicts: list[Optional[AgentVerdict]] = [None] * len(self.agents)
+        tally = Counter()
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, verdict = await next_done
+                verdicts[index] = verdict
+                if verdict.verdict != "uncertain":
+                    tally[verdict.verdict] += 1
+                    if tally[verdict.verdict] >= quorum:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return [v for v in verdicts if v is not None]
+
     def _collect_initial_verdicts(self, claim: str, truth: str) -> list[AgentVerdict]:
         """Have each agent independently analyze the claim."""
+        if self._jury:
+            try:
+                return self._jury.analyze_fused(claim, truth)
+            except Exception as e:
+                return self._error_verdicts(e)
+
         verdicts = []
 
         if self.parallel and len(self.agents) > 1:
             # Run agents in parallel for speed
-            with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
-                future_to_agent = {
-                    executor.submit(agent.analyze, claim, truth): agent
-                    for agent in self.agents
-                }
-                for future in as_completed(future_to_agent):
-                    try:
-                        verdict = future.result()
-                        verdicts.append(verdict)
-                    except Exception as e:
-                        agent = future_to_agent[future]
-                        verdicts.append(AgentVerdict(
-                            agent_name=agent.name,
-                            verdict="uncertain",
-                            confidence=0.0,
-                            reasoning=f"Error: {str(e)}",
-                            evidence=[]
-                        ))
+            verdicts = BaseAgent.analyze_all(self.agents, claim, truth)
         else:
             # Run sequentially
             for agent in self.agents:
@@ -122,19 +376,44 @@ class DebateProtocol:
 
         return verdicts
 
+    def _error_verdicts(self, error: Exception) -> list[AgentVerdict]:
+        """Uncertain verdicts for every agent after a failed fused call."""
+        return [
+            AgentVerdict(
+                agent_name=agent.name,
+                verdict="uncertain",
+                confidence=0.0,
+                reasoning=f"Error: {str(error)}",
+                evidence=[]
+            )
+            for agent in self.agents
+        ]
+
     def _run_debate_round(
         self,
         round_num: int,
         claim: str,
         truth: str,
-        verdicts: list[AgentVerdict]
+        others: dict[str, str]
     ) -> DebateRound:
-        """Run a single round of debate where agents respond to each other."""
+        """
+        Run a single round of debate where agents respond to each other.
+
+        others maps each agent's name to the rendered text of the other
+        agents' verdicts (see format_other_verdicts()).
+        """
+        if self.parallel and len(self.agents) > 1:
+            # Each rebuttal depends only on the fixed initial verdicts
+            return DebateRound(round_number=round_num, responses=[
+                {"agent": agent.name, "color": agent.color, "response": response}
+                for agent, response in zip(self.agents, BaseAgent.respond_all(self.agents, others, claim, truth))
+            ])
+
         responses = []
 
         for agent in self.agents:
             try:
-                response = agent.respond_to(verdicts, claim, truth)
+                response = agent.respond_to(others[agent.name], claim, truth)
                 responses.append({
                     "agent": agent.name,
                     "color": agent.color,
@@ -149,31 +428,37 @@ class DebateProtocol:
 
         return DebateRound(round_number=round_num, responses=responses)
 
+    async def _run_debate_round_async(
+        self,
+        round_num: int,
+        claim: str,
+        truth: str,
+        others: dict[str, str]
+    ) -> DebateRound:
+        """Async variant of _run_debate_round(); agents respond concurrently."""
+        results = await asyncio.gather(
+            *(agent.respond_to_async(others[agent.name], claim, truth) for agent in self.agents),
+            return_exceptions=True
+        )
 
-class SingleAgentBaseline:
-    """
-    Single agent baseline for comparison.
-    Uses one generic agent to make the decision.
-    """
-
-    def __init__(self, model: str = "gpt-4o-mini"):
-        from openai import OpenAI
-        from config import OPENAI_API_KEY
-        self.model = model
-        self._client = OpenAI(api_key=OPENAI_API_KEY)
+        responses = []
+        for agent, result in zip(self.agents, results):
+            if isinstance(result, Exception):
+                result = f"[Error generating response: {str(result)}]"
+            responses.append({
+                "agent": agent.name,
+                "color": agent.color,
+                "response": result
+            })
 
-    def analyze(self, claim: str, truth: str, case_id: int = 0) -> DebateResult:
-        """Run single-agent analysis."""
-        import json
-        import re
+        return DebateRound(round_number=round_num, responses=responses)
 
-        prompt = f"""Analyze whether the following CLAIM is a faithful representation of the SOURCE TRUTH, or if it's a mutation (distortion, exaggeration, missing context, etc.).
 
-SOURCE TRUTH:
-{truth}
+# The baseline's full rubric, kept out of the per-case message so every
+# request shares it as a cacheable prompt prefix
+BASELINE_SYSTEM_PROMPT = """You are an expert fact-checker analyzing whether claims faithfully represent their sources.
 
-CLAIM:
-{claim}
+Analyze whether the CLAIM you are given is a faithful representation of the SOURCE TRUTH, or if it's a mutation (distortion, exaggeration, missing context, etc.).
 
 Consider:
 1. Factual accuracy (numbers, dates, specific details)
@@ -181,30 +466,86 @@ Consider:
 3. Statistical/numerical framing
 
 Respond with a JSON object:
-{{
+{
     "verdict": "faithful" | "mutation" | "uncertain",
     "confidence": <float 0.0-1.0>,
     "reasoning": "<your detailed reasoning>",
     "evidence": ["<evidence point 1>", "<evidence point 2>"]
-}}"""
+}"""
 
-        response = self._client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are an expert fact-checker analyzing whether claims faithfully represent their sources."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1000
+
+class SingleAgentBaseline:
+    """
+    Single agent baseline for comparison.
+    Uses one generic agent to make the decision.
+    """
+
+    def __init__(self, model: str = "gpt-4o-mini"):
+        self.model = model
+        self._client = get_client()
+
+    def analyze(self, claim: str, truth: str, case_id: int = 0) -> DebateResult:
+        """Run single-agent analysis."""
+        response = self._client.chat.completions.create(**self._request_body(claim, truth))
+        return self._result(response.choices[0].message.content, claim, truth, case_id)
+
+    async def analyze_async(self, claim: str, truth: str, case_id: int = 0) -> DebateResult:
+        """Async variant of analyze(), sharing the agents' request pool."""
+        content = await pooled_completion(self._request_body(claim, truth))
+        return self._result(content, claim, truth, case_id)
+
+    def run_batch(self, cases: list[tuple[str, str, int]], poll_interval: float = 30.0) -> list[DebateResult]:
+        """
+        Analyze many cases as one OpenAI Batch API job (half price, up to 24h).
+
+        Args:
+            cases: (claim, truth, case_id) tuples
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            One DebateResult per case, in input order
+        """
+        outputs = run_chat_batch(
+            self._client,
+            {str(i): self._request_body(claim, truth) for i, (claim, truth, _) in enumerate(cases)},
+            poll_interval
         )
+        return [
+            self._result(outputs[str(i)], claim, truth, case_id)
+            for i, (claim, truth, case_id) in enumerate(cases)
+        ]
+
+    def _request_body(self, claim: str, truth: str) -> dict:
+        """Chat completion request for one case."""
+        prompt = f"""SOURCE TRUTH:
+{truth}
 
-        content = response.choices[0].message.content
+CLAIM:
+{claim}"""
 
-        # Parse response
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": BASELINE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            # One verdict object; more room than a single-specialty agent, since
+            # this one agent covers every dimension
+            "max_tokens": 600,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "verdict", "schema": VERDICT_SCHEMA, "strict": True},
+            },
+        }
+
+    @staticmethod
+    def _result(content: str, claim: str, truth: str, case_id: int) -> DebateResult:
+        """Parse the response into a DebateResult."""
         try:
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                data = json.loads(json_match.group())
+            json_text = extract_json(content)
+            if json_text:
+                data = json_loads(json_text)
                 verdict = AgentVerdict(
                     agent_name="Single Agent",
                     verdict=data.get("verdict", "uncertain").lower(),
@@ -1,13 +1,13 @@
 """Verdict synthesis from multi-agent debate."""
 
-import json
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
-from openai import OpenAI
-from config import OPENAI_API_KEY
-from agents.base_agent import AgentVerdict
+from agents.base_agent import AgentVerdict, get_client, json_loads, pooled_completion
+from agents.batch_api import run_chat_batch
+from agents.response_cache import ResponseCache
+from config import RESPONSE_CACHE_DIR, RESPONSE_CACHE_SIZE
 from debate.protocol import DebateResult
 
 
@@ -21,6 +21,149 @@ class FinalVerdict:
     mutation_type: Optional[str]  # If mutation, what kind
 
 
+# The judge's instructions and output format; identical for every case, so
+# they form a cacheable prompt prefix ahead of the case-specific message
+SYNTHESIS_SYSTEM_PROMPT = """You are an impartial judge synthesizing verdicts from multiple fact-checking experts.
+
+You are given a case (the source truth and the claim), every agent's verdict, and any debate between them. Based on all agent opinions, synthesize a FINAL VERDICT.
+
+Consider:
+- Which agents made the strongest arguments?
+- Is there consensus or disagreement?
+- What are the key issues identified?
+
+Respond with JSON:
+{
+    "verdict": "faithful" | "mutation" | "uncertain",
+    "confidence": <float 0.0-1.0>,
+    "reasoning": "<synthesis of key points and final judgment>",
+    "mutation_type": "<if mutation: 'numerical', 'temporal', 'contextual', 'framing', or null>",
+    "dissenting_opinions": ["<brief dissent if any>"]
+}"""
+
+
+# Strict structured output for the judge, so its response is always one
+# parseable verdict object
+SYNTHESIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verdict": {"type": "string", "enum": ["faithful", "mutation", "uncertain"]},
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "string"},
+        "mutation_type": {
+            "type": ["string", "null"],
+            "enum": ["numerical", "temporal", "contextual", "framing", None],
+        },
+        "dissenting_opinions": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["verdict", "confidence", "reasoning", "mutation_type", "dissenting_opinions"],
+    "additionalProperties": False,
+}
+
+# Syntheses at or below this temperature are near-deterministic, so a repeated
+# request (re-running a case, --compare) reuses the earlier ruling
+CACHEABLE_TEMPERATURE = 0.3
+
+# Judge responses keyed on the full request; shares the agents' on-disk
+# directory when one is configured
+_SYNTHESIS_CACHE = ResponseCache(maxsize=RESPONSE_CACHE_SIZE, directory=RESPONSE_CACHE_DIR)
+
+# Per-agent reasoning budget in the judge's prompt when compressing
+COMPRESSED_REASONING_CHARS = 400
+
+# Keywords hinting at each mutation type, in priority order
+_MUTATION_KEYWORDS = {
+    "temporal": ["date", "temporal", "time", "when", "as of", "after", "before"],
+    "numerical": ["number", "statistic", "figure", "count", "more than", "less than"],
+    "contextual": ["context", "caveat", "omit", "missing", "qualifier"],
+    "framing": ["frame", "framing", "implication", "meaning", "interpretation"],
+}
+_MUTATION_PRIORITY = tuple(_MUTATION_KEYWORDS)
+
+# Substring match like `word in text`, with one named group per mutation type
+_MUTATION_KEYWORD_RE = re.compile(
+    "|".join(
+        f"(?P<{mutation_type}>{'|'.join(map(re.escape, words))})"
+        for mutation_type, words in _MUTATION_KEYWORDS.items()
+    ),
+    re.IGNORECASE
+)
+
+
+# Sentence boundary within an agent's reasoning
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _compress_reasoning(reasoning: str, seen: set[str], limit: int) -> str:
+    """
+    Reasoning without sentences an earlier agent already gave, cut to whole sentences.
+
+    Args:
+        reasoning: One agent's reasoning
+        seen: Normalized sentences already included; updated in place
+        limit: Approximate character budget (the first new sentence is
+            always kept)
+
+    Returns:
+        The remaining sentences, joined by spaces
+    """
+    kept = []
+    length = 0
+    for sentence in _SENTENCE_END_RE.split(reasoning.strip()):
+        key = " ".join(sentence.lower().split())
+        if not key or key in seen:
+            continue
+        if kept and length + len(sentence) > limit:
+            break
+        seen.add(key)
+        kept.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(kept) or "(same as above)"
+
+
+def _format_evidence(evidence: list[str]) -> str:
+    """An agent's first three evidence points for the judge's prompt."""
+    if not evidence:
+        return "None cited"
+    return "; ".join(evidence[:3])
+
+
+def _render_debate_text(debate_result: DebateResult, compress: bool = False) -> tuple[str, str]:
+    """
+    The agent verdicts and debate rounds sections of the judge's prompt.
+
+    With compress, sentences and evidence an earlier agent already gave are
+    dropped and each agent's reasoning is cut to about
+    COMPRESSED_REASONING_CHARS of whole sentences, so the judge reads each
+    point once.
+    """
+    # Build summary of all verdicts
+    seen_sentences: set[str] = set()
+    seen_evidence: set[str] = set()
+    sections = []
+    for v in debate_result.initial_verdicts:
+        reasoning, evidence = v.reasoning, v.evidence
+        if compress:
+            reasoning = _compress_reasoning(reasoning, seen_sentences, COMPRESSED_REASONING_CHARS)
+            evidence = [e for e in dict.fromkeys(evidence) if e not in seen_evidence][:3]
+            seen_evidence.update(evidence)
+        sections.append(
+            f"**{v.agent_name}** (verdict: {v.verdict}, confidence: {v.confidence:.0%}):\n"
+            f"Reasoning: {reasoning}\n"
+            f"Evidence: {_format_evidence(evidence)}"
+        )
+    verdicts_text = "\n\n".join(sections)
+
+    # Include debate responses if any; parts are joined once rather than
+    # re-copying the growing text for every response
+    debate_parts = []
+    for round in debate_result.debate_rounds:
+        debate_parts.append(f"\n\n--- Debate Round {round.round_number} ---\n")
+        debate_parts.extend(f"\n{resp['agent']}: {resp['response']}" for resp in round.responses)
+
+    return verdicts_text, "".join(debate_parts)
+
+
 class VerdictSynthesizer:
     """
     Synthesizes a final verdict from the debate results.
@@ -29,31 +172,134 @@ class VerdictSynthesizer:
     - "majority": Simple majority vote weighted by confidence
     - "unanimous": Requires all agents to agree
     - "llm": Use an LLM to synthesize the final verdict
+
+    The "llm" strategy skips its request when every agent already gave the
+    same definite verdict with at least eager_consensus_threshold confidence,
+    since the synthesis could only restate it.
+
+    With use_cache, LLM syntheses are cached by request hash, so the same
+    debate is never judged twice. With compress, the judge's prompt leaves
+    out reasoning and evidence the agents repeat.
     """
 
-    def __init__(self, strategy: str = "llm", model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        strategy: str = "llm",
+        model: str = "gpt-4o-mini",
+        eager_consensus_threshold: float = 0.85,
+        use_cache: bool = True,
+        compress: bool = True
+    ):
         self.strategy = strategy
         self.model = model
-        self._client = OpenAI(api_key=OPENAI_API_KEY)
-
-    def synthesize(self, debate_result: DebateResult) -> FinalVerdict:
+        self.eager_consensus_threshold = eager_consensus_threshold
+        self.use_cache = use_cache
+        self.compress = compress
+        self._client = get_client()
+
+    def synthesize(
+        self,
+        debate_result: DebateResult,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> FinalVerdict:
         """
         Synthesize a final verdict from debate results.
 
+        Args:
+            debate_result: The complete debate result
+            on_token: Optional callback; when set, the judge's response is
+                streamed and each text delta passed to it as it arrives
+                (not called for verdicts that need no LLM call)
+
+        Returns:
+            FinalVerdict with reasoning
+        """
+        local = self._local_verdict(debate_result)
+        if local is not None:
+            return local
+        return self._llm_synthesis(debate_result, on_token)
+
+    async def synthesize_async(self, debate_result: DebateResult) -> FinalVerdict:
+        """
+        Async variant of synthesize(), sharing the agents' request pool.
+
         Args:
             debate_result: The complete debate result
 
         Returns:
             FinalVerdict with reasoning
         """
+        local = self._local_verdict(debate_result)
+        if local is not None:
+            return local
+
+        params = self._synthesis_request(debate_result)
+        cache_key = self._cache_key(params)
+        content = _SYNTHESIS_CACHE.get(cache_key) if cache_key else None
+        if content is None:
+            content = await pooled_completion(params)
+            if cache_key and content:
+                _SYNTHESIS_CACHE.put(cache_key, content)
+        return self._parse_synthesis(content)
+
+    def synthesize_many(self, debate_results: list[DebateResult], poll_interval: float = 30.0) -> list[FinalVerdict]:
+        """
+        Synthesize final verdicts for many debates, with every LLM synthesis in one OpenAI Batch API job.
+
+        Batch jobs cost half as much but may take up to 24h, so this is for
+        offline runs over many cases. Verdicts that need no LLM call (vote
+        strategies, jury rulings, confident consensus) are built locally.
+
+        Args:
+            debate_results: Completed debates
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            One FinalVerdict per debate, in input order
+        """
+        finals = [self._local_verdict(result) for result in debate_results]
+        bodies = {}
+        for i, (result, final) in enumerate(zip(debate_results, finals)):
+            if final is not None:
+                continue
+            params = self._synthesis_request(result)
+            cache_key = self._cache_key(params)
+            cached = _SYNTHESIS_CACHE.get(cache_key) if cache_key else None
+            if cached is not None:
+                finals[i] = self._parse_synthesis(cached)
+            else:
+                bodies[str(i)] = params
+
+        if bodies:
+            outputs = run_chat_batch(self._client, bodies, poll_interval)
+            for key, params in bodies.items():
+                cache_key = self._cache_key(params)
+                # Failed and expired requests come back empty; leave them to be retried
+                if cache_key and outputs[key]:
+                    _SYNTHESIS_CACHE.put(cache_key, outputs[key])
+                finals[int(key)] = self._parse_synthesis(outputs[key])
+        return finals
+
+    def _local_verdict(self, debate_result: DebateResult) -> Optional[FinalVerdict]:
+        """The final verdict when it needs no LLM call, else None."""
         verdicts = debate_result.initial_verdicts
 
         if self.strategy == "majority":
             return self._majority_vote(verdicts, debate_result)
         elif self.strategy == "unanimous":
             return self._unanimous_vote(verdicts, debate_result)
-        else:  # llm
-            return self._llm_synthesis(debate_result)
+        elif debate_result.final_verdict is not None:
+            # The jury already ruled in the same call as its analysis
+            return FinalVerdict(
+                verdict=debate_result.final_verdict,
+                confidence=debate_result.final_confidence,
+                reasoning=debate_result.final_reasoning,
+                dissenting_opinions=debate_result.dissenting_opinions,
+                mutation_type=debate_result.mutation_type
+            )
+        elif self._confident_consensus(verdicts):
+            return self._consensus_verdict(verdicts, debate_result)
+        return None
 
     def _majority_vote(self, verdicts: list[AgentVerdict], debate_result: DebateResult) -> FinalVerdict:
         """Simple confidence-weighted majority vote."""
@@ -110,105 +356,142 @@ class VerdictSynthesizer:
             mutation_type=self._identify_mutation_type(debate_result) if winner == "mutation" else None
         )
 
-    def _llm_synthesis(self, debate_result: DebateResult) -> FinalVerdict:
+    def _confident_consensus(self, verdicts: list[AgentVerdict]) -> bool:
+        """Whether all agents agree on a definite verdict, each at or above the threshold."""
+        return bool(verdicts) and verdicts[0].verdict != "uncertain" and all(
+            v.verdict == verdicts[0].verdict and v.confidence >= self.eager_consensus_threshold
+            for v in verdicts
+        )
+
+    def _consensus_verdict(self, verdicts: list[AgentVerdict], debate_result: DebateResult) -> FinalVerdict:
+        """The agents' shared verdict, built locally instead of by the LLM judge."""
+        winner = verdicts[0].verdict
+        reasoning = "Confident consensus: " + "; ".join(
+            f"{v.agent_name}: {v.reasoning[:150]}" for v in verdicts
+        )
+
+        return FinalVerdict(
+            verdict=winner,
+            confidence=sum(v.confidence for v in verdicts) / len(verdicts),
+            reasoning=reasoning,
+            dissenting_opinions=[],
+            mutation_type=self._identify_mutation_type(debate_result) if winner == "mutation" else None
+        )
+
+    def _llm_synthesis(
+        self,
+        debate_result: DebateResult,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> FinalVerdict:
         """Use LLM to synthesize final verdict from all agent opinions."""
-        # Build summary of all verdicts
-        verdicts_text = "\n\n".join([
-            f"**{v.agent_name}** (verdict: {v.verdict}, confidence: {v.confidence:.0%}):\n"
-            f"Reasoning: {v.reasoning}\n"
-            f"Evidence: {'; '.join(v.evidence[:3]) if v.evidence else 'None cited'}"
-            for v in debate_result.initial_verdicts
-        ])
-
-        # Include debate responses if any
-        debate_text = ""
-        if debate_result.debate_rounds:
-            for round in debate_result.debate_rounds:
-                debate_text += f"\n\n--- Debate Round {round.round_number} ---\n"
-                for resp in round.responses:
-                    debate_text += f"\n{resp['agent']}: {resp['response']}"
-
-        prompt = f"""You are the JUDGE synthesizing a final verdict from a jury of fact-checking agents.
-
-ORIGINAL CASE:
+        params = self._synthesis_request(debate_result)
+        cache_key = self._cache_key(params)
+        if cache_key:
+            cached = _SYNTHESIS_CACHE.get(cache_key)
+            if cached is not None:
+                return self._parse_synthesis(cached)
+
+        if on_token is None:
+            response = self._client.chat.completions.create(**params)
+            content = response.choices[0].message.content
+        else:
+            content = self._stream_synthesis(params, on_token)
+        if cache_key and content:
+            _SYNTHESIS_CACHE.put(cache_key, content)
+        return self._parse_synthesis(content)
+
+    def _stream_synthesis(self, params: dict, on_token: Callable[[str], None]) -> str:
+        """Stream a synthesis request, passing each text delta to on_token."""
+        stream = self._client.chat.completions.create(**params, stream=True)
+        parts = []
+        try:
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                text = chunk.choices[0].delta.content
+                on_token(text)
+                parts.append(text)
+        finally:
+            stream.close()
+
+        return "".join(parts)
+
+    def _cache_key(self, params: dict) -> Optional[str]:
+        """Cache key for a synthesis request, or None when it must not be cached."""
+        if not self.use_cache or params["temperature"] > CACHEABLE_TEMPERATURE:
+            return None
+        return ResponseCache.key(params)
+
+    def _synthesis_request(self, debate_result: DebateResult) -> dict:
+        """Chat completion request for the LLM synthesis of one debate."""
+        verdicts_text, debate_text = _render_debate_text(debate_result, self.compress)
+
+        prompt = f"""ORIGINAL CASE:
 Source Truth: {debate_result.truth}
 Claim: {debate_result.claim}
 
 AGENT VERDICTS:
 {verdicts_text}
-{debate_text}
-
-Based on all agent opinions, synthesize a FINAL VERDICT.
+{debate_text}"""
 
-Consider:
-- Which agents made the strongest arguments?
-- Is there consensus or disagreement?
-- What are the key issues identified?
-
-Respond with JSON:
-{{
-    "verdict": "faithful" | "mutation" | "uncertain",
-    "confidence": <float 0.0-1.0>,
-    "reasoning": "<synthesis of key points and final judgment>",
-    "mutation_type": "<if mutation: 'numerical', 'temporal', 'contextual', 'framing', or null>",
-    "dissenting_opinions": ["<brief dissent if any>"]
-}}"""
-
-        response = self._client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are an impartial judge synthesizing verdicts from multiple fact-checking experts."},
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYNTHESIS_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3,  # Lower temperature for more consistent judgments
-            max_tokens=800
-        )
+            "temperature": 0.3,  # Lower temperature for more consistent judgments
+            # The schema enforces the JSON shape, so no room is spent on stray prose
+            "max_tokens": 700,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "final_verdict", "schema": SYNTHESIS_SCHEMA, "strict": True},
+            },
+        }
+
+    @staticmethod
+    def _parse_synthesis(content: str) -> FinalVerdict:
+        """Parse the judge's structured response into a FinalVerdict."""
+        try:
+            data = json_loads(content)
+            return FinalVerdict(
+                verdict=data["verdict"],
+                confidence=float(data["confidence"]),
+                reasoning=data["reasoning"],
+                dissenting_opinions=data["dissenting_opinions"],
+                mutation_type=data["mutation_type"]
+            )
+        except (KeyError, TypeError, ValueError):
+            # Only a truncated response (max_tokens reached) or a refusal
+            # fails to parse under strict structured output
+            return FinalVerdict(
+                verdict="uncertain",
+                confidence=0.5,
+                reasoning=(content or "")[:500],
+                dissenting_opinions=[],
+                mutation_type=None
+            )
 
-        content = response.choices[0].message.content
+    def _identify_mutation_type(self, debate_result: DebateResult) -> Optional[str]:
+        """Identify mutation type from agent evidence, unless the jury already classified it."""
+        if debate_result.mutation_type:
+            return debate_result.mutation_type
 
-        # Parse response
-        try:
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                data = json.loads(json_match.group())
-                return FinalVerdict(
-                    verdict=data.get("verdict", "uncertain").lower(),
-                    confidence=float(data.get("confidence", 0.5)),
-                    reasoning=data.get("reasoning", "No reasoning provided"),
-                    dissenting_opinions=data.get("dissenting_opinions", []),
-                    mutation_type=data.get("mutation_type")
-                )
-        except (json.JSONDecodeError, KeyError, ValueError):
-            pass
-
-        # Fallback
-        return FinalVerdict(
-            verdict="uncertain",
-            confidence=0.5,
-            reasoning=content[:500],
-            dissenting_opinions=[],
-            mutation_type=None
+        combined = " ".join(
+            [v.reasoning for v in debate_result.initial_verdicts]
+            + [e for v in debate_result.initial_verdicts for e in v.evidence]
         )
 
-    def _identify_mutation_type(self, debate_result: DebateResult) -> Optional[str]:
-        """Identify mutation type from agent evidence."""
-        all_evidence = []
-        all_reasoning = []
-
-        for v in debate_result.initial_verdicts:
-            all_evidence.extend(v.evidence)
-            all_reasoning.append(v.reasoning.lower())
-
-        combined = " ".join(all_reasoning + all_evidence).lower()
-
-        # Simple keyword matching
-        if any(word in combined for word in ["date", "temporal", "time", "when", "as of", "after", "before"]):
-            return "temporal"
-        if any(word in combined for word in ["number", "statistic", "figure", "count", "more than", "less than"]):
-            return "numerical"
-        if any(word in combined for word in ["context", "caveat", "omit", "missing", "qualifier"]):
-            return "contextual"
-        if any(word in combined for word in ["frame", "framing", "implication", "meaning", "interpretation"]):
-            return "framing"
+        # One case-insensitive scan for every category's keywords; only a
+        # top-priority hit can end it early
+        found = set()
+        for match in _MUTATION_KEYWORD_RE.finditer(combined):
+            found.add(match.lastgroup)
+            if match.lastgroup == _MUTATION_PRIORITY[0]:
+                break
+
+        for mutation_type in _MUTATION_PRIORITY:
+            if mutation_type in found:
+                return mutation_type
 
         return "unspecified"
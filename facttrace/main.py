@@ -7,21 +7,19 @@ representations of source facts, or mutations.
 """
 
 import argparse
-import json
+import asyncio
+import functools
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional
 
 from config import MODELS, DEFAULT_MODEL, SETUPS, DEFAULT_SETUP
 from agents import LiteralistAgent, ContextualistAgent, StatisticianAgent
-from debate.protocol import DebateProtocol, SingleAgentBaseline
-from debate.verdict import VerdictSynthesizer
-from debate.crew import (
-    SingleAgentCrewBaseline,
-    AdversarialDebateCrew,
-    JuryPanelCrew,
-    CriticProposerJudgeCrew,
-    IterativeDebateCrew,
-)
+from agents.base_agent import json_loads
+from debate.protocol import DebateProtocol, DebateResult, SingleAgentBaseline
+from debate.verdict import FinalVerdict, VerdictSynthesizer
+from rich.table import Table
 from utils.display import (
     console,
     print_welcome,
@@ -40,12 +38,14 @@ AGENT_CLASSES = {
     "statistician": StatisticianAgent,
 }
 
+# Renders finished cases off the event loop, so rendering never delays
+# other cases' requests; one worker, so each case prints whole
+_PRINTER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="facttrace-print")
+
 
 def load_cases(data_path: Path) -> list[dict]:
     """Load cases from JSON file."""
-    with open(data_path) as f:
-        data = json.load(f)
-    return data["cases"]
+    return json_loads(data_path.read_bytes())["cases"]
 
 
 def parse_args() -> argparse.Namespace:
@@ -61,6 +61,7 @@ Examples:
   python main.py --case 1 --setup crew-jury  Run with CrewAI jury
   python main.py --compare --case 2          Compare all setups on case 2
   python main.py --case 3 --model full       Use GPT-4o for case 3
+  python main.py --case all --batch          Synthesize all verdicts as one Batch API job
 
 Available setups:
   single          - Single agent baseline (no jury)
@@ -101,6 +102,18 @@ Available setups:
         help="Compare all setups on the selected case(s)"
     )
 
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Synthesize all selected cases' verdicts in one OpenAI Batch API job (half price, slow)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the judge, ignoring cached syntheses"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -138,14 +151,29 @@ def create_agents(agent_names: list[str], model: str) -> list:
     return [AGENT_CLASSES[name](model=model) for name in agent_names]
 
 
-def run_single_setup(case: dict, setup_name: str, model_name: str, verbose: bool) -> dict:
-    """Run a single setup on a case and return results."""
+@functools.lru_cache(maxsize=None)
+def get_synthesizer(strategy: str, model: str, use_cache: bool = True) -> VerdictSynthesizer:
+    """Synthesizer shared by every case and setup with the same strategy and model (it keeps no per-case state)."""
+    return VerdictSynthesizer(strategy=strategy, model=model, use_cache=use_cache)
+
+
+def run_single_setup(
+    case: dict,
+    setup_name: str,
+    model_name: str,
+    verbose: bool,
+    use_cache: bool = True,
+    on_token: Optional[Callable[[str], None]] = None
+) -> dict:
+    """Run a single setup on a case and return results; on_token receives the judge's streamed response."""
     setup = SETUPS[setup_name]
     model = MODELS[model_name]
     paradigm = setup.get("paradigm", "baseline")
 
-    # Paradigm-based execution
+    # Paradigm-based execution; CrewAI is imported only by the setups that
+    # use it, since it is slow to import
     if paradigm == "baseline":
+        from debate.crew import SingleAgentCrewBaseline
         crew = SingleAgentCrewBaseline(model=model)
         result = crew.analyze(case["claim"], case["truth"], case["id"])
         return {
@@ -158,6 +186,7 @@ def run_single_setup(case: dict, setup_name: str, model_name: str, verbose: bool
         }
 
     elif paradigm == "adversarial":
+        from debate.crew import AdversarialDebateCrew
         rounds = setup.get("rounds", 2)
         crew = AdversarialDebateCrew(model=model, rounds=rounds)
         result = crew.run_debate(case["claim"], case["truth"], case["id"])
@@ -173,6 +202,7 @@ def run_single_setup(case: dict, setup_name: str, model_name: str, verbose: bool
         }
 
     elif paradigm == "jury":
+        from debate.crew import JuryPanelCrew
         aggregation = setup.get("aggregation", "weighted")
         crew = JuryPanelCrew(model=model, aggregation=aggregation)
         result = crew.run_debate(case["claim"], case["truth"], case["id"])
@@ -188,6 +218,7 @@ def run_single_setup(case: dict, setup_name: str, model_name: str, verbose: bool
         }
 
     elif paradigm == "critic-proposer":
+        from debate.crew import CriticProposerJudgeCrew
         crew = CriticProposerJudgeCrew(model=model)
         result = crew.run_debate(case["claim"], case["truth"], case["id"])
         return {
@@ -202,6 +233,7 @@ def run_single_setup(case: dict, setup_name: str, model_name: str, verbose: bool
         }
 
     elif paradigm == "iterative":
+        from debate.crew import IterativeDebateCrew
         rounds = setup.get("rounds", 10)
         adaptive = setup.get("adaptive_stop", True)
         consensus_type = setup.get("consensus_type", "majority")
@@ -247,24 +279,75 @@ def run_single_setup(case: dict, setup_name: str, model_name: str, verbose: bool
 
             debate_result = protocol.run_debate(case["claim"], case["truth"], case["id"])
 
-            synthesizer = VerdictSynthesizer(
-                strategy=setup["synthesis"],
-                model=model
-            )
+            synthesizer = get_synthesizer(setup["synthesis"], model, use_cache)
 
-            final = synthesizer.synthesize(debate_result)
+            final = synthesizer.synthesize(debate_result, on_token)
+
+            return jury_result(setup_name, len(agents), debate_result, final)
+
+
+def jury_result(setup_name: str, agents_used: int, debate_result: DebateResult, final: FinalVerdict) -> dict:
+    """Result dict for a multi-agent jury run."""
+    return {
+        "setup": setup_name,
+        "verdict": final.verdict,
+        "confidence": final.confidence,
+        "reasoning": final.reasoning,
+        "mutation_type": final.mutation_type,
+        "dissenting": final.dissenting_opinions,
+        "agents_used": agents_used,
+        "debate_result": debate_result,
+        "final_verdict": final,
+    }
+
+
+def run_cases_batch(cases: list[dict], setup_name: str, model_name: str, verbose: bool, use_cache: bool = True) -> list[dict]:
+    """
+    Run many cases with a jury setup, synthesizing every verdict in one Batch API job.
+
+    The debates run concurrently online; the LLM syntheses are submitted
+    together at the discounted batch rate, which can take up to 24h.
+    """
+    setup = SETUPS[setup_name]
+    if setup.get("use_crewai") or "agents" not in setup or "synthesis" not in setup:
+        console.print(f"[red]Error: --batch needs a (non-CrewAI) jury setup; '{setup_name}' is not one.[/red]")
+        sys.exit(1)
+
+    model = MODELS[model_name]
+    agents = create_agents(setup["agents"], model)
+    protocol = DebateProtocol(
+        agents=agents,
+        mode=setup["mode"],
+        max_rounds=setup.get("rounds", 0),
+        parallel=True
+    )
+    synthesizer = get_synthesizer(setup["synthesis"], model, use_cache)
+
+    with console.status(f"[bold green]Agents deliberating on {len(cases)} case(s)..."):
+        debate_results = asyncio.run(protocol.run_debates_async(cases))
+
+    with console.status("[bold green]Waiting for the synthesis batch job (may take a while)..."):
+        finals = synthesizer.synthesize_many(debate_results)
+
+    results = []
+    for case, debate_result, final in zip(cases, debate_results, finals):
+        print_case_header(case["id"], case["name"], case["mutation_type"])
+        print_claim_vs_truth(case["claim"], case["truth"])
+        result = jury_result(setup_name, len(agents), debate_result, final)
+        display_result(result, verbose)
+        results.append(result)
+
+    return results
+
+
+def _print_token(text: str):
+    """Print a streamed text delta as-is (no markup, no newline)."""
+    console.out(text, end="", highlight=False)
 
-            return {
-                "setup": setup_name,
-                "verdict": final.verdict,
-                "confidence": final.confidence,
-                "reasoning": final.reasoning,
-                "mutation_type": final.mutation_type,
-                "dissenting": final.dissenting_opinions,
-                "agents_used": len(agents),
-                "debate_result": debate_result,
-                "final_verdict": final,
-            }
+
+def _truncate(text: str, limit: int, verbose: bool = False) -> str:
+    """Text cut to limit characters (plus an ellipsis), unless verbose."""
+    return text if verbose or len(text) <= limit else text[:limit] + "..."
 
 
 def display_result(result: dict, verbose: bool):
@@ -292,7 +375,7 @@ def display_result(result: dict, verbose: bool):
             print_agent_speech(
                 agent_name=verdict.agent_name,
                 color=agent_colors.get(verdict.agent_name, "white"),
-                message=verdict.reasoning if verbose else verdict.reasoning[:200] + "..." if len(verdict.reasoning) > 200 else verdict.reasoning,
+                message=_truncate(verdict.reasoning, 200, verbose),
                 verdict=verdict.verdict,
                 confidence=verdict.confidence
             )
@@ -313,7 +396,7 @@ def display_result(result: dict, verbose: bool):
         print_agent_speech(
             agent_name="Single Agent",
             color="yellow",
-            message=verdict.reasoning if verbose else verdict.reasoning[:300] + "..." if len(verdict.reasoning) > 300 else verdict.reasoning,
+            message=_truncate(verdict.reasoning, 300, verbose),
             verdict=verdict.verdict,
             confidence=verdict.confidence
         )
@@ -322,13 +405,54 @@ def display_result(result: dict, verbose: bool):
     print_verdict_box(
         verdict=result["verdict"],
         confidence=result["confidence"],
-        reasoning=result["reasoning"][:300] + "..." if len(result["reasoning"]) > 300 else result["reasoning"],
+        reasoning=_truncate(result["reasoning"], 300),
         mutation_type=result.get("mutation_type")
     )
 
 
-def run_case(case: dict, setup_name: str, model_name: str, verbose: bool) -> dict:
-    """Run a single case with the specified setup."""
+async def run_single_setup_async(case: dict, setup_name: str, model_name: str, verbose: bool, use_cache: bool = True) -> dict:
+    """
+    Async variant of run_single_setup().
+
+    The original (non-CrewAI) setups await their requests through the shared
+    request pool; the CrewAI paradigms are blocking, so they run in a thread.
+    """
+    setup = SETUPS[setup_name]
+    if "paradigm" in setup:
+        return await asyncio.to_thread(run_single_setup, case, setup_name, model_name, verbose, use_cache)
+
+    model = MODELS[model_name]
+    if setup["mode"] == "single":
+        baseline = SingleAgentBaseline(model=model)
+        result = await baseline.analyze_async(case["claim"], case["truth"], case["id"])
+
+        verdict = result.initial_verdicts[0]
+        return {
+            "setup": setup_name,
+            "verdict": verdict.verdict,
+            "confidence": verdict.confidence,
+            "reasoning": verdict.reasoning,
+            "agents_used": 1,
+            "debate_result": result,
+        }
+
+    agents = create_agents(setup["agents"], model)
+    protocol = DebateProtocol(
+        agents=agents,
+        mode=setup["mode"],
+        max_rounds=setup.get("rounds", 0),
+        parallel=True
+    )
+    debate_result = await protocol.run_debate_async(case["claim"], case["truth"], case["id"])
+
+    synthesizer = get_synthesizer(setup["synthesis"], model, use_cache)
+    final = await synthesizer.synthesize_async(debate_result)
+
+    return jury_result(setup_name, len(agents), debate_result, final)
+
+
+def print_case_intro(case: dict, setup_name: str):
+    """Print a case's header, claim and the setup about to judge it."""
     setup = SETUPS[setup_name]
     paradigm = setup.get("paradigm", "baseline")
 
@@ -350,16 +474,70 @@ def run_case(case: dict, setup_name: str, model_name: str, verbose: bool) -> dic
     if agents_list:
         console.print(f"[dim]Agents: {', '.join(agents_list)}[/dim]\n")
 
+
+def run_case(case: dict, setup_name: str, model_name: str, verbose: bool, use_cache: bool = True) -> dict:
+    """Run a single case with the specified setup."""
+    print_case_intro(case, setup_name)
+
     # Run the analysis
+    # In verbose mode the judge's response is shown as it is generated
     with console.status("[bold green]Agents deliberating..."):
-        result = run_single_setup(case, setup_name, model_name, verbose)
+        result = run_single_setup(
+            case, setup_name, model_name, verbose, use_cache,
+            on_token=_print_token if verbose else None
+        )
+    if verbose:
+        console.print()
 
     display_result(result, verbose)
 
     return result
 
 
-def compare_setups(case: dict, model_name: str, verbose: bool):
+async def run_case_async(
+    case: dict,
+    setup_name: str,
+    model_name: str,
+    verbose: bool,
+    use_cache: bool = True
+) -> dict:
+    """
+    Async variant of run_case(), for running many cases at once.
+
+    The case is printed in one piece once its result is in, on the
+    _PRINTER thread, so concurrent cases' output never interleaves and the
+    event loop keeps dispatching requests meanwhile.
+    """
+    result = await run_single_setup_async(case, setup_name, model_name, verbose, use_cache)
+
+    await asyncio.get_running_loop().run_in_executor(
+        _PRINTER, _print_case, case, setup_name, result, verbose
+    )
+
+    return result
+
+
+def _print_case(case: dict, setup_name: str, result: dict, verbose: bool):
+    """Print a case's intro and result together."""
+    print_case_intro(case, setup_name)
+    display_result(result, verbose)
+
+
+async def run_cases_async(cases: list[dict], setup_name: str, model_name: str, verbose: bool, use_cache: bool = True) -> list[dict]:
+    """
+    Run independent cases concurrently.
+
+    Every agent and synthesis request goes through the shared request pool,
+    which caps concurrency and paces requests to the provider's rate limits,
+    so all cases can be started at once.
+    """
+    with console.status(f"[bold green]Agents deliberating on {len(cases)} case(s)..."):
+        return await asyncio.gather(*(
+            run_case_async(case, setup_name, model_name, verbose, use_cache) for case in cases
+        ))
+
+
+def compare_setups(case: dict, model_name: str, verbose: bool, use_cache: bool = True):
     """Compare all setups on a single case."""
     print_case_header(case["id"], case["name"], case["mutation_type"])
     print_claim_vs_truth(case["claim"], case["truth"])
@@ -371,7 +549,7 @@ def compare_setups(case: dict, model_name: str, verbose: bool):
         console.rule(f"[bold]{setup_name}[/bold]: {SETUPS[setup_name]['description']}")
 
         with console.status(f"[bold green]Running {setup_name}..."):
-            result = run_single_setup(case, setup_name, model_name, verbose)
+            result = run_single_setup(case, setup_name, model_name, verbose, use_cache)
 
         results.append(result)
 
@@ -383,7 +561,6 @@ def compare_setups(case: dict, model_name: str, verbose: bool):
 
     # Summary table
     console.print("\n[bold]Comparison Summary:[/bold]")
-    from rich.table import Table
     table = Table()
     table.add_column("Setup", style="cyan")
     table.add_column("Verdict", style="bold")
@@ -422,6 +599,7 @@ def main():
     # Load cases
     data_path = Path(__file__).parent / "data" / "cases.json"
     cases = load_cases(data_path)
+    cases_by_id = {c["id"]: c for c in cases}
 
     # Determine which cases to run
     case_ids = get_case_ids(args.case, len(cases))
@@ -434,14 +612,30 @@ def main():
         console.print(f"[dim]Setup: {args.setup}[/dim]")
         console.print(f"[dim]Running {len(case_ids)} case(s)[/dim]\n")
 
+    if args.batch and not args.compare:
+        run_cases_batch(
+            [cases_by_id[case_id] for case_id in case_ids],
+            args.setup, args.model, args.verbose, not args.no_cache
+        )
+        console.print("\n[bold green]Done![/bold green]")
+        return
+
+    if not args.compare and len(case_ids) > 1:
+        asyncio.run(run_cases_async(
+            [cases_by_id[case_id] for case_id in case_ids],
+            args.setup, args.model, args.verbose, not args.no_cache
+        ))
+        console.print("\n[bold green]Done![/bold green]")
+        return
+
     # Run each case
     for case_id in case_ids:
-        case = next(c for c in cases if c["id"] == case_id)
+        case = cases_by_id[case_id]
 
         if args.compare:
-            compare_setups(case, args.model, args.verbose)
+            compare_setups(case, args.model, args.verbose, not args.no_cache)
         else:
-            run_case(case, args.setup, args.model, args.verbose)
+            run_case(case, args.setup, args.model, args.verbose, not args.no_cache)
 
         if case_id != case_ids[-1]:
             console.print("\n" + "=" * 70 + "\n")
@@ -3,28 +3,55 @@
 Run all setups on all cases and save results to a file.
 
 Usage:
-    python run_all_setups.py
+    python run_all_setups.py [--no-cache] [--resume]
 """
 
+import argparse
+import asyncio
 import json
+import os
+import re
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
 
-from config import MODELS, SETUPS, DEFAULT_MODEL
+from config import MODELS, SETUPS, DEFAULT_MODEL, RUN_CACHE_DIR, PERSISTED_REASONING_CHARS
 from agents import LiteralistAgent, ContextualistAgent, StatisticianAgent
+from agents.base_agent import AgentVerdict, json_dumps, json_loads
+from agents.response_cache import ResponseCache
 from debate.protocol import DebateProtocol, SingleAgentBaseline
 from debate.verdict import VerdictSynthesizer
-from debate.crew import FactCheckCrew, SingleAgentCrewBaseline
+from debate.crew import CrewDebateResult, FactCheckCrew
 
 console = Console()
 
 # Configuration
 MODEL_NAME = DEFAULT_MODEL
-OUTPUT_FILE = "results.json"
+OUTPUT_FILE = "results.jsonl"
+METADATA_FILE = "results_metadata.json"
+# Results written between fsyncs: bounds what a power loss can take
+# without paying a disk sync per result
+FSYNC_EVERY = 10
+# Cases per arun_setup_batch call: large enough for each debate round to go
+# out as one wave of requests, small enough that results reach the file
+# (and the resume point advances) steadily during a long run
+BATCH_CHUNK_SIZE = 8
+
+# Summary table color for each verdict
+VERDICT_STYLES = {
+    "faithful": "green",
+    "mutation": "red",
+    "uncertain": "yellow",
+    "error": "magenta",
+}
+
+# Last sentence boundary in a cut-off piece of reasoning
+_LAST_SENTENCE_END_RE = re.compile(r".*[.!?](?=\s)", re.DOTALL)
 
 AGENT_CLASSES = {
     "literalist": LiteralistAgent,
@@ -35,9 +62,7 @@ AGENT_CLASSES = {
 
 def load_cases(data_path: Path) -> list[dict]:
     """Load cases from JSON file."""
-    with open(data_path) as f:
-        data = json.load(f)
-    return data["cases"]
+    return json_loads(data_path.read_bytes())["cases"]
 
 
 def create_agents(agent_names: list[str], model: str) -> list:
@@ -45,159 +70,448 @@ def create_agents(agent_names: list[str], model: str) -> list:
     return [AGENT_CLASSES[name](model=model) for name in agent_names]
 
 
+def create_crew(setup: dict, model: str) -> FactCheckCrew:
+    """Create the CrewAI jury for a use_crewai setup, honouring its round budget."""
+    if "rounds" in setup:
+        return FactCheckCrew(model=model, max_rounds=setup["rounds"])
+    return FactCheckCrew(model=model)
+
+
+def _shorten_reasoning(reasoning: str, limit: int = PERSISTED_REASONING_CHARS) -> str:
+    """
+    Reasoning cut to its whole sentences within limit characters.
+
+    Long multi-round debates otherwise dominate the size of the results
+    file. Falls back to a hard cut when the first sentence alone is over
+    the limit; a limit of 0 disables shortening.
+    """
+    if not limit or len(reasoning) <= limit:
+        return reasoning
+    head = reasoning[:limit + 1]
+    match = _LAST_SENTENCE_END_RE.match(head)
+    return (match.group(0) if match else reasoning[:limit]).rstrip() + " [...]"
+
+
+def _single_agent_record(
+    setup_name: str,
+    start: float,
+    verdict: str,
+    confidence: float,
+    reasoning: str,
+    mutation_type: Optional[str]
+) -> dict:
+    """Result record for a single-agent setup."""
+    return {
+        "setup": setup_name,
+        "verdict": verdict,
+        "confidence": confidence,
+        "reasoning": reasoning,
+        "mutation_type": mutation_type,
+        "agents_used": 1,
+        "duration_seconds": time.perf_counter() - start,
+        "error": None,
+    }
+
+
+def _jury_record(
+    setup_name: str,
+    start: float,
+    verdict: str,
+    confidence: float,
+    reasoning: str,
+    mutation_type: Optional[str],
+    dissenting: list[str],
+    initial_verdicts: list[AgentVerdict],
+    agents_used: int,
+    rounds_run: int,
+    rounds_budgeted: int
+) -> dict:
+    """
+    Result record for a multi-agent setup, including each agent's initial verdict.
+
+    rounds_run can fall short of rounds_budgeted when the agents reached
+    consensus early, which keeps cost comparisons across setups fair.
+    """
+    return {
+        "setup": setup_name,
+        "verdict": verdict,
+        "confidence": confidence,
+        "reasoning": reasoning,
+        "mutation_type": mutation_type,
+        "dissenting": dissenting,
+        "agents_used": agents_used,
+        "rounds_run": rounds_run,
+        "rounds_budgeted": rounds_budgeted,
+        "individual_verdicts": [
+            {
+                "agent": v.agent_name,
+                "verdict": v.verdict,
+                "confidence": v.confidence,
+                "reasoning": _shorten_reasoning(v.reasoning),
+                "reasoning_chars": len(v.reasoning),
+            }
+            for v in initial_verdicts
+        ],
+        "duration_seconds": time.perf_counter() - start,
+        "error": None,
+    }
+
+
+def _crew_record(setup_name: str, start: float, crew: FactCheckCrew, result: CrewDebateResult) -> dict:
+    """Result record for a CrewAI jury debate."""
+    return _jury_record(
+        setup_name, start, result.final_verdict, result.final_confidence,
+        result.final_reasoning, result.mutation_type, result.dissenting_opinions,
+        result.initial_verdicts, agents_used=len(crew.agents),
+        rounds_run=len(result.debate_rounds), rounds_budgeted=crew.max_rounds
+    )
+
+
+def _error_record(setup_name: str, start: float, error: Exception) -> dict:
+    """Result record for a setup that raised."""
+    return {
+        "setup": setup_name,
+        "verdict": "error",
+        "confidence": 0.0,
+        "reasoning": str(error),
+        "mutation_type": None,
+        "agents_used": 0,
+        "duration_seconds": time.perf_counter() - start,
+        "error": str(error),
+    }
+
+
 def run_setup(case: dict, setup_name: str, model: str) -> dict:
     """Run a single setup on a case and return results."""
     setup = SETUPS[setup_name]
     use_crewai = setup.get("use_crewai", False)
 
-    start_time = datetime.now()
+    # Monotonic, so durations are immune to wall-clock adjustments
+    start = time.perf_counter()
+
+    try:
+        if setup["mode"] == "single":
+            baseline = SingleAgentBaseline(model=model)
+            result = baseline.analyze(case["claim"], case["truth"], case["id"])
+            verdict = result.initial_verdicts[0]
+            return _single_agent_record(
+                setup_name, start, verdict.verdict, verdict.confidence, verdict.reasoning, None
+            )
+        elif use_crewai:
+            crew = create_crew(setup, model)
+            result = crew.run_debate(case["claim"], case["truth"], case["id"])
+            return _crew_record(setup_name, start, crew, result)
+        else:
+            agents = create_agents(setup["agents"], model)
+            protocol = DebateProtocol(
+                agents=agents,
+                mode=setup["mode"],
+                max_rounds=setup.get("rounds", 0),
+                parallel=True
+            )
+            debate_result = protocol.run_debate(case["claim"], case["truth"], case["id"])
+
+            synthesizer = VerdictSynthesizer(strategy=setup["synthesis"], model=model)
+            final = synthesizer.synthesize(debate_result)
+            return _jury_record(
+                setup_name, start, final.verdict, final.confidence, final.reasoning,
+                final.mutation_type, final.dissenting_opinions, debate_result.initial_verdicts,
+                agents_used=len(agents), rounds_run=len(debate_result.debate_rounds),
+                rounds_budgeted=protocol.max_rounds
+            )
+    except Exception as e:
+        return _error_record(setup_name, start, e)
+
+
+async def arun_setup(case: dict, setup_name: str, model: str) -> dict:
+    """
+    Async variant of run_setup().
+
+    Agent, baseline, debater and synthesis requests all go through the
+    shared request pool.
+    """
+    setup = SETUPS[setup_name]
+    use_crewai = setup.get("use_crewai", False)
+
+    start = time.perf_counter()
+
+    try:
+        if setup["mode"] == "single":
+            baseline = SingleAgentBaseline(model=model)
+            result = await baseline.analyze_async(case["claim"], case["truth"], case["id"])
+            verdict = result.initial_verdicts[0]
+            return _single_agent_record(
+                setup_name, start, verdict.verdict, verdict.confidence, verdict.reasoning, None
+            )
+        elif use_crewai:
+            crew = create_crew(setup, model)
+            result = await crew.run_debate_async(case["claim"], case["truth"], case["id"])
+            return _crew_record(setup_name, start, crew, result)
+        else:
+            agents = create_agents(setup["agents"], model)
+            protocol = DebateProtocol(
+                agents=agents,
+                mode=setup["mode"],
+                max_rounds=setup.get("rounds", 0),
+                parallel=True
+            )
+            debate_result = await protocol.run_debate_async(case["claim"], case["truth"], case["id"])
+
+            synthesizer = VerdictSynthesizer(strategy=setup["synthesis"], model=model)
+            final = await synthesizer.synthesize_async(debate_result)
+            return _jury_record(
+                setup_name, start, final.verdict, final.confidence, final.reasoning,
+                final.mutation_type, final.dissenting_opinions, debate_result.initial_verdicts,
+                agents_used=len(agents), rounds_run=len(debate_result.debate_rounds),
+                rounds_budgeted=protocol.max_rounds
+            )
+    except Exception as e:
+        return _error_record(setup_name, start, e)
+
+
+async def arun_setup_batch(cases: list[dict], setup_name: str, model: str) -> list[dict]:
+    """
+    Run one setup on many cases together.
+
+    Setups with a multi-case path dispatch all cases at once, so every
+    debate round and the judging go out as one wave of requests sharing
+    the same prompt prefixes: the CrewAI jury through
+    FactCheckCrew.run_debate_batch_async, and the original jury through
+    DebateProtocol.run_debates_async plus concurrent syntheses. Other
+    setups run their cases concurrently through arun_setup().
 
+    Each record's duration is the batch's wall time split evenly across
+    its cases. A case that fails gets an error record; the rest of the
+    batch keeps its results.
+
+    Returns:
+        One result record per case, in input order
+    """
+    setup = SETUPS[setup_name]
+    use_crewai = setup.get("use_crewai", False)
+    if not cases:
+        return []
+    if setup["mode"] == "single":
+        return list(await asyncio.gather(*(arun_setup(case, setup_name, model) for case in cases)))
+
+    start = time.perf_counter()
     try:
         if use_crewai:
-            if setup["mode"] == "single":
-                crew_baseline = SingleAgentCrewBaseline(model=model)
-                result = crew_baseline.analyze(case["claim"], case["truth"], case["id"])
-
-                return {
-                    "setup": setup_name,
-                    "verdict": result.final_verdict,
-                    "confidence": result.final_confidence,
-                    "reasoning": result.final_reasoning,
-                    "mutation_type": result.mutation_type,
-                    "agents_used": 1,
-                    "duration_seconds": (datetime.now() - start_time).total_seconds(),
-                    "error": None,
-                }
-            else:
-                crew = FactCheckCrew(model=model, mode=setup["mode"])
-                result = crew.run_debate(case["claim"], case["truth"], case["id"])
-
-                return {
-                    "setup": setup_name,
-                    "verdict": result.final_verdict,
-                    "confidence": result.final_confidence,
-                    "reasoning": result.final_reasoning,
-                    "mutation_type": result.mutation_type,
-                    "dissenting": result.dissenting_opinions,
-                    "agents_used": 3,
-                    "individual_verdicts": [
-                        {
-                            "agent": v.agent_name,
-                            "verdict": v.verdict,
-                            "confidence": v.confidence,
-                            "reasoning": v.reasoning,
-                        }
-                        for v in result.initial_verdicts
-                    ],
-                    "duration_seconds": (datetime.now() - start_time).total_seconds(),
-                    "error": None,
-                }
+            crew = create_crew(setup, model)
+            results = await crew.run_debate_batch_async(
+                [(case["claim"], case["truth"], case["id"]) for case in cases],
+                return_exceptions=True
+            )
+            records = [
+                _error_record(setup_name, start, result) if isinstance(result, Exception)
+                else _crew_record(setup_name, start, crew, result)
+                for result in results
+            ]
         else:
-            if setup["mode"] == "single":
-                baseline = SingleAgentBaseline(model=model)
-                result = baseline.analyze(case["claim"], case["truth"], case["id"])
-                verdict = result.initial_verdicts[0]
-
-                return {
-                    "setup": setup_name,
-                    "verdict": verdict.verdict,
-                    "confidence": verdict.confidence,
-                    "reasoning": verdict.reasoning,
-                    "mutation_type": None,
-                    "agents_used": 1,
-                    "duration_seconds": (datetime.now() - start_time).total_seconds(),
-                    "error": None,
-                }
-            else:
-                agents = create_agents(setup["agents"], model)
-                protocol = DebateProtocol(
-                    agents=agents,
-                    mode=setup["mode"],
-                    max_rounds=setup.get("rounds", 0),
-                    parallel=True
+            agents = create_agents(setup["agents"], model)
+            protocol = DebateProtocol(
+                agents=agents,
+                mode=setup["mode"],
+                max_rounds=setup.get("rounds", 0),
+                parallel=True
+            )
+            debate_results = await protocol.run_debates_async(cases, return_exceptions=True)
+
+            synthesizer = VerdictSynthesizer(strategy=setup["synthesis"], model=model)
+
+            async def synthesize(debate_result):
+                # A failed debate passes its exception straight through
+                if isinstance(debate_result, Exception):
+                    return debate_result
+                return await synthesizer.synthesize_async(debate_result)
+
+            finals = await asyncio.gather(*map(synthesize, debate_results), return_exceptions=True)
+            records = [
+                _error_record(setup_name, start, final) if isinstance(final, Exception)
+                else _jury_record(
+                    setup_name, start, final.verdict, final.confidence, final.reasoning,
+                    final.mutation_type, final.dissenting_opinions, debate_result.initial_verdicts,
+                    agents_used=len(agents), rounds_run=len(debate_result.debate_rounds),
+                    rounds_budgeted=protocol.max_rounds
                 )
-                debate_result = protocol.run_debate(case["claim"], case["truth"], case["id"])
-
-                synthesizer = VerdictSynthesizer(strategy=setup["synthesis"], model=model)
-                final = synthesizer.synthesize(debate_result)
-
-                return {
-                    "setup": setup_name,
-                    "verdict": final.verdict,
-                    "confidence": final.confidence,
-                    "reasoning": final.reasoning,
-                    "mutation_type": final.mutation_type,
-                    "dissenting": final.dissenting_opinions,
-                    "agents_used": len(agents),
-                    "individual_verdicts": [
-                        {
-                            "agent": v.agent_name,
-                            "verdict": v.verdict,
-                            "confidence": v.confidence,
-                            "reasoning": v.reasoning,
-                        }
-                        for v in debate_result.initial_verdicts
-                    ],
-                    "duration_seconds": (datetime.now() - start_time).total_seconds(),
-                    "error": None,
-                }
+                for debate_result, final in zip(debate_results, finals)
+            ]
     except Exception as e:
-        return {
-            "setup": setup_name,
-            "verdict": "error",
-            "confidence": 0.0,
-            "reasoning": str(e),
-            "mutation_type": None,
-            "agents_used": 0,
-            "duration_seconds": (datetime.now() - start_time).total_seconds(),
-            "error": str(e),
-        }
-
-
-def run_all(cases: list[dict], model_name: str) -> dict:
-    """Run all setups on all cases."""
+        records = [_error_record(setup_name, start, e) for _ in cases]
+
+    elapsed = time.perf_counter() - start
+    for record in records:
+        record["duration_seconds"] = elapsed / len(cases)
+    return records
+
+
+def _run_key(case: dict, setup_name: str, model: str) -> str:
+    """Run cache key: the case text plus the model and the setup's full definition."""
+    return ResponseCache.key({
+        "model": model,
+        "case_id": case["id"],
+        "claim": case["claim"],
+        "truth": case["truth"],
+        "setup": setup_name,
+        "setup_config": SETUPS[setup_name],
+    })
+
+
+def _completed_runs(output_path: Path) -> dict[tuple[int, str], dict]:
+    """Successful records already in output_path, keyed by (case_id, setup)."""
+    done = {}
+    if not output_path.exists():
+        return done
+    with open(output_path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json_loads(line)
+            except ValueError:
+                # The last line of a crashed run can be cut short
+                continue
+            if record.get("error") is None:
+                done[(record["case_id"], record["setup"])] = record
+    return done
+
+
+async def run_all(
+    cases: list[dict],
+    model_name: str,
+    output_path: Path,
+    metadata_path: Path,
+    max_in_flight: int = 4,
+    use_cache: bool = True,
+    resume: bool = False
+) -> None:
+    """
+    Run all setups on all cases, concurrently, streaming results to disk.
+
+    Each setup runs its cases in batches of BATCH_CHUNK_SIZE
+    (arun_setup_batch), and the batches of every setup run concurrently,
+    at most max_in_flight at a time; the shared request pool still paces
+    the individual requests to the rate limits.
+
+    Results are appended to output_path as JSON lines and flushed as soon
+    as their batch is in, so a crash keeps every finished batch and
+    nothing is held in memory; the run's metadata and cases go to
+    metadata_path.
+
+    With use_cache, successful results are also kept under RUN_CACHE_DIR,
+    so a re-run skips every (case, setup) whose inputs are unchanged and an
+    interrupted run resumes where it stopped.
+
+    With resume, successful records already in output_path are carried
+    over and their (case, setup) pairs are not run again, even without the
+    cache; errored runs are retried.
+    """
     model = MODELS[model_name]
-    results = {
-        "metadata": {
-            "timestamp": datetime.now().isoformat(),
-            "model": model,
-            "model_name": model_name,
-            "setups": list(SETUPS.keys()),
-            "total_cases": len(cases),
-        },
-        "cases": []
+    metadata = {
+        "timestamp": datetime.now().isoformat(),
+        "model": model,
+        "model_name": model_name,
+        "setups": list(SETUPS.keys()),
+        "total_cases": len(cases),
+        "cache": use_cache,
+        "cases": [
+            {
+                "case_id": case["id"],
+                "case_name": case["name"],
+                "mutation_type": case["mutation_type"],
+                "claim": case["claim"],
+                "truth": case["truth"],
+            }
+            for case in cases
+        ],
     }
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f, indent=2)
 
     total_runs = len(cases) * len(SETUPS)
+    done = _completed_runs(output_path) if resume else {}
+    semaphore = asyncio.Semaphore(max_in_flight)
+    # Disk only: every key is read at most once per run
+    cache = ResponseCache(maxsize=0, directory=RUN_CACHE_DIR) if use_cache else None
 
-    with Progress(
+    with open(output_path, "wb") as out, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TimeRemainingColumn(),
         console=console,
+        # Cached and resumed results land in bursts; redraw at a fixed rate
+        refresh_per_second=4,
     ) as progress:
         task = progress.add_task("Running experiments...", total=total_runs)
-
-        for case in cases:
-            case_result = {
-                "case_id": case["id"],
-                "case_name": case["name"],
-                "mutation_type": case["mutation_type"],
-                "claim": case["claim"],
-                "truth": case["truth"],
-                "setups": []
-            }
-
-            for setup_name in SETUPS:
-                progress.update(task, description=f"Case {case['id']} - {setup_name}")
-
-                setup_result = run_setup(case, setup_name, model)
-                case_result["setups"].append(setup_result)
-
-                progress.advance(task)
-
-            results["cases"].append(case_result)
-
-    return results
+        saved = 0
+
+        def save(case: dict, setup_name: str, setup_result: dict):
+            nonlocal saved
+            # Lines are written from the event loop thread, so they never interleave
+            out.write(json_dumps({"case_id": case["id"], **setup_result}) + b"\n")
+            out.flush()
+            saved += 1
+            if saved % FSYNC_EVERY == 0:
+                os.fsync(out.fileno())
+            progress.update(task, advance=1, description=f"Finished case {case['id']} - {setup_name}")
+
+        async def run_setup_cases(setup_name: str):
+            pending = []
+            for case in cases:
+                previous = done.get((case["id"], setup_name))
+                if previous is not None:
+                    previous = {k: v for k, v in previous.items() if k != "case_id"}
+                    save(case, setup_name, previous)
+                    continue
+                cached = cache.get(_run_key(case, setup_name, model)) if cache else None
+                if cached is None:
+                    pending.append(case)
+                else:
+                    save(case, setup_name, cached)
+
+            async def run_chunk(chunk: list[dict]):
+                async with semaphore:
+                    chunk_results = await arun_setup_batch(chunk, setup_name, model)
+
+                for case, setup_result in zip(chunk, chunk_results):
+                    if cache and setup_result["error"] is None:
+                        cache.put(_run_key(case, setup_name, model), setup_result)
+                    save(case, setup_name, setup_result)
+
+            await asyncio.gather(*(
+                run_chunk(pending[i:i + BATCH_CHUNK_SIZE])
+                for i in range(0, len(pending), BATCH_CHUNK_SIZE)
+            ))
+
+        await asyncio.gather(*(run_setup_cases(setup_name) for setup_name in SETUPS))
+        os.fsync(out.fileno())
+
+
+def load_results(output_path: Path, metadata_path: Path) -> dict:
+    """
+    Read streamed results back, grouped by case in the original order.
+
+    Returns:
+        {"metadata": {...}, "cases": [{case fields..., "setups": [...]}]},
+        with each case's setups in SETUPS order
+    """
+    metadata = json_loads(metadata_path.read_bytes())
+    setups_by_case = {case["case_id"]: [] for case in metadata["cases"]}
+    with open(output_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                record = json_loads(line)
+                setups_by_case[record.pop("case_id")].append(record)
+
+    setup_order = {name: i for i, name in enumerate(metadata["setups"])}
+    return {
+        "metadata": {k: v for k, v in metadata.items() if k != "cases"},
+        "cases": [
+            {**case, "setups": sorted(setups_by_case[case["case_id"]], key=lambda r: setup_order[r["setup"]])}
+            for case in metadata["cases"]
+        ],
+    }
 
 
 def print_summary(results: dict):
@@ -216,12 +530,7 @@ def print_summary(results: dict):
         table.add_column("Agents")
 
         for setup in case_data["setups"]:
-            verdict_style = {
-                "faithful": "green",
-                "mutation": "red",
-                "uncertain": "yellow",
-                "error": "magenta"
-            }.get(setup["verdict"], "white")
+            verdict_style = VERDICT_STYLES.get(setup["verdict"], "white")
 
             table.add_row(
                 setup["setup"],
@@ -236,6 +545,19 @@ def print_summary(results: dict):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Run all setups on all cases")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-run every (case, setup), ignoring results cached in {RUN_CACHE_DIR}"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Keep the successful results already in {OUTPUT_FILE} and run only the rest"
+    )
+    args = parser.parse_args()
+
     # Load cases
     data_path = Path(__file__).parent / "data" / "cases.json"
     cases = load_cases(data_path)
@@ -246,31 +568,27 @@ def main():
     console.print(f"Setups: {len(SETUPS)}")
     console.print(f"Output: {OUTPUT_FILE}\n")
 
-    # Run all experiments
-    results = run_all(cases, MODEL_NAME)
-
-    # Save results
+    # Run all experiments; results are saved as they finish
     output_path = Path(OUTPUT_FILE)
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2)
+    metadata_path = Path(METADATA_FILE)
+    asyncio.run(run_all(cases, MODEL_NAME, output_path, metadata_path, use_cache=not args.no_cache,
+                        resume=args.resume))
 
     console.print(f"\n[green]Results saved to {output_path}[/green]")
 
+    results = load_results(output_path, metadata_path)
+
     # Print summary
     print_summary(results)
 
-    # Print quick stats
-    total_runs = sum(len(c["setups"]) for c in results["cases"])
-    total_errors = sum(
-        1 for c in results["cases"]
-        for s in c["setups"]
-        if s["error"]
-    )
-    total_time = sum(
-        s["duration_seconds"]
-        for c in results["cases"]
-        for s in c["setups"]
-    )
+    # Print quick stats, gathered in one pass over the results
+    total_runs = total_errors = 0
+    total_time = 0.0
+    for c in results["cases"]:
+        for s in c["setups"]:
+            total_runs += 1
+            total_errors += bool(s["error"])
+            total_time += s["duration_seconds"]
 
     console.print(f"[bold]Stats:[/bold]")
     console.print(f"  Total runs: {total_runs}")
@@ -9,6 +9,20 @@ from rich import box
 
 console = Console()
 
+# Inline verdict label after an agent's name badge
+_VERDICT_LABELS = {
+    "faithful": "[green]FAITHFUL[/green]",
+    "mutation": "[red]MUTATION[/red]",
+    "uncertain": "[yellow]UNCERTAIN[/yellow]",
+}
+
+# (border style, headline) of the final verdict box; anything else shows as uncertain
+_VERDICT_BOX_STYLES = {
+    "faithful": ("green", "[bold green]FAITHFUL[/bold green]"),
+    "mutation": ("red", "[bold red]MUTATION DETECTED[/bold red]"),
+    "uncertain": ("yellow", "[bold yellow]UNCERTAIN[/bold yellow]"),
+}
+
 
 def print_case_header(case_id: int, case_name: str, mutation_type: str) -> None:
     """Print a styled header for a case."""
@@ -42,11 +56,7 @@ def print_agent_speech(
     # Add verdict indicator if provided
     verdict_text = ""
     if verdict:
-        verdict_emoji = {
-            "faithful": "[green]FAITHFUL[/green]",
-            "mutation": "[red]MUTATION[/red]",
-            "uncertain": "[yellow]UNCERTAIN[/yellow]"
-        }.get(verdict.lower(), verdict)
+        verdict_emoji = _VERDICT_LABELS.get(verdict.lower(), verdict)
         confidence_str = f" ({confidence:.0%})" if confidence else ""
         verdict_text = f" | {verdict_emoji}{confidence_str}"
 
@@ -70,18 +80,7 @@ def print_verdict_box(
 ) -> None:
     """Print the final verdict in a prominent box."""
     # Determine styling based on verdict
-    if verdict.lower() == "faithful":
-        border_style = "green"
-        verdict_display = "[bold green]FAITHFUL[/bold green]"
-        icon = "checkmark"
-    elif verdict.lower() == "mutation":
-        border_style = "red"
-        verdict_display = "[bold red]MUTATION DETECTED[/bold red]"
-        icon = "warning"
-    else:
-        border_style = "yellow"
-        verdict_display = "[bold yellow]UNCERTAIN[/bold yellow]"
-        icon = "question"
+    border_style, verdict_display = _VERDICT_BOX_STYLES.get(verdict.lower(), _VERDICT_BOX_STYLES["uncertain"])
 
     # Build content
     content_lines = [